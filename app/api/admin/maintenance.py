@@ -0,0 +1,26 @@
+"""Database maintenance admin endpoints."""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.database.database import get_maintenance_scheduler
+
+router = APIRouter()
+
+
+@router.get("/maintenance")
+def get_maintenance_status():
+    """Last run of each maintenance job, recent history and current bloat metrics."""
+    return get_maintenance_scheduler().status()
+
+
+@router.post("/maintenance/{job}/run")
+async def run_maintenance_job(job: str):
+    """Run a maintenance job now, within its usual time budget."""
+    scheduler = get_maintenance_scheduler()
+    if job not in scheduler.jobs:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown maintenance job '{job}', expected one of {', '.join(scheduler.jobs)}"
+        )
+    return await run_in_threadpool(scheduler.run_job, job)
@@ -4,10 +4,11 @@ import io
 import csv
 import json
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 import pandas as pd
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
@@ -15,7 +16,8 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 
-from app.core.database.database import get_db
+from app.core.database.database import get_read_db
+from app.core.database.projections import ActivityRecord, activity_records_statement, iter_activity_records
 from app.models.member import Member, Activity, Summary, SocialProfile
 from app.models.schemas import Activity as ActivitySchema, Summary as SummarySchema
 
@@ -32,7 +34,7 @@ def export_data(
     member_id: Optional[int] = Query(None, description="Member ID filter"),
     summary_type: Optional[str] = Query(None, description="Summary type (daily/weekly)"),
     include_inactive: bool = Query(False, description="Include inactive members"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Unified export endpoint that handles all export types and formats."""
     try:
@@ -64,35 +66,45 @@ def export_data(
 
 
 
+def _iter_export_activities(
+    db: Session,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    platform: Optional[str],
+    member_id: Optional[int]
+) -> Iterator[ActivityRecord]:
+    """Stream the activities matching the export filters as lightweight records."""
+    criteria = []
+    if start_date:
+        criteria.append(Activity.created_at >= datetime.strptime(start_date, "%Y-%m-%d"))
+    
+    if end_date:
+        end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        criteria.append(Activity.created_at < end_dt)
+    
+    if platform:
+        criteria.append(SocialProfile.platform == platform)
+    
+    if member_id:
+        criteria.append(Activity.member_id == member_id)
+    
+    stmt = activity_records_statement(*criteria, with_member_name=True).join(
+        SocialProfile, SocialProfile.id == Activity.social_profile_id
+    )
+    return iter_activity_records(db, stmt)
+
+
 @router.get("/activities/csv")
 def export_activities_csv(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     platform: Optional[str] = Query(None, description="Platform filter"),
     member_id: Optional[int] = Query(None, description="Member ID filter"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export activities to CSV format."""
     try:
-        # Build query
-        query = db.query(Activity).join(Member).join(SocialProfile)
-        
-        # Apply filters
-        if start_date:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            query = query.filter(Activity.created_at >= start_dt)
-        
-        if end_date:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-            query = query.filter(Activity.created_at < end_dt)
-        
-        if platform:
-            query = query.filter(SocialProfile.platform == platform)
-        
-        if member_id:
-            query = query.filter(Activity.member_id == member_id)
-        
-        activities = query.all()
+        activities = _iter_export_activities(db, start_date, end_date, platform, member_id)
         
         # Create CSV content
         output = io.StringIO()
@@ -108,7 +120,7 @@ def export_activities_csv(
         for activity in activities:
             writer.writerow([
                 activity.id,
-                activity.member.name if activity.member else "",
+                activity.member_name or "",
                 activity.platform,
                 activity.activity_type or "",
                 activity.title or "",
@@ -139,36 +151,18 @@ def export_activities_excel(
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     platform: Optional[str] = Query(None, description="Platform filter"),
     member_id: Optional[int] = Query(None, description="Member ID filter"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export activities to Excel format."""
     try:
-        # Build query
-        query = db.query(Activity).join(Member).join(SocialProfile)
-        
-        # Apply filters
-        if start_date:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            query = query.filter(Activity.created_at >= start_dt)
-        
-        if end_date:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-            query = query.filter(Activity.created_at < end_dt)
-        
-        if platform:
-            query = query.filter(SocialProfile.platform == platform)
-        
-        if member_id:
-            query = query.filter(Activity.member_id == member_id)
-        
-        activities = query.all()
+        activities = _iter_export_activities(db, start_date, end_date, platform, member_id)
         
         # Prepare data for pandas
         data = []
         for activity in activities:
             data.append({
                 "ID": activity.id,
-                "Member": activity.member.name if activity.member else "",
+                "Member": activity.member_name or "",
                 "Platform": activity.platform,
                 "Activity Type": activity.activity_type or "",
                 "Title": activity.title or "",
@@ -205,7 +199,7 @@ def export_summaries_pdf(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     summary_type: Optional[str] = Query(None, description="Summary type (daily/weekly)"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export summaries to PDF format."""
     try:
@@ -314,7 +308,7 @@ def export_summaries_json_endpoint(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     summary_type: Optional[str] = Query(None, description="Summary type (daily/weekly)"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export summaries to JSON format."""
     return export_summaries_json(start_date, end_date, summary_type, db)
@@ -323,11 +317,11 @@ def export_summaries_json_endpoint(
 @router.get("/members/json")
 def export_members_json(
     include_inactive: bool = Query(False, description="Include inactive members"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export members to JSON format."""
     try:
-        query = db.query(Member)
+        query = db.query(Member).options(selectinload(Member.social_profiles))
         if not include_inactive:
             query = query.filter(Member.is_active == True)
         
@@ -374,7 +368,7 @@ def export_members_json(
 @router.get("/members/csv")
 def export_members_csv_endpoint(
     include_inactive: bool = Query(False, description="Include inactive members"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export members to CSV format."""
     return export_members_csv(include_inactive, db)
@@ -382,14 +376,14 @@ def export_members_csv_endpoint(
 
 @router.get("/dashboard/stats")
 def export_dashboard_stats(
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export dashboard statistics."""
     try:
-        from app.api.v1.monitoring import get_monitoring_stats
+        from app.api.v1.monitoring import get_dashboard_stats
         
         # Get stats
-        stats = get_monitoring_stats(db)
+        stats = jsonable_encoder(get_dashboard_stats(db))
         
         # Add export timestamp
         stats["exported_at"] = datetime.now().isoformat()
@@ -410,7 +404,7 @@ def export_dashboard_stats(
 
 @router.get("/stats/csv")
 def export_stats_csv_endpoint(
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Export dashboard statistics to CSV format."""
     return export_stats_csv(db)
@@ -422,7 +416,7 @@ def export_members_csv(
 ):
     """Export members to CSV format."""
     try:
-        query = db.query(Member)
+        query = db.query(Member).options(selectinload(Member.social_profiles))
         if not include_inactive:
             query = query.filter(Member.is_active == True)
         
@@ -524,10 +518,10 @@ def export_stats_csv(
 ):
     """Export dashboard statistics to CSV format."""
     try:
-        from app.api.v1.monitoring import get_monitoring_stats
+        from app.api.v1.monitoring import get_dashboard_stats
         
         # Get stats
-        stats = get_monitoring_stats(db)
+        stats = get_dashboard_stats(db)
         
         # Create CSV content
         output = io.StringIO()
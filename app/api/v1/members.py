@@ -1,15 +1,21 @@
 """Member management API endpoints."""
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.database.database import get_db
+from app.core.database.database import get_async_db, get_db, get_read_db
 from app.models.member import Member, SocialProfile, Activity
 from app.models.schemas import (
     MemberCreate, MemberUpdate, Member as MemberSchema,
     MemberWithProfiles, SocialProfileCreate, SocialProfileUpdate,
     SocialProfile as SocialProfileSchema
 )
+from app.services.imports.member_import import (
+    FORMATS, InvalidImportFormat, MemberImporter, detect_format, parse_rows
+)
 
 router = APIRouter()
 
@@ -32,12 +38,48 @@ def create_member(member: MemberCreate, db: Session = Depends(get_db)):
     return db_member
 
 
+@router.post("/import")
+async def import_members(
+    request: Request,
+    format: Optional[str] = Query(None, description="csv or ndjson; defaults to the Content-Type"),
+    batch_size: int = Query(500, ge=1, le=5000, description="Rows validated and written per transaction"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Bulk upsert members (by email) and social profiles (by member and platform).
+
+    The request body is the raw CSV or NDJSON file. CSV columns are
+    ``name,email,position,department,platform,profile_url,username``, one
+    row per member/profile pair; NDJSON lines may instead carry a
+    ``social_profiles`` list. The response is NDJSON: an ``error`` line for
+    each rejected row, a ``progress`` line per batch and a final ``summary``.
+    """
+    fmt = (format or detect_format(request.headers.get("content-type")) or "").lower()
+    try:
+        rows = parse_rows(await request.body(), fmt)
+    except InvalidImportFormat:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Specify the import format ({', '.join(FORMATS)}) via ?format= or Content-Type"
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import file must be UTF-8 encoded"
+        )
+
+    async def generate_events():
+        async for event in MemberImporter(db, batch_size=batch_size).run(rows):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(generate_events(), media_type="application/x-ndjson")
+
+
 @router.get("/", response_model=List[MemberSchema])
 def get_members(
     skip: int = 0, 
     limit: int = 100, 
     active_only: bool = True,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get list of team members."""
     query = db.query(Member)
@@ -49,7 +91,7 @@ def get_members(
 
 
 @router.get("/{member_id}", response_model=MemberWithProfiles)
-def get_member(member_id: int, db: Session = Depends(get_db)):
+def get_member(member_id: int, db: Session = Depends(get_read_db)):
     """Get a specific team member with their social profiles."""
     member = db.query(Member).filter(Member.id == member_id).first()
     if not member:
@@ -167,7 +209,7 @@ def create_social_profile(
 
 
 @router.get("/{member_id}/social-profiles", response_model=List[SocialProfileSchema])
-def get_member_social_profiles(member_id: int, db: Session = Depends(get_db)):
+def get_member_social_profiles(member_id: int, db: Session = Depends(get_read_db)):
     """Get all social profiles for a team member."""
     # Verify member exists
     member = db.query(Member).filter(Member.id == member_id).first()
@@ -1,65 +1,213 @@
 """Monitoring and summarization API endpoints."""
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import AsyncIterator, Callable, List, Dict, Any, Literal, Optional, Set
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Request
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from app.core.database.database import get_db
-from app.models.member import Member, Activity, Summary
-from app.models.schemas import Activity as ActivitySchema, Summary as SummarySchema, DashboardStats, MonitoringResult, Member as MemberSchema
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, noload
+from app.core.config.settings import settings
+from app.core.database.database import AsyncSessionLocal, get_async_db, get_async_read_db, get_read_db
+from app.core.database.projections import dashboard_counts_statement
+from app.models.member import Activity, Summary
+from app.models.schemas import Activity as ActivitySchema, Summary as SummarySchema, DashboardStats, MonitoringResult, Member as MemberSchema, ActivitySearchResponse, ActivityListItem, SummaryListItem
 from app.services.monitors.monitor_manager import MonitorManager
-from app.services.summarizers.llm_summarizer import LLMSummarizer
+from app.services.processing.activity_queue import ActivityQueue, activity_pipeline
+from app.services.search.activity_search import ActivitySearch, InvalidSearchQuery
+from app.services.summarizers.llm_backend import get_llm_backend
+from app.services.summarizers.llm_scheduler import INTERACTIVE, llm_priority, llm_scheduler
+from app.services.summarizers.llm_summarizer import LANGUAGES, MAP_STAGE, LLMSummarizer
+from app.services.summarizers.rollup import period_bounds, period_title
 import json
 import asyncio
+import logging
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-def prepare_activity_data_for_llm(activities: List[Activity], db: Session) -> List[Dict]:
-    """Prepare activity data for LLM summarization."""
-    # Group activities by member
-    activities_by_member = {}
-    for activity in activities:
-        member_id = activity.member_id
-        if member_id not in activities_by_member:
-            activities_by_member[member_id] = []
-        activities_by_member[member_id].append(activity)
+# How often a streaming response checks whether its client is still connected
+DISCONNECT_POLL_SECONDS = 0.5
+
+# Generations finishing in the background after their client left
+_background_streams: Set[asyncio.Task] = set()
+
+LANGUAGE_LABELS = {"chinese": "中文", "english": "英文"}
+
+_STREAM_END = object()
+
+
+def sse_response(
+    request: Request,
+    make_events: Callable[[AsyncSession], AsyncIterator[str]],
+    on_disconnect: Optional[str] = None
+) -> StreamingResponse:
+    """Stream the SSE events of ``make_events(session)`` with disconnect handling.
+    
+    The events are produced in a separate task with its own database session
+    and handed to the response through a bounded queue, so a slow client
+    pauses generation instead of buffering it. If the client disconnects,
+    the generation is cancelled (closing the upstream LLM requests), or with
+    ``on_disconnect="finish"`` it runs to completion in the background,
+    saving its summary, while its events are dropped.
+    """
+    on_disconnect = on_disconnect or settings.summary_stream_on_disconnect
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.summary_stream_buffer_chunks)
+    detached = False
+    
+    async def produce():
+        try:
+            async with AsyncSessionLocal() as session:
+                async for event in make_events(session):
+                    if not detached:
+                        await queue.put(event)
+        except Exception as e:
+            logger.error(f"Summary stream failed: {e}")
+        if not detached:
+            await queue.put(_STREAM_END)
+    
+    def drain():
+        # Frees the slot a detached producer may be waiting for
+        while not queue.empty():
+            queue.get_nowait()
+    
+    async def events():
+        producer = asyncio.create_task(produce())
+        
+        def detach():
+            nonlocal detached
+            if producer.done() or detached:
+                return
+            detached = True
+            if on_disconnect == "finish":
+                logger.info("Client disconnected; finishing the summary in the background")
+                _background_streams.add(producer)
+                producer.add_done_callback(_background_streams.discard)
+            else:
+                logger.info("Client disconnected; cancelling the summary generation")
+                producer.cancel()
+        
+        async def watch():
+            while not await request.is_disconnected():
+                await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+            detach()
+            drain()
+            queue.put_nowait(_STREAM_END)
+        
+        watcher = asyncio.create_task(watch())
+        try:
+            while True:
+                event = await queue.get()
+                if event is _STREAM_END:
+                    break
+                yield event
+        finally:
+            watcher.cancel()
+            # Also reached when the server closes the response early
+            detach()
+            drain()
     
-    # Prepare activity data for LLM
-    activity_data = []
-    for member_id, member_activities in activities_by_member.items():
-        member = db.query(Member).filter(Member.id == member_id).first()
-        if member:
-            member_activity_summary = {
-                "member_name": member.name,
-                "member_position": member.position,
-                "activities": []
-            }
-            
-            for activity in member_activities:
-                member_activity_summary["activities"].append({
-                    "platform": activity.platform,
-                    "type": activity.activity_type,
-                    "title": activity.title,
-                    "content": activity.content,
-                    "url": activity.url,
-                    "published_at": activity.published_at.isoformat() if activity.published_at else None
-                })
-            
-            activity_data.append(member_activity_summary)
+    return StreamingResponse(
+        events(),
+        media_type="text/plain",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "Content-Type": "text/event-stream"
+        }
+    )
+
+
+async def stream_bilingual_content(
+    summarizer: LLMSummarizer,
+    activities: List[Any],
+    summary_type: str,
+    start_date: datetime,
+    end_date: datetime,
+    contents: Dict[str, str]
+):
+    """Yield SSE events for both languages generated concurrently.
     
-    return activity_data
+    Chunks are tagged with their language and interleave as they arrive;
+    the full text of each language is collected into ``contents``. A
+    summary already in the summary cache is served without LLM calls.
+    """
+    # A user is waiting on this response: serve its LLM calls before batch jobs.
+    # This runs in the stream's own generation task, so the setting stays local to it.
+    llm_priority.set(INTERACTIVE)
+    async for event in content_events(
+        summarizer.stream_summary(activities, summary_type, start_date, end_date), contents
+    ):
+        yield event
+
+
+async def stream_rollup_content(
+    summarizer: LLMSummarizer,
+    summary_type: str,
+    start_date: datetime,
+    end_date: datetime,
+    sources: List[Summary],
+    gap_activities: List[Any],
+    contents: Dict[str, str]
+):
+    """Yield SSE events for a rollup written from stored summaries.
+    
+    Like ``LLMSummarizer.generate_rollup_summary``, the prompt carries the
+    stored shorter-period summaries plus activities on uncovered days, and
+    goes through the summary cache.
+    """
+    # Interactive, as in ``stream_bilingual_content``
+    llm_priority.set(INTERACTIVE)
+    async for event in content_events(
+        summarizer.stream_rollup(summary_type, start_date, end_date, sources, gap_activities), contents
+    ):
+        yield event
+
+
+async def content_events(chunks: AsyncIterator, contents: Dict[str, str]):
+    """SSE events for ``(language, chunk)`` pairs, collecting each language's text into ``contents``."""
+    started = False
+    finished = 0
+    async for language, chunk in chunks:
+        if language == MAP_STAGE:
+            # 活动较多时先分组汇总，再基于汇总生成报告
+            yield f"data: {json.dumps({'type': 'progress', 'message': '活动较多，正在分组汇总...', 'progress': 25})}\n\n"
+            continue
+        if not started:
+            started = True
+            yield f"data: {json.dumps({'type': 'progress', 'message': '正在同时生成中英文总结...', 'progress': 30})}\n\n"
+            for name in LANGUAGES:
+                contents[name] = ""
+                yield f"data: {json.dumps({'type': 'content_start', 'language': name})}\n\n"
+        if chunk is None:
+            finished += 1
+            yield f"data: {json.dumps({'type': 'content_end', 'language': language})}\n\n"
+            yield f"data: {json.dumps({'type': 'progress', 'message': f'{LANGUAGE_LABELS[language]}总结生成完成', 'progress': 30 + 30 * finished})}\n\n"
+        else:
+            contents[language] += chunk
+            yield f"data: {json.dumps({'type': 'content_chunk', 'language': language, 'content': chunk})}\n\n"
+
+
+async def run_activity_pipeline():
+    """Hand the activities a monitoring run stored to the downstream stages."""
+    async with AsyncSessionLocal() as session:
+        try:
+            await activity_pipeline.run(session)
+        except Exception as e:
+            # The failed batch stays queued for the next run
+            logger.error(f"Activity pipeline failed: {e}")
 
 
 @router.post("/run-monitoring", status_code=status.HTTP_200_OK)
 async def run_monitoring(
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Run monitoring for all social profiles."""
     try:
         monitor_manager = MonitorManager(db)
         result = await monitor_manager.run_scheduled_monitoring()
+        background_tasks.add_task(run_activity_pipeline)
         return result
     except Exception as e:
         raise HTTPException(
@@ -71,12 +219,14 @@ async def run_monitoring(
 @router.post("/monitor-profile/{profile_id}", status_code=status.HTTP_200_OK)
 async def monitor_specific_profile(
     profile_id: int,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Monitor a specific social profile."""
     try:
         monitor_manager = MonitorManager(db)
         activities = await monitor_manager.monitor_specific_profile(profile_id)
+        background_tasks.add_task(run_activity_pipeline)
         return {
             "profile_id": profile_id,
             "new_activities": len(activities),
@@ -99,15 +249,28 @@ def get_monitoring_status():
     }
 
 
+@router.get("/queue")
+async def get_activity_queue(db: AsyncSession = Depends(get_async_read_db)):
+    """Get the depth of the unprocessed-activity queue."""
+    return await ActivityQueue(db).stats()
+
+
+@router.get("/llm")
+async def get_llm_scheduler_stats():
+    """Get LLM request queue depth, rate-limit usage, retries and wait times."""
+    return llm_scheduler.stats()
+
+
 @router.post("/start", status_code=status.HTTP_200_OK)
 async def start_monitoring(
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Start monitoring for all social profiles."""
     try:
         monitor_manager = MonitorManager(db)
         result = await monitor_manager.run_scheduled_monitoring()
+        background_tasks.add_task(run_activity_pipeline)
         return {
             "status": "started",
             "message": "Monitoring started successfully",
@@ -137,43 +300,40 @@ async def stop_monitoring():
         )
 
 
+def build_dashboard_stats(counts, latest_summary: Optional[Summary]) -> DashboardStats:
+    """Assemble dashboard stats from a ``dashboard_counts_statement`` row."""
+    return DashboardStats(
+        total_members=counts.total_members,
+        active_members=counts.active_members,
+        total_activities=counts.total_activities,
+        activities_today=counts.activities_today,
+        activities_this_week=counts.activities_this_week,
+        latest_summary=SummarySchema.from_orm(latest_summary) if latest_summary else None
+    )
+
+
+def get_dashboard_stats(db: Session) -> DashboardStats:
+    """Dashboard stats from a sync session (used by the export endpoints)."""
+    counts = db.execute(dashboard_counts_statement()).one()
+    latest_summary = db.scalar(
+        select(Summary).order_by(Summary.created_at.desc()).limit(1)
+    )
+    return build_dashboard_stats(counts, latest_summary)
+
+
 @router.get("/stats", response_model=DashboardStats)
-def get_monitoring_stats(db: Session = Depends(get_db)):
+async def get_monitoring_stats(db: AsyncSession = Depends(get_async_read_db)):
     """Get monitoring statistics and dashboard data."""
     try:
-        monitor_manager = MonitorManager(db)
-        stats = monitor_manager.get_monitoring_stats()
-        
-        # Get recent activities
-        today = datetime.utcnow().date()
-        start_of_week = today - timedelta(days=today.weekday())
-        
-        activities_today = db.query(Activity).filter(
-            Activity.created_at >= datetime.combine(today, datetime.min.time()),
-            Activity.created_at <= datetime.combine(today, datetime.max.time())
-        ).count()
-        
-        activities_this_week = db.query(Activity).filter(
-            Activity.created_at >= datetime.combine(start_of_week, datetime.min.time())
-        ).count()
-        
-        total_activities = db.query(Activity).count()
+        # All counts in one round trip
+        counts = (await db.execute(dashboard_counts_statement())).one()
         
         # Get latest summary
-        latest_summary = db.query(Summary).order_by(Summary.created_at.desc()).first()
-        
-        # Get actual member counts
-        total_members = db.query(Member).count()
-        active_members = db.query(Member).filter(Member.is_active == True).count()
-        
-        return DashboardStats(
-            total_members=total_members,
-            active_members=active_members,
-            total_activities=total_activities,
-            activities_today=activities_today,
-            activities_this_week=activities_this_week,
-            latest_summary=SummarySchema.from_orm(latest_summary) if latest_summary else None
+        latest_summary = await db.scalar(
+            select(Summary).order_by(Summary.created_at.desc()).limit(1)
         )
+        
+        return build_dashboard_stats(counts, latest_summary)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -181,16 +341,23 @@ def get_monitoring_stats(db: Session = Depends(get_db)):
         )
 
 
-@router.get("/activities", response_model=List[ActivitySchema])
+@router.get("/activities", response_model=List[ActivityListItem])
 def get_activities(
     skip: int = 0,
     limit: int = 50,
     platform: str = None,
     member_id: int = None,
-    db: Session = Depends(get_db)
+    repo: str = Query(None, description="Repository full name (owner/name)"),
+    action: str = Query(None, description="Event action, e.g. opened or closed"),
+    db: Session = Depends(get_read_db)
 ):
-    """Get recent activities with optional filtering."""
-    query = db.query(Activity)
+    """Get recent activities with optional filtering.
+
+    Returns previews only; the full content comes from ``/activities/{id}``.
+    """
+    query = db.query(Activity).options(
+        defer(Activity.stored_content), noload(Activity.content_blob)
+    )
     
     if platform:
         query = query.filter(Activity.platform == platform)
@@ -198,14 +365,81 @@ def get_activities(
     if member_id:
         query = query.filter(Activity.member_id == member_id)
     
+    if repo:
+        query = query.filter(Activity.repo_full_name == repo)
+    
+    if action:
+        query = query.filter(Activity.event_action == action)
+    
     activities = query.order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
     return activities
 
 
+@router.get("/activities/search", response_model=ActivitySearchResponse)
+def search_activities(
+    q: str = Query(..., min_length=1, description="Search text"),
+    platform: Optional[str] = Query(None, description="Platform filter"),
+    member_id: Optional[int] = Query(None, description="Member ID filter"),
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Full-text search over activity titles and content."""
+    try:
+        start_dt = None
+        end_dt = None
+        try:
+            if start_date:
+                start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+            if end_date:
+                end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid date format. Use YYYY-MM-DD"
+            )
+        
+        return ActivitySearch(db).search(
+            q,
+            platform=platform,
+            member_id=member_id,
+            start_date=start_dt,
+            end_date=end_dt,
+            limit=limit,
+            cursor=cursor
+        )
+    except HTTPException:
+        raise
+    except InvalidSearchQuery as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Search failed: {str(e)}"
+        )
+
+
+@router.get("/activities/{activity_id}", response_model=ActivitySchema)
+def get_activity(activity_id: int, db: Session = Depends(get_read_db)):
+    """Get a single activity with its full content."""
+    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    if not activity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Activity not found"
+        )
+    return activity
+
+
 @router.post("/generate-daily-summary", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
 async def generate_daily_summary(
     date: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate daily activity summary."""
     try:
@@ -247,14 +481,14 @@ async def generate_daily_summary(
 
 @router.post("/generate-daily-summary-stream")
 async def generate_daily_summary_stream(
+    request: Request,
     date: str = None,
-    db: Session = Depends(get_db)
+    on_disconnect: Optional[Literal["cancel", "finish"]] = None
 ):
     """Generate daily activity summary with streaming response."""
     try:
-        summarizer = LLMSummarizer(db)
-        
-        if not summarizer.can_summarize():
+        # The stream opens its own session; nothing else needs one up front
+        if get_llm_backend() is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="LLM summarization not available. Please configure OpenAI API key."
@@ -270,7 +504,8 @@ async def generate_daily_summary_stream(
                     detail="Invalid date format. Use YYYY-MM-DD"
                 )
         
-        async def generate_stream():
+        async def generate_stream(session: AsyncSession):
+            summarizer = LLMSummarizer(session)
             try:
                 # 发送开始信号
                 yield f"data: {json.dumps({'type': 'start', 'message': '开始生成每日总结...'})}\n\n"
@@ -284,7 +519,7 @@ async def generate_daily_summary_stream(
                 start_date = datetime.combine(final_target_date, datetime.min.time())
                 end_date = datetime.combine(final_target_date, datetime.max.time())
                 
-                activities = summarizer._get_activities_in_range(start_date, end_date)
+                activities = await summarizer._get_activities_in_range(start_date, end_date)
                 
                 if not activities:
                     yield f"data: {json.dumps({'type': 'error', 'message': '未找到指定日期的活动数据'})}\n\n"
@@ -292,45 +527,18 @@ async def generate_daily_summary_stream(
                 
                 yield f"data: {json.dumps({'type': 'progress', 'message': f'找到 {len(activities)} 个活动', 'progress': 20})}\n\n"
                 
-                # 生成中文内容
-                yield f"data: {json.dumps({'type': 'progress', 'message': '正在生成中文总结...', 'progress': 30})}\n\n"
-                yield f"data: {json.dumps({'type': 'content_start', 'language': 'chinese'})}\n\n"
-                
-                activity_data = prepare_activity_data_for_llm(activities, db)
-                
-                # 使用生成器来获取流式内容
-                chinese_content = ""
-                async for chunk in summarizer._generate_language_content_stream_generator(
-                    activity_data, "daily", start_date, end_date, "chinese"
+                # 同时生成中英文内容
+                contents = {}
+                async for event in stream_bilingual_content(
+                    summarizer, activities, "daily", start_date, end_date, contents
                 ):
-                    chinese_content += chunk
-                    yield f"data: {json.dumps({'type': 'content_chunk', 'language': 'chinese', 'content': chunk})}\n\n"
-                
-                if not chinese_content:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '中文总结生成失败'})}\n\n"
-                    return
+                    yield event
+                chinese_content, english_content = contents["chinese"], contents["english"]
                 
-                yield f"data: {json.dumps({'type': 'content_end', 'language': 'chinese'})}\n\n"
-                yield f"data: {json.dumps({'type': 'progress', 'message': '中文总结生成完成', 'progress': 60})}\n\n"
-                
-                # 生成英文内容
-                yield f"data: {json.dumps({'type': 'progress', 'message': '正在生成英文总结...', 'progress': 70})}\n\n"
-                yield f"data: {json.dumps({'type': 'content_start', 'language': 'english'})}\n\n"
-                
-                # 使用生成器来获取流式内容
-                english_content = ""
-                async for chunk in summarizer._generate_language_content_stream_generator(
-                    activity_data, "daily", start_date, end_date, "english"
-                ):
-                    english_content += chunk
-                    yield f"data: {json.dumps({'type': 'content_chunk', 'language': 'english', 'content': chunk})}\n\n"
-                
-                if not english_content:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '英文总结生成失败'})}\n\n"
-                    return
-                
-                yield f"data: {json.dumps({'type': 'content_end', 'language': 'english'})}\n\n"
-                yield f"data: {json.dumps({'type': 'progress', 'message': '英文总结生成完成', 'progress': 90})}\n\n"
+                for language in LANGUAGES:
+                    if not contents[language]:
+                        yield f"data: {json.dumps({'type': 'error', 'message': f'{LANGUAGE_LABELS[language]}总结生成失败'})}\n\n"
+                        return
                 
                 # 保存到数据库
                 yield f"data: {json.dumps({'type': 'progress', 'message': '正在保存总结...', 'progress': 95})}\n\n"
@@ -346,9 +554,7 @@ async def generate_daily_summary_stream(
                     activity_count=len(activities)
                 )
                 
-                db.add(summary)
-                db.commit()
-                db.refresh(summary)
+                summary = await summarizer._store_summary(summary)
                 
                 yield f"data: {json.dumps({'type': 'progress', 'message': '总结保存完成', 'progress': 100})}\n\n"
                 
@@ -371,15 +577,7 @@ async def generate_daily_summary_stream(
         
 
         
-        return StreamingResponse(
-            generate_stream(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/event-stream"
-            }
-        )
+        return sse_response(request, generate_stream, on_disconnect)
         
     except HTTPException:
         raise
@@ -393,7 +591,7 @@ async def generate_daily_summary_stream(
 @router.post("/generate-weekly-summary", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
 async def generate_weekly_summary(
     start_date: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate weekly activity summary."""
     try:
@@ -433,16 +631,73 @@ async def generate_weekly_summary(
         )
 
 
+async def _generate_period_summary(summary_type: str, date: Optional[str], db: AsyncSession) -> Summary:
+    """Shared body of the monthly and quarterly summary endpoints."""
+    try:
+        summarizer = LLMSummarizer(db)
+        
+        if not summarizer.can_summarize():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="LLM summarization not available. Please configure OpenAI API key."
+            )
+        
+        target_date = None
+        if date:
+            try:
+                target_date = datetime.strptime(date, "%Y-%m-%d").date()
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid date format. Use YYYY-MM-DD"
+                )
+        
+        summary = await summarizer.generate_rollup_summary(summary_type, target_date or datetime.utcnow().date())
+        
+        if not summary:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No activities found for the specified {summary_type} period"
+            )
+        
+        return summary
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Summary generation failed: {str(e)}"
+        )
+
+
+@router.post("/generate-monthly-summary", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
+async def generate_monthly_summary(
+    date: str = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Generate summary for the calendar month containing ``date`` (default: this month)."""
+    return await _generate_period_summary("monthly", date, db)
+
+
+@router.post("/generate-quarterly-summary", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
+async def generate_quarterly_summary(
+    date: str = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Generate summary for the quarter containing ``date`` (default: this quarter)."""
+    return await _generate_period_summary("quarterly", date, db)
+
+
 @router.post("/generate-weekly-summary-stream")
 async def generate_weekly_summary_stream(
+    request: Request,
     start_date: str = None,
-    db: Session = Depends(get_db)
+    on_disconnect: Optional[Literal["cancel", "finish"]] = None
 ):
     """Generate weekly activity summary with streaming response."""
     try:
-        summarizer = LLMSummarizer(db)
-        
-        if not summarizer.can_summarize():
+        # The stream opens its own session; nothing else needs one up front
+        if get_llm_backend() is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="LLM summarization not available. Please configure OpenAI API key."
@@ -458,7 +713,8 @@ async def generate_weekly_summary_stream(
                     detail="Invalid date format. Use YYYY-MM-DD"
                 )
         
-        async def generate_stream():
+        async def generate_stream(session: AsyncSession):
+            summarizer = LLMSummarizer(session)
             try:
                 # 发送开始信号
                 yield f"data: {json.dumps({'type': 'start', 'message': '开始生成每周总结...'})}\n\n"
@@ -473,83 +729,77 @@ async def generate_weekly_summary_stream(
                     today = datetime.utcnow().date()
                     final_target_start_date = today - timedelta(days=today.weekday())
                 
-                end_date = final_target_start_date + timedelta(days=6)
-                start_datetime = datetime.combine(final_target_start_date, datetime.min.time())
-                end_datetime = datetime.combine(end_date, datetime.max.time())
+                first_day, last_day = period_bounds("weekly", final_target_start_date)
+                start_datetime = datetime.combine(first_day, datetime.min.time())
+                end_datetime = datetime.combine(last_day, datetime.max.time())
                 
-                activities = summarizer._get_activities_in_range(start_datetime, end_datetime)
+                activity_count, member_count = await summarizer._count_activities(start_datetime, end_datetime)
                 
-                if not activities:
+                if not activity_count:
                     yield f"data: {json.dumps({'type': 'error', 'message': '未找到指定周的活动数据'})}\n\n"
                     return
                 
-                yield f"data: {json.dumps({'type': 'progress', 'message': f'找到 {len(activities)} 个活动', 'progress': 20})}\n\n"
-                
-                # 生成中文内容
-                yield f"data: {json.dumps({'type': 'progress', 'message': '正在生成中文总结...', 'progress': 30})}\n\n"
-                
-                activity_data = prepare_activity_data_for_llm(activities, db)
-                
-                chinese_content = await summarizer._generate_language_content_stream(
-                    activity_data, "weekly", start_datetime, end_datetime, "chinese"
-                )
-                
-                if not chinese_content:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '中文总结生成失败'})}\n\n"
-                    return
-                
-                yield f"data: {json.dumps({'type': 'progress', 'message': '中文总结生成完成', 'progress': 60})}\n\n"
-                
-                # 生成英文内容
-                yield f"data: {json.dumps({'type': 'progress', 'message': '正在生成英文总结...', 'progress': 70})}\n\n"
-                
-                english_content = await summarizer._generate_language_content_stream(
-                    activity_data, "weekly", start_datetime, end_datetime, "english"
-                )
-                
-                if not english_content:
-                    yield f"data: {json.dumps({'type': 'error', 'message': '英文总结生成失败'})}\n\n"
-                    return
-                
-                yield f"data: {json.dumps({'type': 'progress', 'message': '英文总结生成完成', 'progress': 90})}\n\n"
+                yield f"data: {json.dumps({'type': 'progress', 'message': f'找到 {activity_count} 个活动', 'progress': 20})}\n\n"
+                
+                sources, gaps = [], [(first_day, last_day)]
+                if settings.summary_rollup_enabled:
+                    sources, gaps = await summarizer._rollup_sources("weekly", first_day, last_day)
+                
+                # 同时生成中英文内容
+                contents = {}
+                if sources:
+                    # 基于已保存的每日总结，仅补充未覆盖日期的活动
+                    gap_activities = await summarizer._gap_activities(gaps)
+                    yield f"data: {json.dumps({'type': 'progress', 'message': f'基于 {len(sources)} 份已有总结生成', 'progress': 25})}\n\n"
+                    async for event in stream_rollup_content(
+                        summarizer, "weekly", start_datetime, end_datetime, sources, gap_activities, contents
+                    ):
+                        yield event
+                else:
+                    activities = await summarizer._get_activities_in_range(start_datetime, end_datetime)
+                    async for event in stream_bilingual_content(
+                        summarizer, activities, "weekly", start_datetime, end_datetime, contents
+                    ):
+                        yield event
+                chinese_content, english_content = contents["chinese"], contents["english"]
+                
+                for language in LANGUAGES:
+                    if not contents[language]:
+                        yield f"data: {json.dumps({'type': 'error', 'message': f'{LANGUAGE_LABELS[language]}总结生成失败'})}\n\n"
+                        return
                 
                 # 保存到数据库
                 yield f"data: {json.dumps({'type': 'progress', 'message': '正在保存总结...', 'progress': 95})}\n\n"
                 
                 summary = Summary(
-                    title=f"Weekly Activity Summary - {final_target_start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+                    title=period_title("weekly", first_day, last_day),
                     content=chinese_content,
                     content_en=english_content,
                     summary_type="weekly",
                     start_date=start_datetime,
                     end_date=end_datetime,
-                    member_count=len(set(activity.member_id for activity in activities)),
-                    activity_count=len(activities)
+                    member_count=member_count,
+                    activity_count=activity_count
                 )
                 
-                db.add(summary)
-                db.commit()
-                db.refresh(summary)
+                summary = await summarizer._store_summary(summary)
                 
                 yield f"data: {json.dumps({'type': 'progress', 'message': '总结保存完成', 'progress': 100})}\n\n"
                 
                 # 发送完成信号和结果
-                yield f"data: {json.dumps({'type': 'complete', 'summary': SummarySchema.from_orm(summary).dict()})}\n\n"
+                summary_dict = SummarySchema.from_orm(summary).dict()
+                # 确保datetime字段被正确序列化
+                for field in ('start_date', 'end_date', 'created_at', 'sent_at'):
+                    if summary_dict.get(field):
+                        summary_dict[field] = summary_dict[field].isoformat()
+                yield f"data: {json.dumps({'type': 'complete', 'summary': summary_dict})}\n\n"
                 
             except Exception as e:
                 yield f"data: {json.dumps({'type': 'error', 'message': f'生成失败: {str(e)}'})}\n\n"
         
 
         
-        return StreamingResponse(
-            generate_stream(),
-            media_type="text/plain",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Content-Type": "text/event-stream"
-            }
-        )
+        return sse_response(request, generate_stream, on_disconnect)
         
     except HTTPException:
         raise
@@ -560,33 +810,28 @@ async def generate_weekly_summary_stream(
         )
 
 
-@router.get("/summaries", response_model=List[SummarySchema])
+@router.get("/summaries", response_model=List[SummaryListItem])
 def get_summaries(
     skip: int = 0,
     limit: int = 20,
     summary_type: str = None,
     language: str = "chinese",  # 添加语言参数，默认为中文
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get summaries with optional filtering and language selection."""
+    """Get summaries with optional filtering and language selection.
+
+    Returns previews only; the full content comes from ``/summaries/{id}``.
+    """
     try:
-        query = db.query(Summary)
+        query = db.query(Summary).options(defer(Summary.content), defer(Summary.content_en))
         
         if summary_type:
             query = query.filter(Summary.summary_type == summary_type)
         
         summaries = query.order_by(Summary.created_at.desc()).offset(skip).limit(limit).all()
         
-        # 根据语言参数返回相应的内容
-        result = []
-        for summary in summaries:
-            summary_dict = SummarySchema.from_orm(summary).dict()
-            if language == "english" and summary.content_en:
-                summary_dict["content"] = summary.content_en
-            # 如果选择英文但没有英文内容，保持中文内容
-            result.append(SummarySchema(**summary_dict))
-        
-        return result
+        # 根据语言参数返回相应的预览，没有英文内容时保持中文
+        return [SummaryListItem.from_summary(summary, language) for summary in summaries]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -598,7 +843,7 @@ def get_summaries(
 def get_summary(
     summary_id: int, 
     language: str = "chinese",  # 添加语言参数，默认为中文
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get a specific summary by ID with language selection."""
     try:
@@ -630,7 +875,7 @@ async def generate_member_summary(
     days: int = 7,
     start_date: str = None,
     end_date: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate summary for a specific member's activities."""
     try:
@@ -6,10 +6,11 @@ from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from app.core.database.database import get_db
+from app.core.database.database import get_async_db
+from app.core.database.projections import ActivityRecord
 from app.models.member import Activity, Summary
 
 router = APIRouter()
@@ -59,7 +60,7 @@ notification_id_counter = 1
 async def get_notifications(
     limit: int = 50,
     unread_only: bool = False,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get notifications."""
     global notifications
@@ -73,7 +74,7 @@ async def get_notifications(
 @router.post("/")
 async def create_notification(
     notification: NotificationCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new notification."""
     global notifications, notification_id_counter
@@ -107,7 +108,7 @@ async def create_notification(
 @router.put("/{notification_id}/read")
 async def mark_notification_read(
     notification_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark a notification as read."""
     global notifications
@@ -121,7 +122,7 @@ async def mark_notification_read(
 
 @router.put("/read-all")
 async def mark_all_notifications_read(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark all notifications as read."""
     global notifications
@@ -134,7 +135,7 @@ async def mark_all_notifications_read(
 @router.delete("/{notification_id}")
 async def delete_notification(
     notification_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a notification."""
     global notifications
@@ -160,11 +161,11 @@ async def websocket_endpoint(websocket: WebSocket):
         manager.disconnect(websocket)
 
 # System notification functions
-async def notify_new_activity(activity: Activity):
+async def notify_new_activity(activity: ActivityRecord):
     """Notify about new activity."""
     notification = NotificationCreate(
         title="新活动",
-        message=f"成员 {activity.member.name if activity.member else 'Unknown'} 在 {activity.platform} 发布了新内容",
+        message=f"成员 {activity.member_name or 'Unknown'} 在 {activity.platform} 发布了新内容",
         type="info",
         data={
             "activity_id": activity.id,
@@ -176,6 +177,11 @@ async def notify_new_activity(activity: Activity):
     # Create notification
     await create_notification(notification, None)
 
+async def notify_new_activities(activities: List[ActivityRecord], db: AsyncSession):
+    """Activity pipeline stage: one notification per newly ingested activity."""
+    for activity in activities:
+        await notify_new_activity(activity)
+
 async def notify_summary_generated(summary: Summary):
     """Notify about generated summary."""
     notification = NotificationCreate(
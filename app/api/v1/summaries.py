@@ -3,25 +3,29 @@
 from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.core.database.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer
+from app.core.database.database import get_async_db, get_db, get_read_db
 from app.models.member import Summary
-from app.models.schemas import Summary as SummarySchema
+from app.models.schemas import Summary as SummarySchema, SummaryListItem
 from app.services.summarizers.llm_summarizer import LLMSummarizer
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[SummarySchema])
+@router.get("/", response_model=List[SummaryListItem])
 def get_summaries(
     skip: int = 0,
     limit: int = 20,
     summary_type: str = None,
     language: str = "chinese",
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get all summaries with optional filtering."""
-    query = db.query(Summary)
+    """Get all summaries with optional filtering.
+
+    Returns previews only; the full content comes from ``/{summary_id}``.
+    """
+    query = db.query(Summary).options(defer(Summary.content), defer(Summary.content_en))
     
     if summary_type:
         query = query.filter(Summary.summary_type == summary_type)
@@ -33,39 +37,43 @@ def get_summaries(
         query = query.filter(Summary.content_en.isnot(None))
     
     summaries = query.order_by(Summary.created_at.desc()).offset(skip).limit(limit).all()
-    return summaries
+    return [SummaryListItem.from_summary(summary, language) for summary in summaries]
 
 
 @router.get("/{summary_id}", response_model=SummarySchema)
 def get_summary(
     summary_id: int,
     language: str = "chinese",
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
-    """Get a specific summary by ID."""
+    """Get a specific summary by ID with its full content."""
     summary = db.query(Summary).filter(Summary.id == summary_id).first()
     if not summary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Summary not found"
         )
-    return summary
+    
+    summary_data = SummarySchema.from_orm(summary)
+    if language == "english" and summary.content_en:
+        summary_data.content = summary.content_en
+    return summary_data
 
 
 @router.post("/", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
 async def create_summary(
     summary_data: dict,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new summary."""
     try:
         summary = Summary(**summary_data)
         db.add(summary)
-        db.commit()
-        db.refresh(summary)
+        await db.commit()
+        await db.refresh(summary)
         return summary
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create summary: {str(e)}"
@@ -75,7 +83,7 @@ async def create_summary(
 @router.post("/generate-daily", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
 async def generate_daily_summary(
     date: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate daily summary."""
     try:
@@ -97,7 +105,7 @@ async def generate_daily_summary(
 @router.post("/generate-weekly", response_model=SummarySchema, status_code=status.HTTP_201_CREATED)
 async def generate_weekly_summary(
     start_date: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Generate weekly summary."""
     try:
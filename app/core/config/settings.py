@@ -1,6 +1,6 @@
 """Application settings and configuration."""
 
-from typing import Optional
+from typing import Dict, Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -13,7 +13,129 @@ class Settings(BaseSettings):
         default="sqlite:///./inspector.db",
         description="Database connection URL"
     )
-    
+    database_replica_url: Optional[str] = Field(
+        default=None,
+        description="Read replica connection URL; read-only endpoints use it when set"
+    )
+    replica_read_your_writes_seconds: float = Field(
+        default=5.0,
+        description="How long a client's reads stay on the primary after it writes"
+    )
+    replica_health_check_seconds: float = Field(
+        default=10.0,
+        description="How often the replica's health is re-checked"
+    )
+
+    # Connection pool
+    db_pool_size: Optional[int] = Field(
+        default=None, description="Pool size override (default depends on the backend)"
+    )
+    db_max_overflow: Optional[int] = Field(
+        default=None, description="Pool overflow override (default depends on the backend)"
+    )
+    db_pool_timeout: int = Field(
+        default=30, description="Seconds to wait for a pooled connection"
+    )
+    db_pool_recycle: int = Field(
+        default=3600, description="Seconds after which pooled connections are recycled"
+    )
+    db_max_connections: int = Field(
+        default=100,
+        description="PostgreSQL connection budget shared by all worker processes"
+    )
+    web_concurrency: int = Field(
+        default=1, description="Number of worker processes serving the API"
+    )
+    sqlite_read_pool_size: int = Field(
+        default=4, description="Reader connections kept alongside the single SQLite writer"
+    )
+    db_echo_pool: bool = Field(
+        default=False, description="Log every pool checkout/checkin (very verbose)"
+    )
+    sqlite_writer_mode: bool = Field(
+        default=False,
+        description="Serialize SQLite writes through one writer connection; reads use read-only connections"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000, description="How long a SQLite connection waits on a locked database"
+    )
+    sqlite_write_batch_size: int = Field(
+        default=100, description="Maximum queued write jobs grouped into one transaction"
+    )
+    sqlite_write_batch_delay_ms: float = Field(
+        default=5.0, description="How long the writer waits to group more queued write jobs"
+    )
+
+    # Activity text deduplication (SQLite)
+    activity_text_dedup: bool = Field(
+        default=False,
+        description="Point new activities at existing shared text blobs instead of storing copies"
+    )
+    activity_text_dedup_min_length: int = Field(
+        default=16, description="Shortest title/content worth storing as a shared blob"
+    )
+
+    # Database maintenance
+    db_maintenance_enabled: bool = Field(
+        default=True, description="Run WAL checkpoints, ANALYZE and VACUUM in the background"
+    )
+    db_maintenance_window: str = Field(
+        default="02:00-05:00",
+        description="Low-traffic window (HH:MM-HH:MM, local time) for ANALYZE and VACUUM"
+    )
+    db_checkpoint_interval_minutes: int = Field(
+        default=60, description="How often the SQLite WAL is checkpointed"
+    )
+    db_checkpoint_budget_seconds: float = Field(
+        default=10.0, description="Time budget for one WAL checkpoint"
+    )
+    db_analyze_budget_seconds: float = Field(
+        default=60.0, description="Time budget for one statistics refresh (ANALYZE)"
+    )
+    db_vacuum_budget_seconds: float = Field(
+        default=300.0, description="Time budget for one VACUUM run"
+    )
+    db_vacuum_min_free_ratio: float = Field(
+        default=0.1,
+        description="Only VACUUM when at least this share of the database is free pages or dead rows"
+    )
+
+    # Activity processing queue
+    activity_queue_batch_size: int = Field(
+        default=200, description="Activities claimed per pipeline batch"
+    )
+    activity_queue_lease_seconds: int = Field(
+        default=300, description="After this long, a claimed but unfinished batch can be claimed again"
+    )
+
+    # Raw payload log
+    raw_log_enabled: bool = Field(default=True, description="Append raw platform responses to the payload log")
+    raw_log_dir: str = Field(default="./raw_log", description="Directory for payload log segments")
+    raw_log_segment_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Start a new segment once the active one reaches this size"
+    )
+    raw_log_compress_level: int = Field(default=6, description="zlib level for payload frames")
+    raw_log_reprocess_workers: int = Field(
+        default=0, description="Worker processes for reprocessing (0 = one per CPU)"
+    )
+
+    # Backups
+    db_backup_dir: str = Field(default="./backups", description="Directory for database snapshots")
+    db_backup_keep: int = Field(default=7, description="Number of snapshots kept after rotation")
+    db_backup_compress: bool = Field(default=True, description="Gzip SQLite snapshots / compress pg_dump output")
+    db_backup_interval_hours: int = Field(
+        default=0, description="Take a scheduled snapshot every N hours (0 disables scheduled backups)"
+    )
+    db_backup_budget_seconds: float = Field(
+        default=1800.0, description="Time budget for one scheduled backup"
+    )
+    db_backup_pages_per_step: int = Field(
+        default=256, description="SQLite pages copied per backup step"
+    )
+    db_backup_step_sleep_ms: float = Field(
+        default=10.0, description="Pause between SQLite backup steps so writers can proceed"
+    )
+
     # API
     api_host: str = Field(default="0.0.0.0", description="API host")
     api_port: int = Field(default=8000, description="API port")
@@ -41,6 +163,63 @@ class Settings(BaseSettings):
     openai_base_url: str = Field(
         default="https://api.openai.com/v1", description="OpenAI API base URL"
     )
+    llm_timeout_seconds: float = Field(default=60.0, description="Read timeout for LLM API calls")
+    llm_max_connections: int = Field(
+        default=20, description="Connection pool size shared by all LLM API calls"
+    )
+    llm_requests_per_minute: int = Field(default=0, description="Provider request limit; 0 disables it")
+    llm_tokens_per_minute: int = Field(
+        default=0, description="Provider token limit (prompt estimate + max_tokens); 0 disables it"
+    )
+    llm_max_retries: int = Field(default=4, description="Retries of rate-limited or failed LLM calls")
+    llm_backoff_base_seconds: float = Field(default=1.0, description="First retry delay, doubled per attempt")
+    llm_backoff_max_seconds: float = Field(default=60.0, description="Longest retry delay")
+    summary_language_strategy: Literal["parallel", "structured", "translate"] = Field(
+        default="parallel",
+        description=(
+            "How bilingual summaries are produced: one call per language (parallel), "
+            "one call returning both as JSON (structured), or Chinese then a translation call (translate)"
+        )
+    )
+    summary_translation_model: Optional[str] = Field(
+        default=None, description="Model for the translate strategy's translation call (default: openai_model)"
+    )
+    summary_cache_enabled: bool = Field(
+        default=True, description="Reuse generated summary text when the activities and prompt are unchanged"
+    )
+    summary_prompt_token_budget: int = Field(
+        default=12000, description="Activity data (tokens) packed into one summary prompt"
+    )
+    summary_prompt_token_budgets: Dict[str, int] = Field(
+        default_factory=dict, description="Per-model overrides of summary_prompt_token_budget, as JSON"
+    )
+    summary_stream_buffer_chunks: int = Field(
+        default=64, description="Chunks buffered between the LLM stream and a slow client before reading pauses"
+    )
+    summary_stream_on_disconnect: Literal["cancel", "finish"] = Field(
+        default="cancel",
+        description="When a streaming client disconnects: cancel the LLM request, or finish and save the summary"
+    )
+    summary_rollup_enabled: bool = Field(
+        default=True,
+        description="Build weekly/monthly/quarterly summaries from stored shorter-period summaries"
+    )
+    summary_map_reduce: Literal["off", "auto", "always"] = Field(
+        default="auto",
+        description="Summarize team windows in map (per group) and reduce stages; auto when packing would drop activities"
+    )
+    summary_map_group_by: Literal["member", "platform"] = Field(
+        default="member", description="How activities are grouped for the map stage"
+    )
+    summary_map_concurrency: int = Field(default=4, description="Map calls in flight at once")
+    summary_map_input_token_budget: int = Field(
+        default=6000, description="Activity data (tokens) per map call; larger groups are split"
+    )
+    summary_map_output_token_budget: int = Field(default=500, description="max_tokens for each map call")
+    summary_reduce_input_token_budget: int = Field(
+        default=8000, description="Notes (tokens) per reduce call; more notes are condensed in extra rounds"
+    )
+    summary_reduce_output_token_budget: int = Field(default=2000, description="max_tokens for the final reduce call")
     
     # Monitoring
     monitoring_time_range_hours: int = Field(
@@ -0,0 +1,289 @@
+"""Online database backups and restores.
+
+SQLite snapshots use the backup API, copying a few pages per step from one
+pinned read snapshot and sleeping between steps, so writers keep committing
+while the copy runs.
+The snapshot is written to a temporary file, checked, optionally gzipped
+and renamed into place; older snapshots beyond ``keep`` are removed.
+Restores go through the same API, so connections held by a running app see
+the restored content instead of a file swapped underneath them.
+
+PostgreSQL uses ``pg_dump --format=custom`` and ``pg_restore``; credentials
+are passed through the environment rather than the command line. A dump
+given a ``timeout`` is killed when it runs out, leaving no snapshot.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.engine import Engine
+
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = "inspector-"
+SQLITE_SUFFIXES = (".db", ".db.gz")
+POSTGRES_SUFFIX = ".dump"
+
+
+class BackupError(RuntimeError):
+    """Raised when a backup or restore cannot be completed."""
+
+
+def _snapshot_name(suffix: str) -> str:
+    return f"{SNAPSHOT_PREFIX}{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}{suffix}"
+
+
+def list_snapshots(backup_dir: str) -> List[Path]:
+    """Snapshots in ``backup_dir``, oldest first."""
+    directory = Path(backup_dir)
+    if not directory.is_dir():
+        return []
+    suffixes = SQLITE_SUFFIXES + (POSTGRES_SUFFIX,)
+    return sorted(
+        path for path in directory.iterdir()
+        if path.name.startswith(SNAPSHOT_PREFIX) and path.name.endswith(suffixes)
+    )
+
+
+def rotate_snapshots(backup_dir: str, keep: int) -> List[str]:
+    """Delete all but the newest ``keep`` snapshots and return the removed paths."""
+    snapshots = list_snapshots(backup_dir)
+    removed = snapshots[:-keep] if keep > 0 else []
+    for path in removed:
+        path.unlink()
+    return [str(path) for path in removed]
+
+
+def _copy_in_steps(
+    source: sqlite3.Connection,
+    target: sqlite3.Connection,
+    pages_per_step: int,
+    step_sleep: float,
+    should_stop: Optional[Callable[[], bool]]
+) -> int:
+    """Run the backup API in small steps and return the copied page count."""
+    def after_step(status, remaining, total):
+        if should_stop and should_stop():
+            raise BackupError("Backup stopped before completion")
+        if remaining:
+            # Give writers a turn between steps
+            time.sleep(step_sleep)
+
+    source.backup(target, pages=pages_per_step, progress=after_step)
+    return target.execute("PRAGMA page_count").fetchone()[0]
+
+
+def _sqlite_database_path(engine: Engine) -> str:
+    database = engine.url.database
+    if not database or database == ":memory:":
+        raise BackupError("Only file-backed SQLite databases can be backed up")
+    return database
+
+
+def backup_sqlite(
+    engine: Engine,
+    backup_dir: str,
+    compress: bool = False,
+    keep: int = 0,
+    pages_per_step: Optional[int] = None,
+    step_sleep: Optional[float] = None,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> Dict[str, Any]:
+    """Take an online snapshot of a SQLite database."""
+    pages_per_step = pages_per_step or settings.db_backup_pages_per_step
+    step_sleep = settings.db_backup_step_sleep_ms / 1000 if step_sleep is None else step_sleep
+    source_path = _sqlite_database_path(engine)
+    os.makedirs(backup_dir, exist_ok=True)
+
+    final_path = os.path.join(backup_dir, _snapshot_name(".db.gz" if compress else ".db"))
+    fd, partial_path = tempfile.mkstemp(suffix=".partial", dir=backup_dir)
+    os.close(fd)
+    try:
+        source = sqlite3.connect(
+            source_path, timeout=settings.sqlite_busy_timeout_ms / 1000, isolation_level=None
+        )
+        target = sqlite3.connect(partial_path)
+        try:
+            # Pin one read snapshot for the whole copy. Otherwise every commit from
+            # another connection restarts the backup; in WAL mode the open read
+            # transaction does not block writers.
+            source.execute("BEGIN")
+            source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            pages = _copy_in_steps(source, target, pages_per_step, step_sleep, should_stop)
+            source.execute("COMMIT")
+            check = target.execute("PRAGMA quick_check").fetchone()[0]
+            if check != "ok":
+                raise BackupError(f"Snapshot failed its integrity check: {check}")
+            # Snapshots are standalone files; don't leave them in WAL mode
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+            source.close()
+
+        raw_bytes = os.path.getsize(partial_path)
+        if compress:
+            with open(partial_path, "rb") as raw, gzip.open(final_path, "wb") as packed:
+                shutil.copyfileobj(raw, packed)
+            os.remove(partial_path)
+        else:
+            os.replace(partial_path, final_path)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    return {
+        "path": final_path,
+        "pages": pages,
+        "database_bytes": raw_bytes,
+        "snapshot_bytes": os.path.getsize(final_path),
+        "compressed": compress,
+        "rotated": rotate_snapshots(backup_dir, keep),
+    }
+
+
+def restore_sqlite(
+    engine: Engine,
+    snapshot_path: str,
+    pages_per_step: Optional[int] = None,
+    step_sleep: Optional[float] = None
+) -> Dict[str, Any]:
+    """Replace a SQLite database's contents with a snapshot."""
+    pages_per_step = pages_per_step or settings.db_backup_pages_per_step
+    step_sleep = settings.db_backup_step_sleep_ms / 1000 if step_sleep is None else step_sleep
+    target_path = _sqlite_database_path(engine)
+    if not os.path.exists(snapshot_path):
+        raise BackupError(f"Snapshot not found: {snapshot_path}")
+
+    unpacked = None
+    if snapshot_path.endswith(".gz"):
+        fd, unpacked = tempfile.mkstemp(suffix=".db")
+        with os.fdopen(fd, "wb") as raw, gzip.open(snapshot_path, "rb") as packed:
+            shutil.copyfileobj(packed, raw)
+    try:
+        source = sqlite3.connect(unpacked or snapshot_path)
+        target = sqlite3.connect(target_path, timeout=settings.sqlite_busy_timeout_ms / 1000)
+        try:
+            check = source.execute("PRAGMA quick_check").fetchone()[0]
+            if check != "ok":
+                raise BackupError(f"Snapshot failed its integrity check: {check}")
+            pages = _copy_in_steps(source, target, pages_per_step, step_sleep, None)
+        finally:
+            target.close()
+            source.close()
+    finally:
+        if unpacked:
+            os.remove(unpacked)
+
+    return {"path": snapshot_path, "pages": pages}
+
+
+def _postgres_command_env(engine: Engine) -> Dict[str, str]:
+    url = engine.url
+    env = dict(os.environ)
+    for variable, value in (
+        ("PGHOST", url.host),
+        ("PGPORT", url.port),
+        ("PGUSER", url.username),
+        ("PGPASSWORD", url.password),
+        ("PGDATABASE", url.database),
+    ):
+        if value is not None:
+            env[variable] = str(value)
+    return env
+
+
+def _run_postgres_tool(command: List[str], engine: Engine, timeout: Optional[float] = None):
+    try:
+        subprocess.run(
+            command, env=_postgres_command_env(engine), check=True, capture_output=True, text=True,
+            timeout=timeout
+        )
+    except FileNotFoundError:
+        raise BackupError(f"{command[0]} is not installed or not on PATH")
+    except subprocess.TimeoutExpired:
+        raise BackupError(f"{command[0]} stopped after {timeout:.0f}s before completion")
+    except subprocess.CalledProcessError as e:
+        raise BackupError(f"{command[0]} failed: {e.stderr.strip()}")
+
+
+def backup_postgres(
+    engine: Engine,
+    backup_dir: str,
+    compress: bool = False,
+    keep: int = 0,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Dump a PostgreSQL database with ``pg_dump`` (MVCC snapshot, no blocking)."""
+    os.makedirs(backup_dir, exist_ok=True)
+    final_path = os.path.join(backup_dir, _snapshot_name(POSTGRES_SUFFIX))
+    partial_path = f"{final_path}.partial"
+    try:
+        _run_postgres_tool(
+            ["pg_dump", "--format=custom", f"--compress={6 if compress else 0}", f"--file={partial_path}"],
+            engine,
+            timeout=timeout
+        )
+        os.replace(partial_path, final_path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return {
+        "path": final_path,
+        "snapshot_bytes": os.path.getsize(final_path),
+        "compressed": compress,
+        "rotated": rotate_snapshots(backup_dir, keep),
+    }
+
+
+def restore_postgres(engine: Engine, snapshot_path: str) -> Dict[str, Any]:
+    """Restore a ``pg_dump`` snapshot, replacing existing objects."""
+    if not os.path.exists(snapshot_path):
+        raise BackupError(f"Snapshot not found: {snapshot_path}")
+    _run_postgres_tool(
+        ["pg_restore", "--clean", "--if-exists", "--no-owner", "--single-transaction",
+         f"--dbname={engine.url.database}", snapshot_path],
+        engine
+    )
+    # Pooled connections may hold prepared statements for the replaced objects
+    engine.dispose()
+    return {"path": snapshot_path}
+
+
+def backup_database(engine: Engine, backup_dir: Optional[str] = None, compress: Optional[bool] = None,
+                    keep: Optional[int] = None, timeout: Optional[float] = None, **options) -> Dict[str, Any]:
+    """Back up the database behind ``engine`` using the backend's online mechanism.
+    
+    A backup still running after ``timeout`` seconds is abandoned with a
+    ``BackupError``.
+    """
+    backup_dir = backup_dir or settings.db_backup_dir
+    compress = settings.db_backup_compress if compress is None else compress
+    keep = settings.db_backup_keep if keep is None else keep
+    if engine.dialect.name == "sqlite":
+        if timeout is not None:
+            expires = time.monotonic() + timeout
+            options["should_stop"] = lambda: time.monotonic() >= expires
+        return backup_sqlite(engine, backup_dir, compress=compress, keep=keep, **options)
+    if engine.dialect.name == "postgresql":
+        return backup_postgres(engine, backup_dir, compress=compress, keep=keep, timeout=timeout)
+    raise BackupError(f"Backups are not supported for {engine.dialect.name}")
+
+
+def restore_database(engine: Engine, snapshot_path: str) -> Dict[str, Any]:
+    """Restore the database behind ``engine`` from a snapshot."""
+    if engine.dialect.name == "sqlite":
+        return restore_sqlite(engine, snapshot_path)
+    if engine.dialect.name == "postgresql":
+        return restore_postgres(engine, snapshot_path)
+    raise BackupError(f"Restores are not supported for {engine.dialect.name}")
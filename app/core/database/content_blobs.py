@@ -0,0 +1,152 @@
+"""Content-addressed storage for repeated activity text.
+
+GitHub titles and commit messages repeat across forks, branches and event
+templates. Repeated ``title``/``content`` values can be folded into the
+``content_blobs`` table, keyed by SHA-256, with activities pointing at the
+blob instead of holding their own copy. ``Activity.title`` and
+``Activity.content`` read through to the blob, so callers are unchanged.
+
+``fold_repeated_activity_text`` converts existing rows and reports the space
+saved. With ``activity_text_dedup`` enabled, new activities whose text is
+already in the blob table point at it on insert. SQLite only: PostgreSQL's
+search vector is generated from the row's own columns.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List
+from sqlalchemy import event, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.config.settings import settings
+from app.models.member import Activity, ContentBlob
+
+logger = logging.getLogger(__name__)
+
+# Activity text columns that can be folded into blobs
+TEXT_FIELDS = ("title", "content")
+
+
+def content_hash(value: str) -> str:
+    """SHA-256 hex digest identifying a piece of text."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def store_blob(conn: Connection, value: str) -> int:
+    """Return the blob id for ``value``, inserting the blob if it is new."""
+    digest = content_hash(value)
+    conn.execute(
+        sqlite_insert(ContentBlob.__table__)
+        .values(hash=digest, text=value, size=len(value.encode("utf-8")))
+        .on_conflict_do_nothing(index_elements=["hash"])
+    )
+    return conn.execute(
+        select(ContentBlob.id).where(ContentBlob.hash == digest)
+    ).scalar_one()
+
+
+def _text_bytes(conn: Connection) -> Dict[str, int]:
+    inline = conn.execute(text(
+        "SELECT coalesce(sum(length(CAST(title AS BLOB))), 0) + "
+        "coalesce(sum(length(CAST(content AS BLOB))), 0) FROM activities"
+    )).scalar()
+    blobs = conn.execute(text(
+        "SELECT count(*), coalesce(sum(length(CAST(text AS BLOB))), 0) FROM content_blobs"
+    )).first()
+    return {"inline_bytes": inline, "blob_count": blobs[0], "blob_bytes": blobs[1]}
+
+
+def fold_repeated_activity_text(
+    engine: Engine,
+    min_occurrences: int = 2,
+    min_length: int = None
+) -> Dict[str, Any]:
+    """Move repeated activity titles and content into shared blobs.
+
+    Text that appears on at least ``min_occurrences`` rows, or that is
+    already in the blob table, is stored once and the rows point at it.
+    Returns row counts and byte totals before and after; the database file
+    only shrinks after the freed pages are vacuumed.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError("Activity text deduplication is only supported on SQLite")
+    if min_length is None:
+        min_length = settings.activity_text_dedup_min_length
+
+    with engine.begin() as conn:
+        before = _text_bytes(conn)
+        rows_updated = {field: 0 for field in TEXT_FIELDS}
+
+        for field in TEXT_FIELDS:
+            repeated = conn.execute(text(
+                f"SELECT {field} FROM activities "
+                f"WHERE {field} IS NOT NULL AND length({field}) >= :min_length "
+                f"GROUP BY {field} "
+                f"HAVING count(*) >= :min_occurrences "
+                f"OR {field} IN (SELECT text FROM content_blobs)"
+            ), {"min_length": min_length, "min_occurrences": min_occurrences}).scalars().all()
+
+            for value in repeated:
+                blob_id = store_blob(conn, value)
+                result = conn.execute(text(
+                    f"UPDATE activities SET {field}_blob_id = :blob_id, {field} = NULL "
+                    f"WHERE {field} = :value"
+                ), {"blob_id": blob_id, "value": value})
+                rows_updated[field] += result.rowcount
+
+        after = _text_bytes(conn)
+        page_size = conn.execute(text("PRAGMA page_size")).scalar()
+        free_pages = conn.execute(text("PRAGMA freelist_count")).scalar()
+
+    saved = before["inline_bytes"] + before["blob_bytes"] - after["inline_bytes"] - after["blob_bytes"]
+    report = {
+        "rows_updated": rows_updated,
+        "blobs_created": after["blob_count"] - before["blob_count"],
+        "text_bytes_before": before["inline_bytes"] + before["blob_bytes"],
+        "text_bytes_after": after["inline_bytes"] + after["blob_bytes"],
+        "bytes_saved": saved,
+        "reclaimable_bytes": free_pages * page_size,
+    }
+    logger.info(f"Folded repeated activity text: {report}")
+    return report
+
+
+def _point_new_activities_at_known_blobs(session: Session, flush_context, instances):
+    """Before flush: link new activities whose text is already a blob."""
+    if not settings.activity_text_dedup:
+        return
+    activities = [obj for obj in session.new if isinstance(obj, Activity)]
+    if not activities:
+        return
+
+    pending: Dict[str, List[tuple]] = {}
+    for activity in activities:
+        for field in TEXT_FIELDS:
+            value = getattr(activity, f"stored_{field}")
+            if value is not None and len(value) >= settings.activity_text_dedup_min_length:
+                pending.setdefault(content_hash(value), []).append((activity, field))
+    if not pending:
+        return
+
+    with session.no_autoflush:
+        blobs = session.scalars(
+            select(ContentBlob).where(ContentBlob.hash.in_(pending.keys()))
+        ).all()
+    for blob in blobs:
+        for activity, field in pending[blob.hash]:
+            setattr(activity, f"{field}_blob", blob)
+            setattr(activity, f"stored_{field}", None)
+
+
+def enable_activity_text_dedup(engine: Engine) -> bool:
+    """Register the insert-time hook when deduplication is enabled."""
+    if not settings.activity_text_dedup:
+        return False
+    if engine.dialect.name != "sqlite":
+        logger.warning("activity_text_dedup is only supported on SQLite; ignoring it")
+        return False
+    if not event.contains(Session, "before_flush", _point_new_activities_at_known_blobs):
+        event.listen(Session, "before_flush", _point_new_activities_at_known_blobs)
+    return True
@@ -1,15 +1,23 @@
 """Database configuration and session management."""
 
+import asyncio
 import logging
+import time
+from fastapi import Request
 from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.exc import SQLAlchemyError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.core.config.settings import settings
+from app.core.database.maintenance import MaintenanceScheduler
+from app.core.database.pool_metrics import InstrumentedQueuePool, instrument_checkouts
+from app.core.database.sqlite_writer import SQLiteWriteQueue, SharedWriterConnection, make_routing_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -17,25 +25,260 @@ logger = logging.getLogger(__name__)
 # Create base class for models
 Base = declarative_base()
 
-# Create database engine with optimized connection pool
-engine = create_engine(
-    settings.database_url,
-    poolclass=QueuePool,
-    pool_size=20,  # 增加连接池大小
-    max_overflow=30,  # 增加最大溢出连接数
-    pool_pre_ping=True,  # 连接前ping检查
-    pool_recycle=3600,  # 1小时后回收连接
-    pool_timeout=30,  # 连接超时时间
-    echo=settings.debug,  # 调试模式下显示SQL
-    echo_pool=settings.debug,  # 调试模式下显示连接池信息
-)
-
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+def _is_sqlite_file(database_url: str) -> bool:
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+def build_pool_options(database_url: str) -> dict:
+    """Choose connection pool settings for the database backend.
+    
+    SQLite allows a single writer at a time, so its pool is one writer
+    connection plus a small read pool with no overflow. For other backends
+    the connection budget is split across worker processes. Explicit
+    ``db_pool_size`` / ``db_max_overflow`` settings always win.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+        pool_size = 1 + settings.sqlite_read_pool_size
+        max_overflow = 0
+    else:
+        per_worker = max(2, settings.db_max_connections // max(1, settings.web_concurrency))
+        pool_size = max(1, per_worker // 2)
+        max_overflow = per_worker - pool_size
+    
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size if settings.db_pool_size is not None else pool_size,
+        "max_overflow": settings.db_max_overflow if settings.db_max_overflow is not None else max_overflow,
+        "pool_pre_ping": True,  # 连接前ping检查
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
+def create_instrumented_engine(database_url: str, **pool_overrides):
+    """Create an engine whose pool reports wait, checkout and saturation metrics."""
+    options = build_pool_options(database_url)
+    options.update(pool_overrides)
+    db_engine = create_engine(
+        database_url,
+        echo=settings.debug,  # 调试模式下显示SQL
+        echo_pool=settings.db_echo_pool,
+        **options
+    )
+    metrics = getattr(db_engine.pool, "metrics", None)
+    if metrics is not None:
+        instrument_checkouts(db_engine, metrics)
+    return db_engine
+
+# Async drivers used for each backend by the async engine
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def to_async_url(database_url: str) -> str:
+    """Rewrite a database URL to use the backend's async driver."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def create_async_db_engine(database_url: str, **pool_overrides):
+    """Create an async engine sized like the sync engine for the same backend."""
+    options = build_pool_options(database_url)
+    options.update(pool_overrides)
+    if options["poolclass"] is InstrumentedQueuePool:
+        # Async engines need SQLAlchemy's asyncio-aware queue pool
+        options.pop("poolclass")
+    return create_async_engine(
+        to_async_url(database_url),
+        echo=settings.debug,
+        **options
+    )
+
+# SQLite writer mode: one dedicated writer connection, separate read-only pool
+sqlite_writer_mode = settings.sqlite_writer_mode and _is_sqlite_file(settings.database_url)
+
+# The sync and async engines both write through this one connection
+shared_writer = None
+
+if sqlite_writer_mode:
+    shared_writer = SharedWriterConnection(
+        make_url(settings.database_url).database,
+        timeout=settings.sqlite_busy_timeout_ms / 1000
+    )
+    engine = create_instrumented_engine(
+        settings.database_url,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        creator=shared_writer.connect
+    )
+    read_engine = create_instrumented_engine(
+        settings.database_url,
+        pool_size=settings.sqlite_read_pool_size,
+        max_overflow=0
+    )
+    SessionLocal = sessionmaker(
+        class_=make_routing_session(engine, read_engine),
+        autocommit=False,
+        autoflush=False
+    )
+else:
+    # Create database engine with a backend-appropriate connection pool
+    engine = create_instrumented_engine(settings.database_url)
+    read_engine = engine
+
+    # Create session factory
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=engine
+    )
+
+_write_queue = None
+
+
+def get_write_queue() -> SQLiteWriteQueue:
+    """Get the shared write queue, starting its writer thread on first use.
+    
+    Jobs submitted here are grouped into shared transactions on the writer
+    connection, which suits many small independent writes.
+    """
+    global _write_queue
+    if _write_queue is None:
+        _write_queue = SQLiteWriteQueue(
+            engine,
+            max_batch=settings.sqlite_write_batch_size,
+            max_delay=settings.sqlite_write_batch_delay_ms / 1000
+        )
+        _write_queue.start()
+    return _write_queue
+
+
+def stop_write_queue():
+    """Drain and stop the shared write queue if it was started."""
+    global _write_queue
+    if _write_queue is not None:
+        _write_queue.stop()
+        _write_queue = None
+
+_maintenance_scheduler = None
+
+
+def get_maintenance_scheduler() -> MaintenanceScheduler:
+    """Get the shared maintenance scheduler (runs on the primary/writer engine)."""
+    global _maintenance_scheduler
+    if _maintenance_scheduler is None:
+        _maintenance_scheduler = MaintenanceScheduler(engine)
+    return _maintenance_scheduler
+
+# Async engine and session factory for async route handlers and services.
+# Writer mode splits them the same way, and the async writer leases the
+# sync engine's writer connection, so a single SQLite writer exists.
+if sqlite_writer_mode:
+    async_engine = create_async_db_engine(
+        settings.database_url,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=False,
+        async_creator=shared_writer.connect_async
+    )
+    shared_writer.attach(engine, async_engine.sync_engine)
+    async_read_engine = create_async_db_engine(
+        settings.database_url,
+        pool_size=settings.sqlite_read_pool_size,
+        max_overflow=0
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        sync_session_class=make_routing_session(async_engine.sync_engine, async_read_engine.sync_engine),
+        autoflush=False,
+        expire_on_commit=False
+    )
+else:
+    async_engine = create_async_db_engine(settings.database_url)
+    async_read_engine = async_engine
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+async def dispose_async_engines():
+    """Close the pooled connections of the async engines."""
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+
+# Optional read replica for read-only endpoints
+replica_engine = None
+ReplicaSessionLocal = None
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+if settings.database_replica_url:
+    replica_engine = create_instrumented_engine(settings.database_replica_url)
+    ReplicaSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=replica_engine
+    )
+    async_replica_engine = create_async_db_engine(settings.database_replica_url)
+    AsyncReplicaSessionLocal = async_sessionmaker(
+        async_replica_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+# Cookie holding the time until which a client's reads stay on the primary
+READ_PIN_COOKIE = "inspector_read_pin"
+
+
+class ReplicaHealth:
+    """Cached replica health so routing doesn't ping on every request."""
+    
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._healthy = True
+        self._checked_at = float("-inf")
+    
+    def is_healthy(self) -> bool:
+        """Return the replica health, re-checking it at most once per interval."""
+        if replica_engine is None:
+            return False
+        
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self._healthy
+        
+        self._checked_at = now
+        try:
+            with replica_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            if not self._healthy:
+                logger.info("Read replica is healthy again")
+            self._healthy = True
+        except Exception as e:
+            logger.warning(f"Read replica health check failed, using primary: {e}")
+            self._healthy = False
+        return self._healthy
+    
+    async def is_healthy_async(self) -> bool:
+        """``is_healthy`` for async callers; the probe runs in a worker thread."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._healthy
+        return await asyncio.to_thread(self.is_healthy)
+    
+    def mark_unhealthy(self):
+        """Route reads to the primary until the next health check."""
+        self._healthy = False
+        self._checked_at = time.monotonic()
+
+
+replica_health = ReplicaHealth(settings.replica_health_check_seconds)
 
 # Database event listeners for monitoring
 @event.listens_for(engine, "connect")
@@ -48,17 +291,23 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor.execute("PRAGMA cache_size=10000")  # 增加缓存大小
         cursor.execute("PRAGMA temp_store=MEMORY")  # 临时表存储在内存
         cursor.execute("PRAGMA mmap_size=268435456")  # 256MB内存映射
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout_ms}")
         cursor.close()
 
-@event.listens_for(engine, "checkout")
-def receive_checkout(dbapi_connection, connection_record, connection_proxy):
-    """Log connection checkout events."""
-    logger.debug(f"Database connection checked out: {connection_record.info}")
+event.listen(async_engine.sync_engine, "connect", set_sqlite_pragma)
+
+def set_sqlite_read_only_pragma(dbapi_connection, connection_record):
+    """Same pragmas as the writer, but refuse writes on reader connections."""
+    set_sqlite_pragma(dbapi_connection, connection_record)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
 
-@event.listens_for(engine, "checkin")
-def receive_checkin(dbapi_connection, connection_record):
-    """Log connection checkin events."""
-    logger.debug(f"Database connection checked in: {connection_record.info}")
+if read_engine is not engine:
+    event.listen(read_engine, "connect", set_sqlite_read_only_pragma)
+
+if async_read_engine is not async_engine:
+    event.listen(async_read_engine.sync_engine, "connect", set_sqlite_read_only_pragma)
 
 def get_db() -> Generator[Session, None, None]:
     """Get database session with error handling."""
@@ -76,6 +325,84 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def _reads_pinned_to_primary(request: Request) -> bool:
+    """Whether the client wrote recently and must read its own writes."""
+    pinned_until = request.cookies.get(READ_PIN_COOKIE)
+    if not pinned_until:
+        return False
+    try:
+        return float(pinned_until) > time.time()
+    except ValueError:
+        return False
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """Get a session for read-only endpoints.
+    
+    Uses the read replica when one is configured and healthy, unless the
+    client wrote within the read-your-writes window; otherwise falls back
+    to the primary.
+    """
+    if (
+        ReplicaSessionLocal is None
+        or _reads_pinned_to_primary(request)
+        or not replica_health.is_healthy()
+    ):
+        yield from get_db()
+        return
+    
+    db = ReplicaSessionLocal()
+    try:
+        yield db
+    except OperationalError as e:
+        logger.error(f"Read replica error: {e}")
+        replica_health.mark_unhealthy()
+        db.rollback()
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session for async route handlers."""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except SQLAlchemyError as e:
+            logger.error(f"Database error: {e}")
+            await db.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            await db.rollback()
+            raise
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of ``get_read_db``."""
+    if (
+        AsyncReplicaSessionLocal is None
+        or _reads_pinned_to_primary(request)
+        or not await replica_health.is_healthy_async()
+    ):
+        async for db in get_async_db():
+            yield db
+        return
+    
+    async with AsyncReplicaSessionLocal() as db:
+        try:
+            yield db
+        except OperationalError as e:
+            logger.error(f"Read replica error: {e}")
+            replica_health.mark_unhealthy()
+            await db.rollback()
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            await db.rollback()
+            raise
+
 @contextmanager
 def get_db_context() -> Generator[Session, None, None]:
     """Context manager for database sessions."""
@@ -94,22 +421,36 @@ def init_db():
     """Initialize database tables."""
     try:
         # Import models to ensure they are registered with Base
-        from app.models.member import Member, Activity, Summary, SocialProfile
+        from app.models.member import Member, Activity, Summary, SocialProfile, ContentBlob, RawPayload, SummaryCacheEntry
         Base.metadata.create_all(bind=engine)
+
+        from app.core.database.migrations import upgrade_schema
+        upgrade_schema(engine, Base.metadata)
+
+        from app.core.database.fulltext import init_fulltext_index
+        init_fulltext_index(engine)
+
+        from app.core.database.content_blobs import enable_activity_text_dedup
+        enable_activity_text_dedup(engine)
         logger.info("Database tables initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
 
-def get_connection_pool_stats():
+def get_connection_pool_stats(db_engine=None):
     """Get connection pool statistics."""
-    pool = engine.pool
-    stats = {
-        "pool_size": pool.size(),
-        "checked_in": pool.checkedin(),
-        "checked_out": pool.checkedout(),
-        "overflow": pool.overflow(),
-    }
+    pool = (db_engine or engine).pool
+    stats = {"pool_class": type(pool).__name__}
+    
+    # StaticPool（内存SQLite）没有这些计数
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "pool_size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        })
     
     # 只有某些连接池类型有invalid属性
     if hasattr(pool, 'invalid'):
@@ -117,16 +458,41 @@ def get_connection_pool_stats():
     
     return stats
 
+def get_pool_metrics() -> dict:
+    """Get pool statistics plus wait-time, checkout and saturation metrics."""
+    result = {}
+    engines = (
+        ("primary", engine),
+        ("reader", read_engine if read_engine is not engine else None),
+        ("replica", replica_engine),
+        ("async_primary", async_engine.sync_engine),
+        ("async_reader", async_read_engine.sync_engine if async_read_engine is not async_engine else None),
+        ("async_replica", async_replica_engine.sync_engine if async_replica_engine else None)
+    )
+    for name, db_engine in engines:
+        if db_engine is None:
+            continue
+        metrics = getattr(db_engine.pool, "metrics", None)
+        result[name] = {
+            "backend": db_engine.dialect.name,
+            "stats": get_connection_pool_stats(db_engine),
+            "metrics": metrics.snapshot() if metrics is not None else None
+        }
+    return result
+
 def health_check() -> dict:
     """Database health check."""
     try:
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
             conn.commit()
-        return {
+        result = {
             "status": "healthy",
             "pool_stats": get_connection_pool_stats()
         }
+        if replica_engine is not None:
+            result["replica"] = "healthy" if replica_health.is_healthy() else "unhealthy"
+        return result
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return {
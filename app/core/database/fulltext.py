@@ -0,0 +1,109 @@
+"""Full-text index setup for activity search.
+
+SQLite uses an external-content FTS5 table kept in sync by triggers. Its
+content comes from a view that resolves text folded into ``content_blobs``.
+PostgreSQL uses a generated ``tsvector`` column with a GIN index.
+"""
+
+import logging
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "activities_fts"
+FTS_CONTENT_VIEW = "activities_text"
+_FTS_TRIGGERS = ("activities_fts_ai", "activities_fts_ad", "activities_fts_au")
+
+
+def _resolved(row: str, field: str) -> str:
+    """SQL for a row's text, reading it from its blob when not stored inline."""
+    return (
+        f"coalesce({row}.{field}, "
+        f"(SELECT text FROM content_blobs WHERE id = {row}.{field}_blob_id))"
+    )
+
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIEW IF NOT EXISTS {FTS_CONTENT_VIEW} AS
+    SELECT a.id AS id, {_resolved("a", "title")} AS title, {_resolved("a", "content")} AS content
+    FROM activities a
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content,
+        content='{FTS_CONTENT_VIEW}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS activities_fts_ai AFTER INSERT ON activities BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, {_resolved("new", "title")}, {_resolved("new", "content")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS activities_fts_ad AFTER DELETE ON activities BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, {_resolved("old", "title")}, {_resolved("old", "content")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS activities_fts_au
+    AFTER UPDATE OF title, content, title_blob_id, content_blob_id ON activities BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, {_resolved("old", "title")}, {_resolved("old", "content")});
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        VALUES (new.id, {_resolved("new", "title")}, {_resolved("new", "content")});
+    END
+    """,
+]
+
+_POSTGRES_DDL = [
+    """
+    ALTER TABLE activities ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_activities_search_vector
+    ON activities USING GIN (search_vector)
+    """,
+]
+
+
+def init_fulltext_index(engine: Engine) -> None:
+    """Create the full-text index for the current backend if it is missing."""
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                existing = conn.execute(
+                    text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE}
+                ).first()
+                exists = existing is not None
+                if exists and FTS_CONTENT_VIEW not in existing.sql:
+                    # Index built on the activities table directly: rebuild it on the view
+                    for trigger in _FTS_TRIGGERS:
+                        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+                    conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+                    exists = False
+                for statement in _SQLITE_DDL:
+                    conn.execute(text(statement))
+                if not exists:
+                    # Index rows that were inserted before the FTS table existed
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+            elif dialect == "postgresql":
+                for statement in _POSTGRES_DDL:
+                    conn.execute(text(statement))
+            else:
+                logger.warning(f"Full-text search is not supported on {dialect}")
+                return
+        logger.info(f"Full-text index ready ({dialect})")
+    except Exception as e:
+        logger.error(f"Failed to initialize full-text index: {e}")
+        raise
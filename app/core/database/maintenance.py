@@ -0,0 +1,400 @@
+"""Background database maintenance.
+
+Replaces running ``scripts/db_sync.py`` by hand. These jobs keep the
+database healthy:
+
+- ``wal_checkpoint``: folds the SQLite WAL back into the main file and
+  truncates it, every ``db_checkpoint_interval_minutes``
+- ``analyze``: refreshes planner statistics, once per maintenance window
+- ``vacuum``: reclaims free pages (SQLite) or dead rows (PostgreSQL), once
+  per maintenance window and only when enough space is wasted
+- ``backup``: online snapshot with rotation, every
+  ``db_backup_interval_hours`` when set (see ``backup.py``)
+
+Each run is bounded by its time budget: SQLite statements are interrupted
+through the progress handler and PostgreSQL statements get a
+``statement_timeout``. Durations, reclaimed space and bloat metrics are
+kept for the admin endpoint.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from app.core.config.settings import settings
+from app.core.database.backup import BackupError, backup_database
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE = 50
+POLL_SECONDS = 60
+
+
+class BudgetExceeded(Exception):
+    """Raised when a maintenance job runs out of time."""
+
+
+def parse_window(window: str) -> Tuple[int, int]:
+    """Parse ``HH:MM-HH:MM`` into start and end minutes after midnight."""
+    try:
+        start, end = window.split("-")
+        minutes = []
+        for value in (start, end):
+            hours, mins = value.strip().split(":")
+            minutes.append(int(hours) * 60 + int(mins))
+    except ValueError:
+        raise ValueError(f"Invalid maintenance window '{window}', expected HH:MM-HH:MM")
+    return minutes[0], minutes[1]
+
+
+def window_start(now: datetime, window: str) -> Optional[datetime]:
+    """Start of the window ``now`` falls in, or None outside the window.
+
+    Windows may wrap past midnight, e.g. ``23:00-02:00``.
+    """
+    start, end = parse_window(window)
+    minute = now.hour * 60 + now.minute
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if start <= end:
+        if start <= minute < end:
+            return midnight + timedelta(minutes=start)
+        return None
+    if minute >= start:
+        return midnight + timedelta(minutes=start)
+    if minute < end:
+        return midnight - timedelta(days=1) + timedelta(minutes=start)
+    return None
+
+
+def _sqlite_path(engine: Engine) -> Optional[str]:
+    database = engine.url.database
+    return database if database and database != ":memory:" else None
+
+
+def _file_size(path: Optional[str]) -> int:
+    return os.path.getsize(path) if path and os.path.exists(path) else 0
+
+
+class _Deadline:
+    """Remaining time for one job."""
+
+    def __init__(self, budget_seconds: float):
+        self.expires = time.monotonic() + budget_seconds
+
+    @property
+    def remaining(self) -> float:
+        return self.expires - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining <= 0
+
+
+def _run_bounded(conn: Connection, statement: str, deadline: _Deadline):
+    """Execute ``statement``, aborting it if the deadline passes."""
+    if deadline.expired:
+        raise BudgetExceeded()
+    if conn.dialect.name == "sqlite":
+        raw = conn.connection.dbapi_connection
+        raw.set_progress_handler(lambda: 1 if deadline.expired else 0, 1000)
+        try:
+            conn.execute(text(statement))
+        except OperationalError as e:
+            if "interrupted" in str(e):
+                raise BudgetExceeded()
+            raise
+        finally:
+            raw.set_progress_handler(None, 0)
+    else:
+        # Maintenance runs in autocommit, where SET LOCAL has no transaction to scope it to
+        conn.execute(text(f"SET statement_timeout = {max(1, int(deadline.remaining * 1000))}"))
+        try:
+            conn.execute(text(statement))
+        except OperationalError as e:
+            if "statement timeout" in str(e):
+                raise BudgetExceeded()
+            raise
+        finally:
+            conn.execute(text("RESET statement_timeout"))
+
+
+def _autocommit(engine: Engine) -> Connection:
+    # VACUUM cannot run inside a transaction
+    return engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+
+def collect_bloat_metrics(engine: Engine) -> Dict[str, Any]:
+    """Database size and wasted space, per table where the backend reports it."""
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            page_size = conn.execute(text("PRAGMA page_size")).scalar()
+            page_count = conn.execute(text("PRAGMA page_count")).scalar()
+            free_pages = conn.execute(text("PRAGMA freelist_count")).scalar()
+            path = _sqlite_path(engine)
+            metrics = {
+                "database_bytes": page_count * page_size,
+                "free_bytes": free_pages * page_size,
+                "free_ratio": round(free_pages / page_count, 4) if page_count else 0.0,
+                "wal_bytes": _file_size(f"{path}-wal" if path else None),
+                "tables": [],
+            }
+            try:
+                rows = conn.execute(text(
+                    "SELECT name, sum(pgsize) AS size, sum(unused) AS unused "
+                    "FROM dbstat GROUP BY name ORDER BY size DESC"
+                )).all()
+                metrics["tables"] = [
+                    {"name": name, "bytes": size, "unused_bytes": unused}
+                    for name, size, unused in rows
+                ]
+            except OperationalError:
+                # dbstat is an optional compile-time extension
+                pass
+            return metrics
+
+        database_bytes = conn.execute(text("SELECT pg_database_size(current_database())")).scalar()
+        rows = conn.execute(text(
+            "SELECT relname, n_live_tup, n_dead_tup, pg_total_relation_size(relid), "
+            "greatest(last_vacuum, last_autovacuum), greatest(last_analyze, last_autoanalyze) "
+            "FROM pg_stat_user_tables ORDER BY n_dead_tup DESC"
+        )).all()
+        live = sum(row[1] for row in rows)
+        dead = sum(row[2] for row in rows)
+        return {
+            "database_bytes": database_bytes,
+            "dead_rows": dead,
+            "dead_ratio": round(dead / (live + dead), 4) if live + dead else 0.0,
+            "tables": [
+                {
+                    "name": name,
+                    "bytes": size,
+                    "live_rows": live_rows,
+                    "dead_rows": dead_rows,
+                    "last_vacuum": last_vacuum.isoformat() if last_vacuum else None,
+                    "last_analyze": last_analyze.isoformat() if last_analyze else None,
+                }
+                for name, live_rows, dead_rows, size, last_vacuum, last_analyze in rows
+            ],
+        }
+
+
+def checkpoint_wal(engine: Engine, deadline: _Deadline) -> Dict[str, Any]:
+    """Checkpoint and truncate the SQLite WAL."""
+    if engine.dialect.name != "sqlite":
+        return {"status": "skipped", "detail": "PostgreSQL checkpoints are managed by the server"}
+    path = _sqlite_path(engine)
+    before = _file_size(f"{path}-wal" if path else None)
+    with _autocommit(engine) as conn:
+        if deadline.expired:
+            raise BudgetExceeded()
+        busy, log_frames, checkpointed = conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)")).one()
+    after = _file_size(f"{path}-wal" if path else None)
+    return {
+        "status": "ok" if not busy else "partial",
+        "detail": f"{checkpointed}/{log_frames} frames checkpointed" if log_frames >= 0 else "not in WAL mode",
+        "reclaimed_bytes": max(0, before - after),
+    }
+
+
+def analyze(engine: Engine, deadline: _Deadline) -> Dict[str, Any]:
+    """Refresh planner statistics."""
+    with _autocommit(engine) as conn:
+        if engine.dialect.name == "sqlite":
+            # Bound the work on large tables; the planner only needs a sample
+            conn.execute(text("PRAGMA analysis_limit=1000"))
+            _run_bounded(conn, "ANALYZE", deadline)
+            conn.execute(text("PRAGMA optimize"))
+            return {"status": "ok", "detail": "ANALYZE"}
+
+        tables = conn.execute(text(
+            "SELECT relname FROM pg_stat_user_tables "
+            "ORDER BY greatest(last_analyze, last_autoanalyze) ASC NULLS FIRST"
+        )).scalars().all()
+        for done, table in enumerate(tables):
+            try:
+                _run_bounded(conn, f'ANALYZE "{table}"', deadline)
+            except BudgetExceeded:
+                return {"status": "interrupted", "detail": f"analyzed {done}/{len(tables)} tables"}
+        return {"status": "ok", "detail": f"analyzed {len(tables)} tables"}
+
+
+def vacuum(engine: Engine, deadline: _Deadline) -> Dict[str, Any]:
+    """Reclaim wasted space when enough of the database is free pages or dead rows."""
+    min_ratio = settings.db_vacuum_min_free_ratio
+    before = collect_bloat_metrics(engine)
+
+    if engine.dialect.name == "sqlite":
+        if before["free_ratio"] < min_ratio:
+            return {"status": "skipped", "detail": f"free ratio {before['free_ratio']} below {min_ratio}"}
+        with _autocommit(engine) as conn:
+            _run_bounded(conn, "VACUUM", deadline)
+        after = collect_bloat_metrics(engine)
+        return {
+            "status": "ok",
+            "detail": "VACUUM",
+            "reclaimed_bytes": max(0, before["database_bytes"] - after["database_bytes"]),
+        }
+
+    if before["dead_ratio"] < min_ratio:
+        return {"status": "skipped", "detail": f"dead row ratio {before['dead_ratio']} below {min_ratio}"}
+    tables = [table["name"] for table in before["tables"] if table["dead_rows"]]
+    status = "ok"
+    with _autocommit(engine) as conn:
+        for done, table in enumerate(tables):
+            try:
+                _run_bounded(conn, f'VACUUM (ANALYZE) "{table}"', deadline)
+            except BudgetExceeded:
+                status = "interrupted"
+                break
+        else:
+            done = len(tables)
+    after = collect_bloat_metrics(engine)
+    return {
+        "status": status,
+        "detail": f"vacuumed {done}/{len(tables)} tables",
+        "reclaimed_bytes": max(0, before["database_bytes"] - after["database_bytes"]),
+        "dead_rows_removed": max(0, before["dead_rows"] - after["dead_rows"]),
+    }
+
+
+def backup(engine: Engine, deadline: _Deadline) -> Dict[str, Any]:
+    """Take an online snapshot and rotate old ones."""
+    try:
+        result = backup_database(engine, timeout=max(deadline.remaining, 0))
+    except BackupError:
+        if deadline.expired:
+            raise BudgetExceeded()
+        raise
+    return {
+        "status": "ok",
+        "detail": result["path"],
+        "snapshot_bytes": result["snapshot_bytes"],
+        "rotated": result["rotated"],
+    }
+
+
+class MaintenanceJob:
+    """A maintenance task with its schedule and time budget."""
+
+    def __init__(
+        self,
+        name: str,
+        task: Callable[[Engine, _Deadline], Dict[str, Any]],
+        budget_seconds: float,
+        interval: Optional[timedelta] = None,
+        scheduled: bool = True
+    ):
+        self.name = name
+        self.task = task
+        self.budget_seconds = budget_seconds
+        # Jobs without an interval run once per maintenance window
+        self.interval = interval
+        # Unscheduled jobs only run when triggered through the admin endpoint
+        self.scheduled = scheduled
+        self.last_run: Optional[datetime] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    def is_due(self, now: datetime, window: str) -> bool:
+        if not self.scheduled:
+            return False
+        if self.interval is not None:
+            return self.last_run is None or now - self.last_run >= self.interval
+        started = window_start(now, window)
+        return started is not None and (self.last_run is None or self.last_run < started)
+
+
+class MaintenanceScheduler:
+    """Run maintenance jobs on their schedules and keep their results."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.jobs = {
+            job.name: job for job in (
+                MaintenanceJob(
+                    "wal_checkpoint", checkpoint_wal, settings.db_checkpoint_budget_seconds,
+                    interval=timedelta(minutes=settings.db_checkpoint_interval_minutes)
+                ),
+                MaintenanceJob("analyze", analyze, settings.db_analyze_budget_seconds),
+                MaintenanceJob("vacuum", vacuum, settings.db_vacuum_budget_seconds),
+                MaintenanceJob(
+                    "backup", backup, settings.db_backup_budget_seconds,
+                    interval=timedelta(hours=settings.db_backup_interval_hours or 1),
+                    scheduled=settings.db_backup_interval_hours > 0
+                ),
+            )
+        }
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self._lock = threading.Lock()
+
+    def run_job(self, name: str) -> Dict[str, Any]:
+        """Run one job now and record its result."""
+        job = self.jobs[name]
+        with self._lock:
+            started_at = datetime.now()
+            start = time.perf_counter()
+            try:
+                result = job.task(self.engine, _Deadline(job.budget_seconds))
+            except BudgetExceeded:
+                result = {"status": "interrupted", "detail": f"exceeded {job.budget_seconds}s budget"}
+            except Exception as e:
+                logger.error(f"Maintenance job {name} failed: {e}")
+                result = {"status": "failed", "detail": str(e)}
+
+            result = {
+                "job": name,
+                "started_at": started_at.isoformat(),
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                "budget_seconds": job.budget_seconds,
+                "reclaimed_bytes": 0,
+                **result,
+            }
+            job.last_run = started_at
+            job.last_result = result
+            self.history.append(result)
+        logger.info(f"Maintenance job {name}: {result['status']} in {result['duration_ms']}ms")
+        return result
+
+    def run_due(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Run every job whose schedule says it is due."""
+        now = now or datetime.now()
+        return [
+            self.run_job(name)
+            for name, job in self.jobs.items()
+            if job.is_due(now, settings.db_maintenance_window)
+        ]
+
+    async def run_forever(self, poll_seconds: float = POLL_SECONDS):
+        """Check for due jobs every ``poll_seconds`` until cancelled."""
+        while True:
+            await asyncio.sleep(poll_seconds)
+            try:
+                await asyncio.to_thread(self.run_due)
+            except Exception as e:
+                logger.error(f"Maintenance scheduler error: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        """Last result per job, recent history and current bloat metrics."""
+        return {
+            "enabled": settings.db_maintenance_enabled,
+            "window": settings.db_maintenance_window,
+            "jobs": {
+                name: {
+                    "budget_seconds": job.budget_seconds,
+                    "scheduled": job.scheduled,
+                    "interval_minutes": job.interval.total_seconds() / 60 if job.interval else None,
+                    "last_run": job.last_run.isoformat() if job.last_run else None,
+                    "last_result": job.last_result,
+                }
+                for name, job in self.jobs.items()
+            },
+            "history": list(self.history),
+            "bloat": collect_bloat_metrics(self.engine),
+        }
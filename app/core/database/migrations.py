@@ -0,0 +1,93 @@
+"""In-place schema upgrades for existing databases.
+
+``Base.metadata.create_all`` only creates missing tables, so columns added
+to existing models are applied here: missing columns are added with
+``ALTER TABLE`` and, when a backfill is registered, populated once. Indexes
+declared on the models but missing from the database are created.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from app.models.member import PREVIEW_LENGTH
+
+logger = logging.getLogger(__name__)
+
+
+def _preview_backfill(table: str, column: str) -> str:
+    """Populate a stored preview and length from an existing text column."""
+    return (
+        f"UPDATE {table} SET {column}_preview = CASE WHEN length({column}) > {PREVIEW_LENGTH} "
+        f"THEN substr({column}, 1, {PREVIEW_LENGTH - 3}) || '...' ELSE {column} END, "
+        f"{column}_length = coalesce(length({column}), 0)"
+    )
+
+
+GITHUB_URL_PREFIX = "https://github.com/"
+
+# (table, column) -> statements run once, right after the column is added
+BACKFILLS: Dict[Tuple[str, str], List[str]] = {
+    ("activities", "content_length"): [_preview_backfill("activities", "content")],
+    # Older GitHub activities only kept the repository URL; the other event
+    # fields are only known for activities ingested with their payload
+    ("activities", "repo_full_name"): [
+        f"UPDATE activities SET repo_full_name = substr(url, {len(GITHUB_URL_PREFIX) + 1}) "
+        f"WHERE platform = 'github' AND url LIKE '{GITHUB_URL_PREFIX}%'"
+    ],
+    # Nothing wrote is_processed before the activity pipeline existed; mark the
+    # existing rows handled so only activities ingested after the upgrade
+    # reach the pipeline (and its notifications)
+    ("activities", "claimed_at"): ["UPDATE activities SET is_processed = TRUE"],
+    ("summaries", "content_length"): [_preview_backfill("summaries", "content")],
+    ("summaries", "content_en_length"): [_preview_backfill("summaries", "content_en")],
+}
+
+
+def upgrade_schema(engine: Engine, metadata) -> List[str]:
+    """Add columns that exist on the models but not in the database.
+
+    Returns the list of ``table.column`` names that were added.
+    """
+    added = []
+    with engine.begin() as conn:
+        # Inspect on the same connection so a single-connection pool is enough
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        existing_indexes = {
+            name: {index["name"] for index in inspector.get_indexes(name)}
+            for name in existing_tables
+        }
+
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(
+                    f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'
+                ))
+                added.append(f"{table.name}.{column.name}")
+                logger.info(f"Added column {table.name}.{column.name}")
+
+        for name in added:
+            table_name, column_name = name.split(".", 1)
+            for statement in BACKFILLS.get((table_name, column_name), []):
+                conn.execute(text(statement))
+
+    # Create indexes declared on the models but missing from existing tables,
+    # including those on the columns just added
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for index in table.indexes:
+            if index.name not in existing_indexes.get(table.name, set()):
+                index.create(bind=engine, checkfirst=True)
+                logger.info(f"Created index {index.name}")
+
+    return added
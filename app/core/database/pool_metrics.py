@@ -0,0 +1,133 @@
+"""Connection pool telemetry.
+
+Records how long callers wait for a pooled connection, how long connections
+stay checked out, and when the pool runs out of connections.
+"""
+
+import threading
+import time
+from typing import Dict, Any, List
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Histogram bucket upper bounds in milliseconds
+DEFAULT_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram of durations in milliseconds."""
+
+    def __init__(self, buckets_ms: List[float] = None):
+        self.buckets_ms = list(buckets_ms or DEFAULT_BUCKETS_MS)
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float):
+        """Record one duration."""
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if value_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value_ms
+            self._max = max(self._max, value_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return bucket counts and summary statistics."""
+        with self._lock:
+            buckets = {f"le_{bound:g}ms": count for bound, count in zip(self.buckets_ms, self._counts)}
+            buckets["inf"] = self._counts[-1]
+            return {
+                "count": self._count,
+                "sum_ms": round(self._sum, 3),
+                "avg_ms": round(self._sum / self._count, 3) if self._count else 0.0,
+                "max_ms": round(self._max, 3),
+                "buckets": buckets
+            }
+
+
+class PoolMetrics:
+    """Wait-time, checkout-duration and saturation metrics for one pool."""
+
+    def __init__(self):
+        self.wait_time = Histogram()
+        self.checkout_duration = Histogram()
+        self.saturation_events = 0
+        self.timeouts = 0
+        self.last_saturated_at = None
+        self._lock = threading.Lock()
+
+    def record_saturation(self, timed_out: bool = False):
+        """Record that a caller found no idle connection and no overflow left."""
+        with self._lock:
+            self.saturation_events += 1
+            if timed_out:
+                self.timeouts += 1
+            self.last_saturated_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all metrics as a dictionary."""
+        with self._lock:
+            saturation = {
+                "events": self.saturation_events,
+                "timeouts": self.timeouts,
+                "last_saturated_at": self.last_saturated_at
+            }
+        return {
+            "wait_time": self.wait_time.snapshot(),
+            "checkout_duration": self.checkout_duration.snapshot(),
+            "saturation": saturation
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that times how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        # No idle connection and no overflow left: this caller has to wait
+        saturated = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_saturation(timed_out=True)
+            raise
+        finally:
+            self.metrics.wait_time.observe((time.perf_counter() - start) * 1000)
+        if saturated:
+            self.metrics.record_saturation()
+        return connection
+
+
+def instrument_checkouts(engine, metrics: PoolMetrics):
+    """Measure how long each connection stays checked out of the pool."""
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            metrics.checkout_duration.observe((time.perf_counter() - checked_out_at) * 1000)
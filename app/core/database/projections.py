@@ -0,0 +1,135 @@
+"""Read-only projections for hot read loops.
+
+The summarizer, exports and dashboard stats only read a handful of columns.
+Loading full ``Activity`` instances pays for the identity map, change
+tracking and relationship loading on every row; the helpers here select only
+the needed columns and return compact ``ActivityRecord`` objects, streamed
+in batches with ``yield_per``.
+"""
+
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterator, List, Optional
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.member import Activity, Member
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class ActivityRecord:
+    """Read-only activity row exposing the attributes the read paths use."""
+
+    __slots__ = (
+        "id", "member_id", "social_profile_id", "platform", "activity_type",
+        "title", "content", "url", "published_at", "created_at", "member_name"
+    )
+
+    def __init__(
+        self,
+        id: int,
+        member_id: int,
+        social_profile_id: int,
+        platform: str,
+        activity_type: Optional[str],
+        title: Optional[str],
+        content: Optional[str],
+        url: Optional[str],
+        published_at: Optional[datetime],
+        created_at: Optional[datetime],
+        member_name: Optional[str] = None
+    ):
+        self.id = id
+        self.member_id = member_id
+        self.social_profile_id = social_profile_id
+        self.platform = platform
+        self.activity_type = activity_type
+        self.title = title
+        self.content = content
+        self.url = url
+        self.published_at = published_at
+        self.created_at = created_at
+        self.member_name = member_name
+
+    def __repr__(self) -> str:
+        return f"ActivityRecord(id={self.id}, platform={self.platform!r}, type={self.activity_type!r})"
+
+
+def activity_records_statement(*criteria, order_by=None, with_member_name: bool = False) -> Select:
+    """Select the ``ActivityRecord`` columns for activities matching ``criteria``.
+
+    With ``with_member_name`` the member's name is joined in as well.
+    """
+    columns = [
+        Activity.id,
+        Activity.member_id,
+        Activity.social_profile_id,
+        Activity.platform,
+        Activity.activity_type,
+        Activity.title.label("title"),
+        Activity.content.label("content"),
+        Activity.url,
+        Activity.published_at,
+        Activity.created_at,
+    ]
+    stmt = select(*columns)
+    if with_member_name:
+        stmt = stmt.add_columns(Member.name).join(Member, Member.id == Activity.member_id)
+    if criteria:
+        stmt = stmt.where(*criteria)
+    if order_by is not None:
+        stmt = stmt.order_by(order_by)
+    return stmt
+
+
+def iter_activity_records(
+    db: Session, stmt: Select, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[ActivityRecord]:
+    """Stream records for ``stmt`` from a sync session, ``batch_size`` rows at a time."""
+    result = db.execute(stmt.execution_options(yield_per=batch_size))
+    for row in result:
+        yield ActivityRecord(*row)
+
+
+async def stream_activity_records(
+    db: AsyncSession, stmt: Select, batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[ActivityRecord]:
+    """Stream records for ``stmt`` from an async session."""
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for row in result:
+        yield ActivityRecord(*row)
+
+
+async def fetch_activity_records(
+    db: AsyncSession, stmt: Select, batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[ActivityRecord]:
+    """Collect records for ``stmt`` from an async session into a list."""
+    return [record async for record in stream_activity_records(db, stmt, batch_size)]
+
+
+def dashboard_counts_statement(now: Optional[datetime] = None) -> Select:
+    """Single statement returning every dashboard count.
+
+    Columns: ``total_members``, ``active_members``, ``total_activities``,
+    ``activities_today``, ``activities_this_week``.
+    """
+    today = (now or datetime.utcnow()).date()
+    start_of_today = datetime.combine(today, datetime.min.time())
+    start_of_week = datetime.combine(today - timedelta(days=today.weekday()), datetime.min.time())
+    end_of_today = datetime.combine(today, datetime.max.time())
+
+    def count(model, *criteria):
+        return select(func.count(model.id)).where(*criteria).scalar_subquery()
+
+    return select(
+        count(Member).label("total_members"),
+        count(Member, Member.is_active == True).label("active_members"),
+        count(Activity).label("total_activities"),
+        count(
+            Activity,
+            Activity.created_at >= start_of_today,
+            Activity.created_at <= end_of_today
+        ).label("activities_today"),
+        count(Activity, Activity.created_at >= start_of_week).label("activities_this_week"),
+    )
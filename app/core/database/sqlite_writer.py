@@ -0,0 +1,259 @@
+"""Serialized SQLite writes.
+
+SQLite allows one writer at a time. In writer mode every write goes through
+a single writer connection, shared by the sync and async engines, so
+concurrent writers queue for it instead of busy-waiting on the database
+lock, while reads use a separate pool of read-only connections.
+``SQLiteWriteQueue`` additionally coalesces small write jobs from many
+callers into grouped transactions on a writer thread.
+"""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+import aiosqlite
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.util import await_only
+
+logger = logging.getLogger(__name__)
+
+_READ_ONLY_PREFIXES = ("SELECT", "WITH", "PRAGMA", "EXPLAIN")
+
+
+def _is_write(clause) -> bool:
+    if isinstance(clause, (Insert, Update, Delete)):
+        return True
+    return isinstance(clause, TextClause) and not clause.text.lstrip().upper().startswith(_READ_ONLY_PREFIXES)
+
+
+def make_routing_session(write_engine: Engine, read_engine: Engine) -> type:
+    """Build a Session class that sends writes to ``write_engine``.
+
+    Flushes and INSERT/UPDATE/DELETE statements use the writer; plain reads
+    use the read pool. Raw SQL is routed by its leading keyword. Once a
+    transaction has written, its reads stay on the writer until it ends, so
+    the session sees its own flushed but uncommitted rows.
+    """
+
+    class RoutingSession(Session):
+        _dirty_txn = False
+
+        def get_bind(self, mapper=None, clause=None, **kwargs):
+            if self._dirty_txn:
+                return write_engine
+            if self._flushing or _is_write(clause):
+                self._dirty_txn = True
+                return write_engine
+            return read_engine
+
+    @event.listens_for(RoutingSession, "after_transaction_end")
+    def _end_write_transaction(session, transaction):
+        if transaction.parent is None:
+            session._dirty_txn = False
+
+    return RoutingSession
+
+
+class _SharedConnection:
+    """Proxy to the shared sqlite3 connection; the pools can't close it."""
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, connection: sqlite3.Connection):
+        object.__setattr__(self, "_connection", connection)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+    def close(self):
+        # Disposing one engine must not cut off the other
+        pass
+
+
+class SharedWriterConnection:
+    """The one SQLite writer connection, used by both the sync and the async engine.
+
+    The sync engine opens it through ``connect`` and the async engine
+    through ``connect_async``, which runs the same sqlite3 connection on an
+    aiosqlite thread. A lease taken on pool checkout and returned on checkin
+    keeps the engines from using it at the same time; waiting for the lease
+    replaces waiting on the database lock, and gives up after ``timeout``
+    seconds just like ``busy_timeout``.
+    """
+
+    def __init__(self, database: str, timeout: float):
+        self.database = database
+        self.timeout = timeout
+        self._connection = None
+        self._connect_lock = threading.Lock()
+        self._lease = threading.Lock()
+
+    def connect(self) -> _SharedConnection:
+        """DBAPI connection for the sync engine's ``creator``."""
+        with self._connect_lock:
+            if self._connection is None:
+                self._connection = sqlite3.connect(self.database, check_same_thread=False)
+            return _SharedConnection(self._connection)
+
+    async def connect_async(self) -> aiosqlite.Connection:
+        """aiosqlite connection for the async engine's ``async_creator``."""
+        return await aiosqlite.Connection(self.connect, iter_chunk_size=64)
+
+    def attach(self, sync_engine: Engine, async_sync_engine: Engine):
+        """Lease the connection to each engine while one of its sessions holds it."""
+
+        @event.listens_for(sync_engine, "checkout")
+        def _lease(dbapi_connection, connection_record, connection_proxy):
+            self._leased(self._lease.acquire(timeout=self.timeout), connection_record)
+
+        @event.listens_for(async_sync_engine, "checkout")
+        def _lease_async(dbapi_connection, connection_record, connection_proxy):
+            # Pool checkout of an async engine runs in a greenlet, which may await
+            self._leased(await_only(self._acquire_async()), connection_record)
+
+        for db_engine in (sync_engine, async_sync_engine):
+            event.listen(db_engine, "checkin", self._release)
+
+    async def _acquire_async(self) -> bool:
+        # Polls instead of waiting in a thread, so a cancelled waiter never holds the lease
+        deadline = time.monotonic() + self.timeout
+        delay = 0.001
+        while not self._lease.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.02)
+        return True
+
+    def _leased(self, acquired: bool, connection_record):
+        if not acquired:
+            raise PoolTimeoutError(f"SQLite writer connection not available after {self.timeout:.1f}s")
+        connection_record.info["writer_lease"] = True
+        # A holder whose connection was dropped without a rollback leaves its transaction open
+        if self._connection.in_transaction:
+            self._connection.rollback()
+
+    def _release(self, dbapi_connection, connection_record):
+        if connection_record is not None and connection_record.info.pop("writer_lease", False):
+            self._lease.release()
+
+
+class SQLiteWriteQueue:
+    """Single writer thread that runs queued write jobs in grouped transactions.
+
+    Each job is a callable taking a ``Connection``. Jobs that arrive close
+    together share one transaction; each runs in its own savepoint so a
+    failing job does not roll back the others.
+    """
+
+    def __init__(self, engine: Engine, max_batch: int = 100, max_delay: float = 0.005):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Tuple[Callable[[Connection], Any], Future]]" = queue.Queue()
+        self._thread = None
+        self._stopping = threading.Event()
+        self.batches = 0
+        self.jobs = 0
+
+    def start(self):
+        """Start the writer thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Finish queued jobs and stop the writer thread."""
+        if not self._thread:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def submit(self, job: Callable[[Connection], Any]) -> Future:
+        """Queue a write job and return a future for its result."""
+        future: Future = Future()
+        self._queue.put((job, future))
+        return future
+
+    async def run(self, job: Callable[[Connection], Any]) -> Any:
+        """Queue a write job and await its result without blocking the loop."""
+        return await asyncio.wrap_future(self.submit(job))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and batching statistics."""
+        return {
+            "queued": self._queue.qsize(),
+            "batches": self.batches,
+            "jobs": self.jobs,
+            "avg_batch_size": round(self.jobs / self.batches, 2) if self.batches else 0.0
+        }
+
+    def _next_batch(self) -> List[Tuple[Callable[[Connection], Any], Future]]:
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if batch:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[Callable[[Connection], Any], Future]]):
+        results = []
+        try:
+            with self.engine.begin() as conn:
+                if conn.dialect.name == "sqlite":
+                    # pysqlite only begins before DML; without this every released savepoint commits
+                    conn.exec_driver_sql("BEGIN IMMEDIATE")
+                for job, future in batch:
+                    savepoint = conn.begin_nested()
+                    try:
+                        result = job(conn)
+                        savepoint.commit()
+                        results.append((future, result, None))
+                    except Exception as e:
+                        savepoint.rollback()
+                        results.append((future, None, e))
+        except Exception as e:
+            logger.error(f"SQLite write batch of {len(batch)} failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.jobs += len(batch)
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
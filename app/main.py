@@ -4,18 +4,23 @@ import logging
 import asyncio
 import schedule
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Set
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, BackgroundTasks
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
 from app.core.config.settings import settings
-from app.core.database.database import engine, Base, init_db, health_check as db_health_check
+from app.core.database.database import engine, Base, init_db, health_check as db_health_check, READ_PIN_COOKIE, get_pool_metrics, dispose_async_engines, get_maintenance_scheduler, stop_write_queue
 from app.api.v1 import members, monitoring, settings as settings_api, export, notifications, summaries
+from app.api.admin import maintenance as maintenance_api
 from app.services.monitors.monitor_manager import MonitorManager
+from app.services.processing.activity_queue import activity_pipeline
+from app.services.summarizers.llm_backend import close_http_client
 from app.services.summarizers.llm_summarizer import LLMSummarizer
-from app.core.database.database import SessionLocal
+from app.services.summarizers.summary_cache import invalidate_summary_cache
+from app.core.database.database import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,10 @@ logger = logging.getLogger(__name__)
 # Initialize database tables
 init_db()
 
+# Downstream stages for newly ingested activities
+activity_pipeline.register("notifications", notifications.notify_new_activities)
+activity_pipeline.register("summary_cache", invalidate_summary_cache)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -30,14 +39,24 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Inspector application...")
     
-    # Start background tasks
-    background_tasks = BackgroundTasks()
-    background_tasks.add_task(start_scheduled_tasks)
+    # Monitoring and summary jobs
+    scheduler_task = asyncio.create_task(run_scheduled_tasks())
+    
+    # Database maintenance (WAL checkpoints, ANALYZE, VACUUM)
+    maintenance_task = None
+    if settings.db_maintenance_enabled:
+        maintenance_task = asyncio.create_task(get_maintenance_scheduler().run_forever())
     
     yield
     
     # Shutdown
     logger.info("Shutting down Inspector application...")
+    scheduler_task.cancel()
+    if maintenance_task:
+        maintenance_task.cancel()
+    stop_write_queue()
+    await close_http_client()
+    await dispose_async_engines()
 
 
 # Create FastAPI app
@@ -57,6 +76,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def pin_reads_after_write(request: Request, call_next):
+    """Keep a client's reads on the primary for a short window after it writes."""
+    response = await call_next(request)
+    if (
+        settings.database_replica_url
+        and request.method in ("POST", "PUT", "PATCH", "DELETE")
+        and response.status_code < 400
+    ):
+        window = settings.replica_read_your_writes_seconds
+        response.set_cookie(
+            READ_PIN_COOKIE,
+            str(time.time() + window),
+            max_age=max(1, int(window)),
+            httponly=True,
+            samesite="lax"
+        )
+    return response
+
 # Include API routers
 app.include_router(
     members.router,
@@ -94,6 +132,12 @@ app.include_router(
     tags=["summaries"]
 )
 
+app.include_router(
+    maintenance_api.router,
+    prefix="/api/admin",
+    tags=["admin"]
+)
+
 
 @app.get("/")
 async def root():
@@ -109,7 +153,7 @@ async def root():
 @app.get("/health")
 async def health_check_endpoint():
     """Health check endpoint with database status."""
-    db_status = db_health_check()
+    db_status = await asyncio.to_thread(db_health_check)
     
     return {
         "status": "healthy" if db_status["status"] == "healthy" else "degraded",
@@ -122,7 +166,7 @@ async def health_check_endpoint():
 @app.get("/health/detailed")
 async def detailed_health_check():
     """Detailed health check with all system components."""
-    db_status = db_health_check()
+    db_status = await asyncio.to_thread(db_health_check)
     
     # Check if all components are healthy
     all_healthy = db_status["status"] == "healthy"
@@ -141,83 +185,118 @@ async def detailed_health_check():
     }
 
 
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    """Connection pool sizing, wait-time, checkout-duration and saturation metrics."""
+    return {
+        "timestamp": datetime.utcnow().isoformat(),
+        "pools": get_pool_metrics()
+    }
+
+
 async def run_monitoring_task():
     """Run the monitoring task."""
-    db = SessionLocal()
-    try:
-        monitor_manager = MonitorManager(db)
-        results = await monitor_manager.monitor_all_profiles()
-        logger.info(f"Monitoring completed: {len(results)} platforms checked")
-    except Exception as e:
-        logger.error(f"Monitoring task failed: {e}")
-        # Send notification about monitoring error
-        await notifications.notify_monitoring_error("general", str(e))
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            monitor_manager = MonitorManager(db)
+            results = await monitor_manager.monitor_all_profiles()
+            logger.info(f"Monitoring completed: {len(results)} platforms checked")
+        except Exception as e:
+            logger.error(f"Monitoring task failed: {e}")
+            # Send notification about monitoring error
+            await notifications.notify_monitoring_error("general", str(e))
+    # Hand the new activities to the downstream stages
+    await monitoring.run_activity_pipeline()
 
 
 async def run_summary_task():
     """Run the summary generation task."""
-    db = SessionLocal()
-    try:
-        summarizer = LLMSummarizer(db)
-        summary = await summarizer.generate_daily_summary()
-        if summary:
-            logger.info(f"Daily summary generated: {summary.id}")
-            # Send notification about summary generation
-            await notifications.notify_summary_generated(summary)
-        else:
-            logger.warning("Daily summary generation failed")
-    except Exception as e:
-        logger.error(f"Summary task failed: {e}")
-    finally:
-        db.close()
-
-
-def start_scheduled_tasks():
-    """Start background scheduled tasks."""
+    async with AsyncSessionLocal() as db:
+        try:
+            summarizer = LLMSummarizer(db)
+            summary = await summarizer.generate_daily_summary()
+            if summary:
+                logger.info(f"Daily summary generated: {summary.id}")
+                # Send notification about summary generation
+                await notifications.notify_summary_generated(summary)
+            else:
+                logger.warning("Daily summary generation failed")
+        except Exception as e:
+            logger.error(f"Summary task failed: {e}")
+
+
+async def run_scheduled_tasks(poll_seconds: float = 60):
+    """Start due monitoring and summary jobs on the event loop until cancelled.
+    
+    Jobs run as their own tasks, so a long summary does not hold up
+    monitoring; cancelling the scheduler cancels the jobs still running.
+    """
+    scheduler = schedule.Scheduler()
+    running: Set[asyncio.Task] = set()
+    
+    def spawn(job: Callable[[], Awaitable[None]]):
+        task = asyncio.create_task(job())
+        running.add(task)
+        task.add_done_callback(running.discard)
+    
     # Schedule monitoring task
-    schedule.every(settings.monitoring_interval_minutes).minutes.do(
-        lambda: asyncio.create_task(run_monitoring_task())
-    )
+    scheduler.every(settings.monitoring_interval_minutes).minutes.do(spawn, run_monitoring_task)
     
     # Schedule daily summary task
-    schedule.every().day.at(settings.summary_time).do(
-        lambda: asyncio.create_task(run_summary_task())
-    )
+    scheduler.every().day.at(settings.summary_time).do(spawn, run_summary_task)
     
     # Schedule weekly summary task
-    schedule.every().monday.at(settings.summary_time).do(
-        lambda: asyncio.create_task(run_weekly_summary_task())
-    )
+    scheduler.every().monday.at(settings.summary_time).do(spawn, run_weekly_summary_task)
     
-    def run_scheduler():
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+    # Monthly and quarterly summaries are due on the first day of a month
+    scheduler.every().day.at(settings.summary_time).do(spawn, run_period_summary_task)
     
-    # Start scheduler in background thread
-    import threading
-    scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-    scheduler_thread.start()
+    try:
+        while True:
+            try:
+                scheduler.run_pending()
+            except Exception as e:
+                logger.error(f"Task scheduler error: {e}")
+            await asyncio.sleep(poll_seconds)  # Check every minute
+    finally:
+        for task in list(running):
+            task.cancel()
 
 
 async def run_weekly_summary_task():
     """Run the weekly summary generation task."""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
+        try:
+            summarizer = LLMSummarizer(db)
+            summary = await summarizer.generate_weekly_summary()
+            if summary:
+                logger.info(f"Weekly summary generated: {summary.id}")
+                # Send notification about summary generation
+                await notifications.notify_summary_generated(summary)
+            else:
+                logger.warning("Weekly summary generation failed")
+        except Exception as e:
+            logger.error(f"Weekly summary task failed: {e}")
+
+
+async def run_period_summary_task():
+    """On the first of a month, summarize the previous month (and quarter, if it ended)."""
+    today = datetime.utcnow().date()
+    if today.day != 1:
+        return
+    summary_types = ["monthly"] + (["quarterly"] if today.month in (1, 4, 7, 10) else [])
+    async with AsyncSessionLocal() as db:
         summarizer = LLMSummarizer(db)
-        summary = await summarizer.generate_weekly_summary()
-        if summary:
-            logger.info(f"Weekly summary generated: {summary.id}")
-            # Send notification about summary generation
-            await notifications.notify_summary_generated(summary)
-        else:
-            logger.warning("Weekly summary generation failed")
-    except Exception as e:
-        logger.error(f"Weekly summary task failed: {e}")
-    finally:
-        db.close()
+        for summary_type in summary_types:
+            try:
+                summary = await summarizer.generate_rollup_summary(summary_type, today - timedelta(days=1))
+                if summary:
+                    logger.info(f"{summary_type.capitalize()} summary generated: {summary.id}")
+                    await notifications.notify_summary_generated(summary)
+                else:
+                    logger.warning(f"{summary_type.capitalize()} summary generation failed")
+            except Exception as e:
+                logger.error(f"{summary_type.capitalize()} summary task failed: {e}")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,23 @@
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index, JSON, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship, validates
 from app.core.database.database import Base
 
+# Length of the stored previews returned by list endpoints
+PREVIEW_LENGTH = 280
+
+
+def make_preview(text: Optional[str]) -> Optional[str]:
+    """Build the short preview stored alongside a large text column."""
+    if text is None:
+        return None
+    if len(text) <= PREVIEW_LENGTH:
+        return text
+    return text[:PREVIEW_LENGTH - 3] + "..."
+
 
 class Member(Base):
     """Member model for storing team member information."""
@@ -46,8 +59,25 @@ class SocialProfile(Base):
     activities = relationship("Activity", back_populates="social_profile", cascade="all, delete-orphan")
 
 
+class ContentBlob(Base):
+    """Text shared by many activities, stored once and keyed by its SHA-256."""
+    
+    __tablename__ = "content_blobs"
+    
+    id = Column(Integer, primary_key=True)
+    hash = Column(String(64), unique=True, nullable=False)
+    text = Column(Text, nullable=False)
+    size = Column(Integer, default=0)  # UTF-8 bytes
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class Activity(Base):
-    """Social media activity model."""
+    """Social media activity model.
+    
+    ``title`` and ``content`` are stored inline, or in a shared
+    ``ContentBlob`` when the same text repeats across activities; the
+    ``title``/``content`` accessors read whichever is set.
+    """
     
     __tablename__ = "activities"
     
@@ -56,17 +86,117 @@ class Activity(Base):
     social_profile_id = Column(Integer, ForeignKey("social_profiles.id"), nullable=False)
     platform = Column(String(50), nullable=False)
     activity_type = Column(String(50))  # post, comment, like, follow, etc.
-    title = Column(String(500))
-    content = Column(Text)
+    stored_title = Column("title", String(500))  # None when held in title_blob
+    stored_content = Column("content", Text)  # None when held in content_blob
+    title_blob_id = Column(Integer, ForeignKey("content_blobs.id"), index=True)
+    content_blob_id = Column(Integer, ForeignKey("content_blobs.id"), index=True)
+    content_preview = Column(String(PREVIEW_LENGTH))
+    content_length = Column(Integer, default=0)
     url = Column(String(500))
     external_id = Column(String(255), unique=True, index=True)  # Platform-specific ID
     published_at = Column(DateTime)
-    is_processed = Column(Boolean, default=False)
+    is_processed = Column(Boolean, default=False)  # Handled by the activity pipeline
+    claimed_at = Column(DateTime)  # Set while a pipeline consumer holds the row
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    # Structured event fields (GitHub), filled at ingestion
+    repo_full_name = Column(String(200), index=True)  # owner/name
+    event_action = Column(String(50), index=True)  # opened, closed, started, ...
+    commit_count = Column(Integer)
+    ref = Column(String(255))
+    raw_payload = deferred(Column(JSON))  # Platform payload as received; loaded on access
+    
+    __table_args__ = (
+        # Only queued rows are indexed, so claiming stays cheap as the table grows
+        Index(
+            "ix_activities_unprocessed", "id",
+            sqlite_where=is_processed == False,
+            postgresql_where=is_processed == False
+        ),
+    )
+    
     # Relationships
     member = relationship("Member", back_populates="activities")
     social_profile = relationship("SocialProfile", back_populates="activities")
+    title_blob = relationship("ContentBlob", foreign_keys=[title_blob_id], lazy="selectin")
+    content_blob = relationship("ContentBlob", foreign_keys=[content_blob_id], lazy="selectin")
+    
+    @hybrid_property
+    def title(self) -> Optional[str]:
+        if self.stored_title is None and self.title_blob is not None:
+            return self.title_blob.text
+        return self.stored_title
+    
+    @title.inplace.setter
+    def _title_setter(self, value: Optional[str]) -> None:
+        self.stored_title = value
+        self.title_blob = None
+    
+    @title.inplace.expression
+    @classmethod
+    def _title_expression(cls):
+        blob_text = select(ContentBlob.text).where(ContentBlob.id == cls.title_blob_id)
+        return func.coalesce(cls.stored_title, blob_text.scalar_subquery())
+    
+    @hybrid_property
+    def content(self) -> Optional[str]:
+        if self.stored_content is None and self.content_blob is not None:
+            return self.content_blob.text
+        return self.stored_content
+    
+    @content.inplace.setter
+    def _content_setter(self, value: Optional[str]) -> None:
+        """Store new content inline and keep preview and length in step."""
+        self.stored_content = value
+        self.content_blob = None
+        self.content_preview = make_preview(value)
+        self.content_length = len(value) if value else 0
+    
+    @content.inplace.expression
+    @classmethod
+    def _content_expression(cls):
+        blob_text = select(ContentBlob.text).where(ContentBlob.id == cls.content_blob_id)
+        return func.coalesce(cls.stored_content, blob_text.scalar_subquery())
+
+
+class RawPayload(Base):
+    """Index entry for a raw platform response kept in the payload log."""
+    
+    __tablename__ = "raw_payloads"
+    
+    id = Column(Integer, primary_key=True)
+    platform = Column(String(50), nullable=False)
+    social_profile_id = Column(Integer, ForeignKey("social_profiles.id"), nullable=False)
+    fetched_at = Column(DateTime, nullable=False, index=True)
+    status_code = Column(Integer)
+    segment = Column(Integer, nullable=False)  # Segment file number
+    offset = Column(Integer, nullable=False)  # Frame start within the segment
+    length = Column(Integer, nullable=False)  # Frame size, header included
+    
+    __table_args__ = (
+        Index("ix_raw_payloads_profile_fetched", "social_profile_id", "fetched_at"),
+    )
+
+
+class SummaryCacheEntry(Base):
+    """Generated summary text, keyed by a hash of everything it was generated from."""
+    
+    __tablename__ = "summary_cache"
+    
+    id = Column(Integer, primary_key=True)
+    key = Column(String(64), unique=True, nullable=False)
+    language = Column(String(20), nullable=False)
+    summary_type = Column(String(50))
+    start_date = Column(DateTime)
+    end_date = Column(DateTime)
+    model = Column(String(100))
+    prompt_version = Column(String(50))
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_summary_cache_window", "start_date", "end_date"),
+    )
 
 
 class Summary(Base):
@@ -78,6 +208,10 @@ class Summary(Base):
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)  # 中文内容
     content_en = Column(Text)  # 英文内容
+    content_preview = Column(String(PREVIEW_LENGTH))
+    content_en_preview = Column(String(PREVIEW_LENGTH))
+    content_length = Column(Integer, default=0)
+    content_en_length = Column(Integer, default=0)
     summary_type = Column(String(50))  # daily, weekly, monthly
     start_date = Column(DateTime)
     end_date = Column(DateTime)
@@ -85,4 +219,11 @@ class Summary(Base):
     activity_count = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     is_sent = Column(Boolean, default=False)
-    sent_at = Column(DateTime) 
\ No newline at end of file
+    sent_at = Column(DateTime)
+    
+    @validates("content", "content_en")
+    def _sync_content_preview(self, key, value):
+        """Keep previews and lengths in step with the full content."""
+        setattr(self, f"{key}_preview", make_preview(value))
+        setattr(self, f"{key}_length", len(value) if value else 0)
+        return value
@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # Member schemas
@@ -71,16 +71,57 @@ class Activity(BaseModel):
     activity_type: str
     title: Optional[str]
     content: Optional[str]
+    content_length: Optional[int] = None
     url: Optional[str]
     external_id: Optional[str]
     published_at: Optional[datetime]
     is_processed: bool = False
     created_at: datetime
+    repo_full_name: Optional[str] = None
+    event_action: Optional[str] = None
+    commit_count: Optional[int] = None
+    ref: Optional[str] = None
 
     class Config:
         from_attributes = True
 
 
+class ActivityListItem(BaseModel):
+    """Activity without its full content; fetch the detail endpoint for that."""
+    id: int
+    member_id: int
+    social_profile_id: int
+    platform: str
+    activity_type: str
+    title: Optional[str]
+    content_preview: Optional[str] = None
+    content_length: Optional[int] = None
+    url: Optional[str]
+    external_id: Optional[str]
+    published_at: Optional[datetime]
+    is_processed: bool = False
+    created_at: datetime
+    repo_full_name: Optional[str] = None
+    event_action: Optional[str] = None
+    commit_count: Optional[int] = None
+    ref: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ActivitySearchHit(BaseModel):
+    activity: Activity
+    score: float
+    title_highlight: Optional[str] = None
+    content_snippet: Optional[str] = None
+
+
+class ActivitySearchResponse(BaseModel):
+    items: List[ActivitySearchHit]
+    next_cursor: Optional[str] = None
+
+
 # Summary schemas
 class Summary(BaseModel):
     id: int
@@ -100,6 +141,43 @@ class Summary(BaseModel):
         from_attributes = True
 
 
+class SummaryListItem(BaseModel):
+    """Summary without its full bodies; fetch the detail endpoint for those."""
+    id: int
+    summary_type: str
+    title: str
+    content_preview: Optional[str] = None
+    content_length: Optional[int] = None
+    has_english: bool = False
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+    member_count: int = 0
+    activity_count: int = 0
+    created_at: datetime
+    is_sent: bool = False
+    sent_at: Optional[datetime]
+
+    @classmethod
+    def from_summary(cls, summary, language: str = "chinese") -> "SummaryListItem":
+        """Build a list item, picking the preview for the requested language."""
+        use_english = language == "english" and bool(summary.content_en_length)
+        return cls(
+            id=summary.id,
+            summary_type=summary.summary_type,
+            title=summary.title,
+            content_preview=summary.content_en_preview if use_english else summary.content_preview,
+            content_length=summary.content_en_length if use_english else summary.content_length,
+            has_english=bool(summary.content_en_length),
+            start_date=summary.start_date,
+            end_date=summary.end_date,
+            member_count=summary.member_count or 0,
+            activity_count=summary.activity_count or 0,
+            created_at=summary.created_at,
+            is_sent=bool(summary.is_sent),
+            sent_at=summary.sent_at
+        )
+
+
 # Monitoring schemas
 class MonitoringResult(BaseModel):
     status: str
@@ -116,6 +194,20 @@ class MemberWithActivities(Member):
     activities: List[Activity] = []
 
 
+# Bulk import schemas
+class MemberImportRow(MemberBase):
+    """One import row: a member, optionally with one of their social profiles."""
+    platform: Optional[str] = Field(None, min_length=1, max_length=50)
+    profile_url: Optional[str] = Field(None, min_length=1, max_length=500)
+    username: Optional[str] = Field(None, max_length=100)
+
+    @model_validator(mode="after")
+    def profile_needs_platform_and_url(self):
+        if (self.platform is None) != (self.profile_url is None):
+            raise ValueError("platform and profile_url must be given together")
+        return self
+
+
 # Dashboard schemas
 class DashboardStats(BaseModel):
     total_members: int
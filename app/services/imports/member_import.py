@@ -0,0 +1,244 @@
+"""Bulk import of members and their social profiles.
+
+Rows come from CSV (one row per member/profile pair) or NDJSON (flat rows,
+or one member per line with a ``social_profiles`` list). Rows are validated
+and written in batches: per batch, members are upserted by email and
+profiles by ``(member, platform)`` with one lookup, one bulk insert and one
+bulk update per table, then committed. Invalid rows are reported and
+skipped; the rest of the batch is still imported.
+"""
+
+import csv
+import io
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.member import Member, SocialProfile
+from app.models.schemas import MemberImportRow
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "ndjson")
+MEMBER_FIELDS = ("name", "email", "position", "department")
+PROFILE_FIELDS = ("profile_url", "username")
+DEFAULT_BATCH_SIZE = 500
+
+# (row number, raw row or None, parse error or None)
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+class InvalidImportFormat(ValueError):
+    """Raised when an import format is unknown."""
+
+
+def detect_format(content_type: Optional[str]) -> Optional[str]:
+    """Guess the import format from a request content type."""
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "jsonl" in content_type or "json-seq" in content_type:
+        return "ndjson"
+    return None
+
+
+def _clean(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Strip strings and treat empty values as missing."""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        if value is not None:
+            cleaned[key.strip().lower()] = value
+    return cleaned
+
+
+def _parse_csv(text: str) -> Iterator[ParsedRow]:
+    reader = csv.DictReader(io.StringIO(text))
+    for row in reader:
+        yield reader.line_num, _clean(row), None
+
+
+def _parse_ndjson(text: str) -> Iterator[ParsedRow]:
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+
+        profiles = record.pop("social_profiles", None)
+        if not profiles:
+            yield line_number, _clean(record), None
+            continue
+        if not isinstance(profiles, list):
+            yield line_number, None, "social_profiles must be a list"
+            continue
+        for profile in profiles:
+            if not isinstance(profile, dict):
+                yield line_number, None, "Each social profile must be a JSON object"
+                continue
+            yield line_number, _clean({**record, **profile}), None
+
+
+def parse_rows(body: bytes, fmt: str) -> Iterator[ParsedRow]:
+    """Parse an upload into raw rows numbered by their line in the input."""
+    if fmt not in FORMATS:
+        raise InvalidImportFormat(f"Unsupported import format '{fmt}', expected one of {', '.join(FORMATS)}")
+    text = body.decode("utf-8-sig")
+    return _parse_csv(text) if fmt == "csv" else _parse_ndjson(text)
+
+
+def _batches(rows: Iterable[ParsedRow], size: int) -> Iterator[List[ParsedRow]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _error(row_number: int, errors: List[str]) -> Dict[str, Any]:
+    return {"type": "error", "row": row_number, "errors": errors}
+
+
+def _validation_messages(e: ValidationError) -> List[str]:
+    messages = []
+    for error in e.errors():
+        location = ".".join(str(part) for part in error["loc"])
+        messages.append(f"{location}: {error['msg']}" if location else error["msg"])
+    return messages
+
+
+class MemberImporter:
+    """Upsert members and social profiles from CSV or NDJSON in batches."""
+
+    def __init__(self, db: AsyncSession, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.stats = {
+            "rows": 0,
+            "rows_failed": 0,
+            "members_created": 0,
+            "members_updated": 0,
+            "profiles_created": 0,
+            "profiles_updated": 0,
+        }
+
+    async def run(self, rows: Iterable[ParsedRow]) -> AsyncIterator[Dict[str, Any]]:
+        """Import ``rows``, yielding an event per rejected row, one per batch and a final summary."""
+        for batch in _batches(rows, self.batch_size):
+            valid = []
+            for row_number, raw, parse_error in batch:
+                self.stats["rows"] += 1
+                if parse_error:
+                    self.stats["rows_failed"] += 1
+                    yield _error(row_number, [parse_error])
+                    continue
+                try:
+                    valid.append((row_number, MemberImportRow(**raw)))
+                except ValidationError as e:
+                    self.stats["rows_failed"] += 1
+                    yield _error(row_number, _validation_messages(e))
+
+            if valid:
+                try:
+                    await self._write_batch([row for _, row in valid])
+                    await self.db.commit()
+                except Exception as e:
+                    await self.db.rollback()
+                    logger.error(f"Member import batch failed: {e}")
+                    self.stats["rows_failed"] += len(valid)
+                    for row_number, _ in valid:
+                        yield _error(row_number, [f"Batch write failed: {e}"])
+
+            yield {"type": "progress", "rows": self.stats["rows"]}
+
+        yield {"type": "summary", **self.stats}
+
+    async def _write_batch(self, rows: List[MemberImportRow]):
+        member_ids = await self._upsert_members(rows)
+        await self._upsert_profiles(rows, member_ids)
+
+    async def _upsert_members(self, rows: List[MemberImportRow]) -> Dict[str, int]:
+        """Upsert the batch's members by email and return their ids by email."""
+        # Later rows for the same email win, but only for the fields they set
+        members: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            member = members.setdefault(row.email, {})
+            member.update({
+                field: getattr(row, field)
+                for field in MEMBER_FIELDS
+                if getattr(row, field) is not None
+            })
+
+        existing = dict((await self.db.execute(
+            select(Member.email, Member.id).where(Member.email.in_(members.keys()))
+        )).all())
+
+        updates = [{"id": existing[email], **values} for email, values in members.items() if email in existing]
+        inserts = [values for email, values in members.items() if email not in existing]
+        if updates:
+            await self.db.execute(update(Member), updates)
+        if inserts:
+            await self.db.execute(insert(Member), inserts)
+            existing.update((await self.db.execute(
+                select(Member.email, Member.id).where(Member.email.in_([m["email"] for m in inserts]))
+            )).all())
+
+        self.stats["members_updated"] += len(updates)
+        self.stats["members_created"] += len(inserts)
+        return existing
+
+    async def _upsert_profiles(self, rows: List[MemberImportRow], member_ids: Dict[str, int]):
+        """Upsert the batch's social profiles by ``(member, platform)``."""
+        profiles: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        for row in rows:
+            if row.platform is None:
+                continue
+            key = (member_ids[row.email], row.platform.lower())
+            profile = profiles.setdefault(key, {})
+            profile.update({
+                field: getattr(row, field)
+                for field in PROFILE_FIELDS
+                if getattr(row, field) is not None
+            })
+        if not profiles:
+            return
+
+        existing = {
+            (member_id, platform.lower()): profile_id
+            for profile_id, member_id, platform in await self.db.execute(
+                select(SocialProfile.id, SocialProfile.member_id, SocialProfile.platform).where(
+                    tuple_(SocialProfile.member_id, func.lower(SocialProfile.platform)).in_(list(profiles.keys()))
+                )
+            )
+        }
+
+        updates = [{"id": existing[key], **values} for key, values in profiles.items() if key in existing]
+        inserts = [
+            {"member_id": member_id, "platform": platform, **values}
+            for (member_id, platform), values in profiles.items()
+            if (member_id, platform) not in existing
+        ]
+        if updates:
+            await self.db.execute(update(SocialProfile), updates)
+        if inserts:
+            await self.db.execute(insert(SocialProfile), inserts)
+
+        self.stats["profiles_updated"] += len(updates)
+        self.stats["profiles_created"] += len(inserts)
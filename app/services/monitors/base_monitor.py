@@ -1,16 +1,23 @@
 """Base monitor class for social media platforms."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
-from app.models.member import SocialProfile, Activity
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config.settings import settings
+from app.models.member import SocialProfile, Activity, RawPayload
+from app.services.raw_log.segment_log import raw_payload_log
+
+logger = logging.getLogger(__name__)
 
 
 class BaseMonitor(ABC):
     """Base class for social media platform monitors."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.platform_name = self.get_platform_name()
     
@@ -34,6 +41,42 @@ class BaseMonitor(ABC):
         """Parse raw activity data into standardized format."""
         pass
     
+    def parse_payload(self, payload: bytes, profile: SocialProfile) -> List[Dict[str, Any]]:
+        """Parse a logged raw response into raw activities, for reprocessing.
+        
+        Unlike ``fetch_activities`` no monitoring time window is applied:
+        everything the response contained is returned.
+        """
+        raise NotImplementedError(f"{self.platform_name} payloads cannot be reprocessed")
+    
+    async def log_payload(self, profile: SocialProfile, payload: bytes, status_code: int, content_type: Optional[str] = None):
+        """Keep a fetched response in the raw payload log and index it.
+        
+        The index row is committed together with the profile's activities.
+        Logging failures never fail monitoring.
+        """
+        if not settings.raw_log_enabled:
+            return
+        fetched_at = datetime.utcnow()
+        try:
+            location, _ = await asyncio.to_thread(
+                raw_payload_log.append,
+                self.platform_name, profile.id, payload, fetched_at,
+                status_code=status_code, content_type=content_type, profile_url=profile.profile_url
+            )
+        except OSError as e:
+            logger.error(f"Failed to log {self.platform_name} payload for profile {profile.id}: {e}")
+            return
+        self.db.add(RawPayload(
+            platform=self.platform_name,
+            social_profile_id=profile.id,
+            fetched_at=fetched_at,
+            status_code=status_code,
+            segment=location.segment,
+            offset=location.offset,
+            length=location.length
+        ))
+    
     async def monitor_profile(self, profile: SocialProfile) -> List[Activity]:
         """Monitor a single profile and return new activities."""
         if not self.can_monitor(profile):
@@ -49,10 +92,12 @@ class BaseMonitor(ABC):
                 parsed_activity = self.parse_activity(raw_activity)
                 
                 # Check if activity already exists
-                existing_activity = self.db.query(Activity).filter(
-                    Activity.external_id == parsed_activity.get("external_id"),
-                    Activity.social_profile_id == profile.id
-                ).first()
+                existing_activity = (await self.db.execute(
+                    select(Activity.id).where(
+                        Activity.external_id == parsed_activity.get("external_id"),
+                        Activity.social_profile_id == profile.id
+                    )
+                )).first()
                 
                 if not existing_activity:
                     # Create new activity
@@ -67,18 +112,20 @@ class BaseMonitor(ABC):
             
             # Update last checked time
             profile.last_checked = datetime.utcnow()
-            self.db.commit()
+            await self.db.commit()
             
             return new_activities
             
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise Exception(f"Error monitoring {self.platform_name} profile: {str(e)}")
     
-    def get_existing_activity_ids(self, profile_id: int) -> List[str]:
+    async def get_existing_activity_ids(self, profile_id: int) -> List[str]:
         """Get list of existing activity external IDs for a profile."""
-        activities = self.db.query(Activity.external_id).filter(
-            Activity.social_profile_id == profile_id,
-            Activity.external_id.isnot(None)
-        ).all()
-        return [activity[0] for activity in activities] 
\ No newline at end of file
+        result = await self.db.execute(
+            select(Activity.external_id).where(
+                Activity.social_profile_id == profile_id,
+                Activity.external_id.isnot(None)
+            )
+        )
+        return list(result.scalars().all())
@@ -1,9 +1,10 @@
 """GitHub platform monitor."""
 
+import json
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 import httpx
 from app.services.monitors.base_monitor import BaseMonitor
@@ -50,6 +51,7 @@ class GitHubMonitor(BaseMonitor):
                     timeout=30
                 )
                 
+                await self.log_payload(profile, response.content, response.status_code, response.headers.get("content-type"))
                 if response.status_code == 200:
                     events = response.json()
                     # Use time-based filtering instead of count-based
@@ -71,13 +73,22 @@ class GitHubMonitor(BaseMonitor):
             pass
         return ""
     
-    def _parse_github_events(self, events: List[Dict], username: str, time_range_hours: int = 24) -> List[Dict[str, Any]]:
-        """Parse GitHub events into activities based on time range."""
+    def parse_payload(self, payload: bytes, profile: SocialProfile) -> List[Dict[str, Any]]:
+        """Parse a logged events API response."""
+        events = json.loads(payload)
+        if not isinstance(events, list):
+            return []
+        return self._parse_github_events(events, self._extract_github_username(profile.profile_url), time_range_hours=None)
+    
+    def _parse_github_events(self, events: List[Dict], username: str, time_range_hours: Optional[int] = 24) -> List[Dict[str, Any]]:
+        """Parse GitHub events into activities based on time range (``None``: all events)."""
         activities = []
         
         # Calculate time range cutoff
-        cutoff_time = datetime.utcnow().replace(tzinfo=None) - timedelta(hours=time_range_hours)
-        logger.info(f"Processing GitHub events from {cutoff_time} to now")
+        cutoff_time = None
+        if time_range_hours is not None:
+            cutoff_time = datetime.utcnow().replace(tzinfo=None) - timedelta(hours=time_range_hours)
+            logger.info(f"Processing GitHub events from {cutoff_time} to now")
         
         processed_count = 0
         filtered_count = 0
@@ -86,7 +97,7 @@ class GitHubMonitor(BaseMonitor):
             try:
                 # Check if event is within time range
                 event_time = datetime.fromisoformat(event.get("created_at", "").replace("Z", "+00:00")).replace(tzinfo=None)
-                if event_time < cutoff_time:
+                if cutoff_time is not None and event_time < cutoff_time:
                     # Stop processing if we reach events outside time range
                     logger.info(f"Reached event outside time range ({event_time}), stopping processing")
                     break
@@ -106,7 +117,8 @@ class GitHubMonitor(BaseMonitor):
                         "content": content,
                         "url": f"https://github.com/{repo_name}" if repo_name else "",
                         "published_at": event_time,
-                        "external_id": f"github_{event.get('id')}"
+                        "external_id": f"github_{event.get('id')}",
+                        **self._structured_fields(event)
                     })
                     filtered_count += 1
                     
@@ -114,9 +126,32 @@ class GitHubMonitor(BaseMonitor):
                 logger.error(f"Error parsing GitHub event: {e}")
                 continue
         
-        logger.info(f"Processed {processed_count} events, filtered {filtered_count} activities within {time_range_hours}h time range")
+        window = f"within {time_range_hours}h time range" if time_range_hours is not None else "without time range"
+        logger.info(f"Processed {processed_count} events, filtered {filtered_count} activities {window}")
         return activities
     
+    def _structured_fields(self, event: Dict) -> Dict[str, Any]:
+        """Extract the queryable event fields stored alongside the formatted text."""
+        payload = event.get("payload") or {}
+        repo = event.get("repo") or {}
+        
+        commit_count = None
+        if event.get("type") == "PushEvent":
+            # ``size`` counts every commit; the ``commits`` list is capped at 20
+            commit_count = payload.get("size", len(payload.get("commits", [])))
+        
+        ref = payload.get("ref")
+        if ref is None and payload.get("pull_request"):
+            ref = (payload["pull_request"].get("head") or {}).get("ref")
+        
+        return {
+            "repo_full_name": repo.get("name") or None,
+            "event_action": payload.get("action"),
+            "commit_count": commit_count,
+            "ref": ref,
+            "raw_payload": payload,
+        }
+    
     def _parse_event_type(self, event: Dict, username: str) -> tuple:
         """Parse GitHub event type and extract relevant information."""
         event_type = event.get("type", "")
@@ -181,5 +216,10 @@ class GitHubMonitor(BaseMonitor):
             "content": raw_activity.get("content", ""),
             "url": raw_activity.get("url"),
             "external_id": raw_activity.get("external_id"),
-            "published_at": raw_activity.get("published_at")
+            "published_at": raw_activity.get("published_at"),
+            "repo_full_name": raw_activity.get("repo_full_name"),
+            "event_action": raw_activity.get("event_action"),
+            "commit_count": raw_activity.get("commit_count"),
+            "ref": raw_activity.get("ref"),
+            "raw_payload": raw_activity.get("raw_payload")
         }
@@ -1,5 +1,6 @@
 """LinkedIn platform monitor."""
 
+import hashlib
 import logging
 import re
 from datetime import datetime
@@ -47,16 +48,20 @@ class LinkedInMonitor(BaseMonitor):
                     timeout=30
                 )
                 
+                await self.log_payload(profile, response.content, response.status_code, response.headers.get("content-type"))
                 if response.status_code == 200:
-                    # Parse the page content
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    activities = self._parse_linkedin_page(soup, profile)
+                    activities = self.parse_payload(response.content, profile)
                 
         except Exception as e:
             logger.error(f"Error fetching LinkedIn activities: {e}")
         
         return activities
     
+    def parse_payload(self, payload: bytes, profile: SocialProfile) -> List[Dict[str, Any]]:
+        """Parse a profile page."""
+        soup = BeautifulSoup(payload, 'html.parser')
+        return self._parse_linkedin_page(soup, profile)
+    
     def _parse_linkedin_page(self, soup: BeautifulSoup, profile: SocialProfile) -> List[Dict[str, Any]]:
         """Parse LinkedIn page content for activities."""
         activities = []
@@ -95,7 +100,8 @@ class LinkedInMonitor(BaseMonitor):
                         "url": url,
                         "published_at": published_at,
                         "activity_type": "post",
-                        "external_id": f"linkedin_{hash(content + url)}"
+                        # Stable across processes, unlike hash(), so reprocessing matches rows
+                        "external_id": f"linkedin_{hashlib.sha1((content + url).encode()).hexdigest()[:16]}"
                     })
                     
             except Exception as e:
@@ -4,7 +4,8 @@ import logging
 import asyncio
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.member import SocialProfile, Activity
 from app.services.monitors.linkedin_monitor import LinkedInMonitor
 from app.services.monitors.github_monitor import GitHubMonitor
@@ -16,7 +17,7 @@ logger = logging.getLogger(__name__)
 class MonitorManager:
     """Manages all social media platform monitors."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.monitors = {
             "linkedin": LinkedInMonitor(db),
@@ -28,9 +29,9 @@ class MonitorManager:
         results = {}
         
         # Get all active social profiles
-        profiles = self.db.query(SocialProfile).filter(
-            SocialProfile.is_active == True
-        ).all()
+        profiles = (await self.db.scalars(
+            select(SocialProfile).where(SocialProfile.is_active == True)
+        )).all()
         
         # Group profiles by platform
         profiles_by_platform = {}
@@ -47,11 +48,16 @@ class MonitorManager:
                 platform_activities = []
                 
                 for profile in platform_profiles:
+                    # A failed profile rolls back the session, which expires
+                    # the rest; reload them explicitly instead of lazily
+                    if inspect(profile).expired_attributes:
+                        await self.db.refresh(profile)
+                    profile_id = profile.id
                     try:
                         activities = await monitor.monitor_profile(profile)
                         platform_activities.extend(activities)
                     except Exception as e:
-                        logger.error(f"Error monitoring profile {profile.id}: {e}")
+                        logger.error(f"Error monitoring profile {profile_id}: {e}")
                 
                 results[platform] = platform_activities
         
@@ -59,10 +65,12 @@ class MonitorManager:
     
     async def monitor_specific_profile(self, profile_id: int) -> List[Activity]:
         """Monitor a specific social profile."""
-        profile = self.db.query(SocialProfile).filter(
-            SocialProfile.id == profile_id,
-            SocialProfile.is_active == True
-        ).first()
+        profile = (await self.db.scalars(
+            select(SocialProfile).where(
+                SocialProfile.id == profile_id,
+                SocialProfile.is_active == True
+            )
+        )).first()
         
         if not profile:
             return []
@@ -78,23 +86,27 @@ class MonitorManager:
             logger.error(f"Error monitoring profile {profile_id}: {e}")
             return []
     
-    def get_monitoring_stats(self) -> Dict[str, Any]:
+    async def get_monitoring_stats(self) -> Dict[str, Any]:
         """Get monitoring statistics."""
-        total_profiles = self.db.query(SocialProfile).filter(
-            SocialProfile.is_active == True
-        ).count()
+        total_profiles = await self.db.scalar(
+            select(func.count(SocialProfile.id)).where(SocialProfile.is_active == True)
+        )
         
         profiles_by_platform = {}
         for platform in self.monitors.keys():
-            count = self.db.query(SocialProfile).filter(
-                SocialProfile.platform == platform,
-                SocialProfile.is_active == True
-            ).count()
+            count = await self.db.scalar(
+                select(func.count(SocialProfile.id)).where(
+                    SocialProfile.platform == platform,
+                    SocialProfile.is_active == True
+                )
+            )
             profiles_by_platform[platform] = count
         
-        recent_activities = self.db.query(Activity).filter(
-            Activity.created_at >= datetime.utcnow() - timedelta(days=7)
-        ).count()
+        recent_activities = await self.db.scalar(
+            select(func.count(Activity.id)).where(
+                Activity.created_at >= datetime.utcnow() - timedelta(days=7)
+            )
+        )
         
         return {
             "total_profiles": total_profiles,
@@ -103,22 +115,24 @@ class MonitorManager:
             "supported_platforms": list(self.monitors.keys())
         }
     
-    def get_profiles_needing_update(self, hours: int = 24) -> List[SocialProfile]:
+    async def get_profiles_needing_update(self, hours: int = 24) -> List[SocialProfile]:
         """Get profiles that haven't been checked recently."""
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         
-        return self.db.query(SocialProfile).filter(
-            SocialProfile.is_active == True,
-            (SocialProfile.last_checked.is_(None) | 
-             SocialProfile.last_checked <= cutoff_time)
-        ).all()
+        return (await self.db.scalars(
+            select(SocialProfile).where(
+                SocialProfile.is_active == True,
+                (SocialProfile.last_checked.is_(None) | 
+                 SocialProfile.last_checked <= cutoff_time)
+            )
+        )).all()
     
     async def run_scheduled_monitoring(self) -> Dict[str, Any]:
         """Run scheduled monitoring for all profiles."""
         logger.info(f"Starting scheduled monitoring at {datetime.utcnow()}")
         
         # Get profiles that need updating
-        profiles_to_update = self.get_profiles_needing_update()
+        profiles_to_update = await self.get_profiles_needing_update()
         
         if not profiles_to_update:
             logger.info("No profiles need updating")
@@ -0,0 +1 @@
+"""Incremental processing of newly ingested data."""
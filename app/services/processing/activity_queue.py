@@ -0,0 +1,190 @@
+"""Incremental processing of new activities.
+
+``Activity.is_processed`` turns the activities table into a work queue.
+Consumers claim the oldest unprocessed rows in id order, stamping
+``claimed_at`` so concurrent consumers skip them. The consumer then marks
+them processed, or releases them on failure. A claim whose consumer dies
+expires after ``activity_queue_lease_seconds`` and is picked up again, so
+every activity is handled at least once.
+
+``ActivityPipeline`` runs registered stages (notifications, rollups, ...)
+over each claimed batch, so downstream work only touches new rows instead
+of re-scanning date windows.
+"""
+
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config.settings import settings
+from app.core.database import database
+from app.core.database.projections import ActivityRecord, activity_records_statement, fetch_activity_records
+from app.models.member import Activity
+
+logger = logging.getLogger(__name__)
+
+# Stage handler: receives the claimed batch and the session it was claimed on
+StageHandler = Callable[[List[ActivityRecord], AsyncSession], Awaitable[None]]
+
+
+class ActivityQueue:
+    """Claim, complete and release batches of unprocessed activities."""
+
+    def __init__(self, db: AsyncSession, lease_seconds: Optional[int] = None):
+        self.db = db
+        self.lease_seconds = settings.activity_queue_lease_seconds if lease_seconds is None else lease_seconds
+
+    def _claimable(self, now: datetime):
+        expired = now - timedelta(seconds=self.lease_seconds)
+        return (
+            Activity.is_processed == False,
+            or_(Activity.claimed_at.is_(None), Activity.claimed_at < expired),
+        )
+
+    async def claim(self, batch_size: Optional[int] = None) -> List[ActivityRecord]:
+        """Claim up to ``batch_size`` of the oldest unprocessed activities."""
+        batch_size = batch_size or settings.activity_queue_batch_size
+        now = datetime.utcnow()
+        candidates = (
+            select(Activity.id)
+            .where(*self._claimable(now))
+            .order_by(Activity.id)
+            .limit(batch_size)
+        )
+        if self.db.get_bind().dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+
+        ids = await self._write(
+            update(Activity)
+            .where(Activity.id.in_(candidates.scalar_subquery()))
+            .values(claimed_at=now)
+            .returning(Activity.id)
+            .execution_options(synchronize_session=False),
+            returning=True
+        )
+        if not ids:
+            return []
+
+        return await fetch_activity_records(
+            self.db,
+            activity_records_statement(Activity.id.in_(ids), order_by=Activity.id, with_member_name=True)
+        )
+
+    async def complete(self, ids: Sequence[int]):
+        """Mark claimed activities as processed."""
+        await self._finish(ids, is_processed=True)
+
+    async def release(self, ids: Sequence[int]):
+        """Return claimed activities to the queue."""
+        await self._finish(ids, is_processed=False)
+
+    async def _finish(self, ids: Sequence[int], is_processed: bool):
+        if not ids:
+            return
+        await self._write(
+            update(Activity)
+            .where(Activity.id.in_(ids))
+            .values(is_processed=is_processed, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _write(self, statement, returning: bool = False) -> List[Any]:
+        """Execute and commit a write; with ``returning``, give the first column of its rows.
+
+        In SQLite writer mode the statement goes through the shared write
+        queue, which groups the claims and completions of concurrent
+        consumers into one transaction on the writer connection.
+        """
+        if not self._uses_write_queue():
+            result = await self.db.execute(statement)
+            values = result.scalars().all() if returning else []
+            await self.db.commit()
+            return values
+
+        def job(conn) -> List[Any]:
+            result = conn.execute(statement)
+            return result.scalars().all() if returning else []
+
+        # End the session's own transaction first so it doesn't hold the writer
+        await self.db.commit()
+        return await database.get_write_queue().run(job)
+
+    def _uses_write_queue(self) -> bool:
+        if not database.sqlite_writer_mode:
+            return False
+        # The queue writes to the application database; sessions on any other one write directly
+        return self.db.get_bind(Activity) in (database.async_engine.sync_engine, database.async_read_engine.sync_engine)
+
+    @asynccontextmanager
+    async def claimed(self, batch_size: Optional[int] = None) -> AsyncIterator[List[ActivityRecord]]:
+        """Claim a batch; completes it on success and releases it on error."""
+        batch = await self.claim(batch_size)
+        ids = [record.id for record in batch]
+        try:
+            yield batch
+        except BaseException:
+            await self.db.rollback()
+            await self.release(ids)
+            raise
+        await self.complete(ids)
+
+    async def stats(self) -> Dict[str, Any]:
+        """Queue depth, claimed rows and age of the oldest queued activity."""
+        now = datetime.utcnow()
+        pending, claimed, oldest = (await self.db.execute(
+            select(
+                func.count(Activity.id),
+                func.count(Activity.claimed_at),
+                func.min(Activity.created_at)
+            ).where(Activity.is_processed == False)
+        )).one()
+        return {
+            "pending": pending,
+            "claimed": claimed,
+            "oldest_pending_age_seconds": (now - oldest).total_seconds() if oldest else None,
+        }
+
+
+class ActivityPipeline:
+    """Run registered stages over newly ingested activities, batch by batch."""
+
+    def __init__(self):
+        self.stages: Dict[str, StageHandler] = {}
+
+    def register(self, name: str, handler: StageHandler):
+        """Add a stage; stages run in registration order for every batch."""
+        self.stages[name] = handler
+
+    async def run(
+        self,
+        db: AsyncSession,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Process queued activities until the queue is empty or ``max_batches`` is reached.
+
+        A failing stage releases its batch and stops the run; the batch is
+        retried on the next run.
+        """
+        queue = ActivityQueue(db)
+        result = {"batches": 0, "activities": 0, "stage_seconds": {name: 0.0 for name in self.stages}}
+        while max_batches is None or result["batches"] < max_batches:
+            async with queue.claimed(batch_size) as batch:
+                if not batch:
+                    break
+                for name, handler in self.stages.items():
+                    start = time.perf_counter()
+                    await handler(batch, db)
+                    result["stage_seconds"][name] += time.perf_counter() - start
+            result["batches"] += 1
+            result["activities"] += len(batch)
+        logger.info(f"Activity pipeline processed {result['activities']} activities in {result['batches']} batches")
+        return result
+
+
+# Shared pipeline; stages are registered at application startup
+activity_pipeline = ActivityPipeline()
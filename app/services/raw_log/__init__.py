@@ -0,0 +1 @@
+"""Raw platform payload log and reprocessing."""
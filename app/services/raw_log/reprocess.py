@@ -0,0 +1,201 @@
+"""Re-run the current parsers over logged payloads and upsert the results.
+
+Parsing happens in worker processes, one chunk of frames per task. The
+parent upserts the parsed activities by profile and ``external_id`` in
+append order, so when several payloads contain the same event the newest
+fetch wins.
+
+Activities a replay creates are stored as already processed, so recovered
+history does not flood the activity pipeline (and its notifications);
+pass ``queue_new=True`` to queue them like freshly monitored ones.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config.settings import settings
+from app.models.member import Activity, RawPayload, SocialProfile
+from app.services.raw_log.segment_log import RawLogError, RawPayloadLog, raw_payload_log
+
+logger = logging.getLogger(__name__)
+
+# Frames handed to one worker task
+CHUNK_SIZE = 50
+
+# (segment, offset, length, platform, social_profile_id, member_id, profile_url)
+Entry = Tuple[int, int, int, str, int, int, str]
+
+
+def _monitor_classes():
+    from app.services.monitors.github_monitor import GitHubMonitor
+    from app.services.monitors.linkedin_monitor import LinkedInMonitor
+    return {"github": GitHubMonitor, "linkedin": LinkedInMonitor}
+
+
+def parse_entries(log_dir: str, entries: List[Entry]) -> Dict[str, Any]:
+    """Worker: read and parse a chunk of frames.
+
+    Returns the activity rows to upsert and the number of frames that
+    could not be read or parsed.
+    """
+    log = RawPayloadLog(log_dir)
+    monitors = {platform: cls(None) for platform, cls in _monitor_classes().items()}
+    rows, errors = [], 0
+    for segment, offset, length, platform, profile_id, member_id, profile_url in entries:
+        monitor = monitors.get(platform)
+        if monitor is None:
+            errors += 1
+            continue
+        profile = SimpleNamespace(id=profile_id, member_id=member_id, platform=platform, profile_url=profile_url)
+        try:
+            header, payload = log.read(segment, offset, length)
+            if header.get("status_code", 200) != 200:
+                continue
+            for raw in monitor.parse_payload(payload, profile):
+                rows.append({
+                    "member_id": member_id,
+                    "social_profile_id": profile_id,
+                    "platform": platform,
+                    **monitor.parse_activity(raw),
+                })
+        except (RawLogError, ValueError, NotImplementedError) as e:
+            logger.warning(f"Skipping frame {segment}:{offset}: {e}")
+            errors += 1
+    return {"rows": rows, "errors": errors}
+
+
+def _chunks(entries: Iterable[Entry], size: int) -> Iterator[List[Entry]]:
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def upsert_activities(db: Session, rows: List[Dict[str, Any]], queue_new: bool = False) -> Tuple[int, int]:
+    """Insert new activities and refresh existing ones.
+
+    Rows are matched on ``(social_profile_id, external_id)``, like the
+    monitors' duplicate check. New rows are marked processed unless
+    ``queue_new`` is set.
+    """
+    latest = {}
+    for row in rows:
+        if row.get("external_id"):
+            latest[(row["social_profile_id"], row["external_id"])] = row  # later payloads win
+    if not latest:
+        return 0, 0
+
+    existing = {}
+    for activity in db.query(Activity).filter(
+        Activity.external_id.in_([external_id for _, external_id in latest])
+    ):
+        existing[(activity.social_profile_id, activity.external_id)] = activity
+    # external_id is unique across profiles, so another profile's row blocks an insert
+    taken = {external_id for _, external_id in existing}
+    created = updated = 0
+    for key, row in latest.items():
+        activity = existing.get(key)
+        if activity is None:
+            if row["external_id"] in taken:
+                logger.warning(f"Skipping {row['external_id']}: stored for another profile")
+                continue
+            db.add(Activity(**row, is_processed=not queue_new))
+            created += 1
+        else:
+            for key, value in row.items():
+                if key not in ("member_id", "social_profile_id", "platform"):
+                    setattr(activity, key, value)
+            updated += 1
+    db.commit()
+    return created, updated
+
+
+def reprocess(
+    db: Session,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    platform: Optional[str] = None,
+    profile_id: Optional[int] = None,
+    workers: Optional[int] = None,
+    log: Optional[RawPayloadLog] = None,
+    chunk_size: int = CHUNK_SIZE,
+    queue_new: bool = False
+) -> Dict[str, int]:
+    """Reparse the payloads fetched in ``[start, end)`` and upsert their activities.
+
+    ``workers`` of 0 uses one process per CPU; 1 parses in this process.
+    ``queue_new`` sends the activities the replay creates through the
+    activity pipeline.
+    """
+    log = log or raw_payload_log
+    workers = settings.raw_log_reprocess_workers if workers is None else workers
+
+    query = (
+        db.query(
+            RawPayload.segment, RawPayload.offset, RawPayload.length, RawPayload.platform,
+            RawPayload.social_profile_id, SocialProfile.member_id, SocialProfile.profile_url
+        )
+        .join(SocialProfile, SocialProfile.id == RawPayload.social_profile_id)
+        .order_by(RawPayload.segment, RawPayload.offset)
+    )
+    if start:
+        query = query.filter(RawPayload.fetched_at >= start)
+    if end:
+        query = query.filter(RawPayload.fetched_at < end)
+    if platform:
+        query = query.filter(RawPayload.platform == platform.lower())
+    if profile_id:
+        query = query.filter(RawPayload.social_profile_id == profile_id)
+    entries = [tuple(row) for row in query]
+
+    stats = {"payloads": len(entries), "parse_errors": 0, "activities_created": 0, "activities_updated": 0}
+    chunks = list(_chunks(entries, chunk_size))
+    log_dir = str(log.directory)
+
+    def apply(result):
+        stats["parse_errors"] += result["errors"]
+        created, updated = upsert_activities(db, result["rows"], queue_new=queue_new)
+        stats["activities_created"] += created
+        stats["activities_updated"] += updated
+
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            apply(parse_entries(log_dir, chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None) as pool:
+            # map() yields in submission order, keeping "newest fetch wins"
+            for result in pool.map(parse_entries, [log_dir] * len(chunks), chunks):
+                apply(result)
+
+    logger.info(f"Reprocessed {stats['payloads']} payloads: {stats}")
+    return stats
+
+
+def rebuild_index(db: Session, log: Optional[RawPayloadLog] = None) -> int:
+    """Recreate the ``raw_payloads`` index by scanning every segment."""
+    log = log or raw_payload_log
+    db.query(RawPayload).delete()
+    count = 0
+    for segment in log.segments():
+        for location, header, _ in log.scan(segment):
+            db.add(RawPayload(
+                platform=header["platform"],
+                social_profile_id=header["social_profile_id"],
+                fetched_at=datetime.fromisoformat(header["fetched_at"]),
+                status_code=header.get("status_code"),
+                segment=location.segment,
+                offset=location.offset,
+                length=location.length
+            ))
+            count += 1
+    db.commit()
+    return count
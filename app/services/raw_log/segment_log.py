@@ -0,0 +1,176 @@
+"""Append-only, segmented log of raw platform responses.
+
+Every response a monitor fetches is written as one frame::
+
+    magic (4 bytes) | body length (4) | crc32 of body (4) | body
+
+where ``body`` is zlib-compressed ``<header JSON>\\n<raw response bytes>``.
+The header makes frames self-describing, so the ``raw_payloads`` index
+can be rebuilt from the segments alone.
+
+Frames are appended to the newest numbered segment file (``00000001.seg``,
+``00000002.seg``, ...); once it reaches ``raw_log_segment_bytes`` a new
+segment is started and the old one is never written again.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock is all we get
+    fcntl = None
+
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RPL1"
+FRAME_HEADER = struct.Struct(">4sII")
+SEGMENT_SUFFIX = ".seg"
+
+
+class RawLogError(Exception):
+    """Raised for corrupt or missing log frames."""
+
+
+@dataclass
+class FrameLocation:
+    """Where an appended frame ended up."""
+    segment: int
+    offset: int
+    length: int
+
+
+def _segment_name(segment: int) -> str:
+    return f"{segment:08d}{SEGMENT_SUFFIX}"
+
+
+def encode_frame(header: Dict[str, Any], payload: bytes, level: int = 6) -> bytes:
+    """Serialize one record into a frame."""
+    body = zlib.compress(json.dumps(header, separators=(",", ":")).encode() + b"\n" + payload, level)
+    return FRAME_HEADER.pack(MAGIC, len(body), zlib.crc32(body)) + body
+
+
+def decode_frame(frame: bytes) -> Tuple[Dict[str, Any], bytes]:
+    """Parse a frame back into its header and raw payload."""
+    if len(frame) < FRAME_HEADER.size:
+        raise RawLogError("Truncated frame")
+    magic, length, crc = FRAME_HEADER.unpack_from(frame)
+    body = frame[FRAME_HEADER.size:FRAME_HEADER.size + length]
+    if magic != MAGIC or len(body) != length:
+        raise RawLogError("Truncated or misaligned frame")
+    if zlib.crc32(body) != crc:
+        raise RawLogError("Frame checksum mismatch")
+    header, _, payload = zlib.decompress(body).partition(b"\n")
+    return json.loads(header), payload
+
+
+class RawPayloadLog:
+    """Append and read frames in a directory of segment files."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_bytes: Optional[int] = None,
+        compress_level: Optional[int] = None
+    ):
+        self.directory = Path(directory or settings.raw_log_dir)
+        self.segment_bytes = segment_bytes or settings.raw_log_segment_bytes
+        self.compress_level = settings.raw_log_compress_level if compress_level is None else compress_level
+        self._lock = threading.Lock()
+
+    def segments(self) -> List[int]:
+        """Segment numbers present on disk, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            int(path.stem) for path in self.directory.glob(f"*{SEGMENT_SUFFIX}") if path.stem.isdigit()
+        )
+
+    def segment_path(self, segment: int) -> Path:
+        return self.directory / _segment_name(segment)
+
+    def append(
+        self,
+        platform: str,
+        social_profile_id: int,
+        payload: bytes,
+        fetched_at: Optional[datetime] = None,
+        **metadata: Any
+    ) -> Tuple[FrameLocation, Dict[str, Any]]:
+        """Append one raw response; returns its location and frame header."""
+        header = {
+            "platform": platform,
+            "social_profile_id": social_profile_id,
+            "fetched_at": (fetched_at or datetime.utcnow()).isoformat(),
+            **metadata,
+        }
+        frame = encode_frame(header, payload, self.compress_level)
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            segments = self.segments()
+            segment = segments[-1] if segments else 1
+            path = self.segment_path(segment)
+            if path.exists() and path.stat().st_size and path.stat().st_size + len(frame) > self.segment_bytes:
+                segment += 1
+                path = self.segment_path(segment)
+
+            with open(path, "ab") as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(frame)
+                    f.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+
+        return FrameLocation(segment, offset, len(frame)), header
+
+    def read(self, segment: int, offset: int, length: int) -> Tuple[Dict[str, Any], bytes]:
+        """Read the frame at a known location."""
+        try:
+            with open(self.segment_path(segment), "rb") as f:
+                f.seek(offset)
+                frame = f.read(length)
+        except FileNotFoundError:
+            raise RawLogError(f"Segment {segment} is missing")
+        return decode_frame(frame)
+
+    def scan(self, segment: int) -> Iterator[Tuple[FrameLocation, Dict[str, Any], bytes]]:
+        """Yield every frame of a segment in append order.
+
+        Stops at a torn tail (a frame cut short by a crash mid-write).
+        """
+        with open(self.segment_path(segment), "rb") as f:
+            while True:
+                offset = f.tell()
+                head = f.read(FRAME_HEADER.size)
+                if not head:
+                    return
+                if len(head) < FRAME_HEADER.size:
+                    logger.warning(f"Torn frame at end of segment {segment} (offset {offset})")
+                    return
+                _, length, _ = FRAME_HEADER.unpack(head)
+                frame = head + f.read(length)
+                try:
+                    header, payload = decode_frame(frame)
+                except RawLogError as e:
+                    logger.warning(f"Stopping scan of segment {segment} at offset {offset}: {e}")
+                    return
+                yield FrameLocation(segment, offset, len(frame)), header, payload
+
+
+# Shared log used by the monitors
+raw_payload_log = RawPayloadLog()
@@ -0,0 +1,213 @@
+"""Full-text search over activity titles and content."""
+
+import base64
+import json
+import logging
+import re
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.database.fulltext import FTS_TABLE
+from app.models.member import Activity
+
+logger = logging.getLogger(__name__)
+
+HIGHLIGHT_OPEN = "<mark>"
+HIGHLIGHT_CLOSE = "</mark>"
+
+
+class InvalidSearchQuery(ValueError):
+    """Raised when a search query or cursor cannot be used."""
+
+
+class ActivitySearch:
+    """Ranked, highlighted and cursor-paginated activity search."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.dialect = db.get_bind().dialect.name
+
+    def search(
+        self,
+        query: str,
+        platform: Optional[str] = None,
+        member_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search activities, best matches first.
+
+        Returns ``{"items": [...], "next_cursor": str | None}`` where each item
+        carries the matching ``Activity``, its score and highlighted fragments.
+        """
+        filters, params = self._build_filters(platform, member_id, start_date, end_date)
+        params["limit"] = limit + 1
+
+        if cursor:
+            score, last_id = self._decode_cursor(cursor)
+            filters.append("(score > :cursor_score OR (score = :cursor_score AND id > :cursor_id))")
+            params["cursor_score"] = score
+            params["cursor_id"] = last_id
+
+        # Rank and limit first; highlighting is the expensive part of a
+        # full-text query, so it only runs on the rows of the page
+        if self.dialect == "sqlite":
+            params["query"] = self._to_fts5_query(query)
+            ranked = f"""
+                SELECT a.id AS id,
+                       a.platform AS platform,
+                       a.member_id AS member_id,
+                       a.created_at AS created_at,
+                       bm25({FTS_TABLE}, 10.0, 1.0) AS score
+                FROM {FTS_TABLE}
+                JOIN activities a ON a.id = {FTS_TABLE}.rowid
+                WHERE {FTS_TABLE} MATCH :query
+            """
+            highlighted = f"""
+                SELECT page.id AS id,
+                       page.score AS score,
+                       highlight({FTS_TABLE}, 0, :hl_open, :hl_close) AS title_highlight,
+                       snippet({FTS_TABLE}, 1, :hl_open, :hl_close, '…', 24) AS content_snippet
+                FROM ({{page}}) AS page
+                JOIN {FTS_TABLE} ON {FTS_TABLE}.rowid = page.id
+                WHERE {FTS_TABLE} MATCH :query
+            """
+        elif self.dialect == "postgresql":
+            params["query"] = query
+            ranked = """
+                SELECT a.id AS id,
+                       a.platform AS platform,
+                       a.member_id AS member_id,
+                       a.created_at AS created_at,
+                       -ts_rank_cd(a.search_vector, q) AS score
+                FROM activities a, websearch_to_tsquery('simple', :query) q
+                WHERE a.search_vector @@ q
+            """
+            highlighted = """
+                SELECT page.id AS id,
+                       page.score AS score,
+                       ts_headline('simple', coalesce(a.title, ''), q,
+                           'StartSel=' || :hl_open || ', StopSel=' || :hl_close || ', HighlightAll=true') AS title_highlight,
+                       ts_headline('simple', coalesce(a.content, ''), q,
+                           'StartSel=' || :hl_open || ', StopSel=' || :hl_close || ', MaxWords=35, MinWords=15') AS content_snippet
+                FROM ({page}) AS page
+                JOIN activities a ON a.id = page.id,
+                     websearch_to_tsquery('simple', :query) q
+            """
+        else:
+            raise InvalidSearchQuery(f"Full-text search is not supported on {self.dialect}")
+
+        params["hl_open"] = HIGHLIGHT_OPEN
+        params["hl_close"] = HIGHLIGHT_CLOSE
+
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        page = f"""
+            SELECT id, score
+            FROM ({ranked}) AS hits
+            {where}
+            ORDER BY score, id
+            LIMIT :limit
+        """
+        sql = f"""
+            {highlighted.format(page=page)}
+            ORDER BY score, id
+        """
+        rows = self.db.execute(text(sql), params).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Load full activities for the page in a single query
+        activities = {}
+        if rows:
+            ids = [row.id for row in rows]
+            activities = {
+                activity.id: activity
+                for activity in self.db.query(Activity).filter(Activity.id.in_(ids)).all()
+            }
+
+        items = []
+        for row in rows:
+            activity = activities.get(row.id)
+            if activity is None:
+                continue
+            items.append({
+                "activity": activity,
+                "score": float(row.score),
+                "title_highlight": row.title_highlight,
+                "content_snippet": row.content_snippet
+            })
+
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = self._encode_cursor(float(last.score), last.id)
+
+        return {"items": items, "next_cursor": next_cursor}
+
+    def _build_filters(
+        self,
+        platform: Optional[str],
+        member_id: Optional[int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Build filter clauses applied on top of the text match."""
+        filters = []
+        params: Dict[str, Any] = {}
+
+        if platform:
+            filters.append("platform = :platform")
+            params["platform"] = platform
+
+        if member_id:
+            filters.append("member_id = :member_id")
+            params["member_id"] = member_id
+
+        if start_date:
+            filters.append("created_at >= :start_date")
+            params["start_date"] = start_date
+
+        if end_date:
+            filters.append("created_at < :end_date")
+            params["end_date"] = end_date
+
+        return filters, params
+
+    @staticmethod
+    def _to_fts5_query(query: str) -> str:
+        """Turn free text into a safe FTS5 query.
+
+        Each term is quoted so FTS5 operators in user input are matched
+        literally; a trailing ``*`` on a term keeps prefix matching.
+        """
+        terms = []
+        for token in re.findall(r"\S+", query):
+            prefix = token.endswith("*")
+            token = token.rstrip("*").replace('"', '""')
+            if not token:
+                continue
+            terms.append(f'"{token}"' + ("*" if prefix else ""))
+
+        if not terms:
+            raise InvalidSearchQuery("Search query is empty")
+
+        return " ".join(terms)
+
+    @staticmethod
+    def _encode_cursor(score: float, activity_id: int) -> str:
+        """Encode a keyset position as an opaque cursor."""
+        raw = json.dumps({"s": score, "id": activity_id}).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, int]:
+        """Decode a cursor produced by ``_encode_cursor``."""
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return float(data["s"]), int(data["id"])
+        except Exception:
+            raise InvalidSearchQuery("Invalid cursor")
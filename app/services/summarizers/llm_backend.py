@@ -0,0 +1,286 @@
+"""Async chat-completion backends for the summarizer.
+
+Both backends send their requests through one pooled ``httpx.AsyncClient``,
+so concurrent summaries reuse connections and never block the event loop:
+
+- ``OpenAIBackend``: the ``AsyncOpenAI`` SDK client
+- ``DashScopeBackend``: Aliyun DashScope's OpenAI-compatible endpoint, called directly
+
+Backends make a single attempt. Rate limits, server errors and connection
+failures raise ``LLMRetryableError``; retries and rate limiting are the
+job of ``llm_scheduler``, which ``get_llm_backend`` puts in front of them.
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+import openai
+from openai import AsyncOpenAI
+
+from app.core.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+Messages = List[Dict[str, str]]
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class LLMError(Exception):
+    """Raised when the LLM API returns an error."""
+
+
+class LLMRetryableError(LLMError):
+    """A rate limit or transient failure; ``retry_after`` is the server's hint in seconds."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None, rate_limited: bool = False):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.rate_limited = rate_limited
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds to wait from ``retry-after-ms`` / ``retry-after`` headers, if present."""
+    if headers is None:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            moment = parsedate_to_datetime(value)
+            return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+def _openai_error(e: Exception) -> Exception:
+    """Map an SDK exception to ``LLMRetryableError`` where a retry can help."""
+    if isinstance(e, openai.APIStatusError) and _is_retryable_status(e.status_code):
+        return LLMRetryableError(
+            f"OpenAI API error: {e.status_code} {e.message}",
+            retry_after=parse_retry_after(e.response.headers),
+            rate_limited=e.status_code == 429
+        )
+    if isinstance(e, openai.APIConnectionError):  # includes timeouts
+        return LLMRetryableError(f"OpenAI API connection error: {e}")
+    return e
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared pooled HTTP client for LLM calls.
+
+    Connections belong to the event loop that opened them, so a new client
+    is created if the loop has changed (e.g. between ``asyncio.run`` calls
+    in scripts and tests).
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections
+            )
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared client (application shutdown)."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+class LLMBackend(ABC):
+    """Chat-completion backend."""
+
+    def __init__(self, api_key: str, base_url: str, model: str):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+
+    @abstractmethod
+    async def complete(
+        self,
+        messages: Messages,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> str:
+        """Return the full completion; raises ``LLMError`` on API errors.
+
+        ``json_mode`` asks for a JSON object response; ``model`` overrides
+        the configured model for this call.
+        """
+
+    @abstractmethod
+    def stream(self, messages: Messages, max_tokens: int = 2000, temperature: float = 0.7) -> AsyncIterator[str]:
+        """Yield completion text deltas; raises ``LLMError`` on API errors."""
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI-compatible API through the async SDK client."""
+
+    _sdk: Optional[AsyncOpenAI] = None
+
+    def _client(self) -> AsyncOpenAI:
+        http_client = get_http_client()
+        if self._sdk is None or self._sdk._client is not http_client:
+            # Retries are left to the scheduler
+            self._sdk = AsyncOpenAI(
+                api_key=self.api_key, base_url=self.base_url, http_client=http_client, max_retries=0
+            )
+        return self._sdk
+
+    async def complete(
+        self,
+        messages: Messages,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> str:
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+        try:
+            response = await self._client().chat.completions.create(
+                model=model or self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **extra
+            )
+        except openai.OpenAIError as e:
+            raise _openai_error(e) from e
+        return response.choices[0].message.content
+
+    async def stream(self, messages: Messages, max_tokens: int = 2000, temperature: float = 0.7) -> AsyncIterator[str]:
+        try:
+            stream = await self._client().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+        except openai.OpenAIError as e:
+            raise _openai_error(e) from e
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    yield chunk.choices[0].delta.content
+        except openai.OpenAIError as e:
+            raise _openai_error(e) from e
+        finally:
+            await stream.close()
+
+
+class DashScopeBackend(LLMBackend):
+    """阿里云通义千问 (DashScope) endpoint, called with plain HTTP."""
+
+    def _request(
+        self,
+        messages: Messages,
+        max_tokens: int,
+        temperature: float,
+        stream: bool = False,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> Dict:
+        return {
+            "headers": {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            "json": {
+                "model": model or self.model,
+                "messages": messages,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                **({"stream": True} if stream else {}),
+                **({"response_format": {"type": "json_object"}} if json_mode else {})
+            }
+        }
+
+    async def complete(
+        self,
+        messages: Messages,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> str:
+        request = self._request(messages, max_tokens, temperature, json_mode=json_mode, model=model)
+        try:
+            response = await get_http_client().post(self.base_url, **request)
+        except httpx.TransportError as e:
+            raise LLMRetryableError(f"Aliyun API connection error: {e}") from e
+        if response.status_code != 200:
+            self._raise_for_status(response, f"Aliyun API error: {response.status_code} {response.text}")
+        return response.json()["choices"][0]["message"]["content"]
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, message: str):
+        if _is_retryable_status(response.status_code):
+            raise LLMRetryableError(
+                message,
+                retry_after=parse_retry_after(response.headers),
+                rate_limited=response.status_code == 429
+            )
+        raise LLMError(message)
+
+    async def stream(self, messages: Messages, max_tokens: int = 2000, temperature: float = 0.7) -> AsyncIterator[str]:
+        request = self._request(messages, max_tokens, temperature, stream=True)
+        try:
+            async with get_http_client().stream("POST", self.base_url, **request) as response:
+                if response.status_code != 200:
+                    self._raise_for_status(response, f"API returned status {response.status_code}")
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    data_line = line[6:]
+                    if data_line.strip() == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data_line)
+                    except json.JSONDecodeError:
+                        continue
+                    if chunk.get("choices"):
+                        delta = chunk["choices"][0].get("delta", {})
+                        if delta.get("content"):
+                            yield delta["content"]
+        except httpx.TransportError as e:
+            raise LLMRetryableError(f"Aliyun API connection error: {e}") from e
+
+
+def get_llm_backend() -> Optional[LLMBackend]:
+    """Backend for the configured provider behind the shared request scheduler, or None without an API key."""
+    from app.services.summarizers.llm_scheduler import ScheduledBackend, llm_scheduler
+
+    if not settings.openai_api_key:
+        return None
+    backend_class = DashScopeBackend if "dashscope.aliyuncs.com" in settings.openai_base_url else OpenAIBackend
+    return ScheduledBackend(
+        backend_class(settings.openai_api_key, settings.openai_base_url, settings.openai_model),
+        llm_scheduler
+    )
@@ -0,0 +1,292 @@
+"""Central scheduler for LLM API requests.
+
+Every request made through a ``ScheduledBackend`` first waits for a slot
+from the shared ``LLMScheduler``:
+
+- requests-per-minute and tokens-per-minute limits are enforced over a
+  sliding 60 second window; a request's tokens are its estimated prompt
+  plus ``max_tokens``, which is what providers reserve
+- waiting requests are served by lane, ``interactive`` before ``batch``,
+  then in arrival order
+- ``LLMRetryableError`` (429, 5xx, connection failures) is retried with
+  full-jitter exponential backoff, or after the server's ``Retry-After``
+  if it sent one; a 429 also pauses the whole scheduler for that long, so
+  other queued requests do not run into the same limit
+
+The lane comes from the ``llm_priority`` context variable, which tasks
+inherit; request handlers that stream to a waiting user set it to
+``INTERACTIVE``. Everything else runs as ``batch``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from app.core.config.settings import settings
+from app.services.summarizers.llm_backend import LLMBackend, LLMRetryableError, Messages
+from app.services.summarizers.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+LANES = (INTERACTIVE, BATCH)
+
+llm_priority: ContextVar[str] = ContextVar("llm_priority", default=BATCH)
+
+WINDOW_SECONDS = 60.0
+# Wait times kept for the percentile metrics
+WAIT_SAMPLES = 500
+
+T = TypeVar("T")
+
+
+def request_tokens(messages: Messages, max_tokens: int) -> int:
+    """Tokens a request counts against the TPM limit."""
+    return sum(estimate_tokens(message["content"]) for message in messages) + max_tokens
+
+
+class LLMScheduler:
+    """Rate limits, priority lanes and retries for LLM requests."""
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None
+    ):
+        self.requests_per_minute = settings.llm_requests_per_minute if requests_per_minute is None else requests_per_minute
+        self.tokens_per_minute = settings.llm_tokens_per_minute if tokens_per_minute is None else tokens_per_minute
+        self.max_retries = settings.llm_max_retries if max_retries is None else max_retries
+        self.backoff_base = settings.llm_backoff_base_seconds if backoff_base is None else backoff_base
+        self.backoff_max = settings.llm_backoff_max_seconds if backoff_max is None else backoff_max
+
+        self._window: Deque[Tuple[float, int]] = deque()  # (start time, tokens)
+        self._window_tokens = 0
+        self._paused_until = 0.0
+        self._waiting: List[Tuple[int, int, int, asyncio.Future]] = []  # heap of (lane, arrival, tokens, ready)
+        self._arrivals = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._in_flight = 0
+        self._counters = {"requests": 0, "retries": 0, "rate_limited": 0, "failed": 0}
+        self._waits: Dict[str, Deque[float]] = {lane: deque(maxlen=WAIT_SAMPLES) for lane in LANES}
+
+    # Slots
+
+    def _prune(self, now: float):
+        while self._window and self._window[0][0] <= now - WINDOW_SECONDS:
+            self._window_tokens -= self._window.popleft()[1]
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """Seconds until a request of ``tokens`` fits the limits."""
+        self._prune(now)
+        delay = max(self._paused_until - now, 0.0)
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            oldest = self._window[len(self._window) - self.requests_per_minute][0]
+            delay = max(delay, oldest + WINDOW_SECONDS - now)
+        if self.tokens_per_minute:
+            # A request larger than the whole budget runs once the window is empty
+            excess = self._window_tokens + min(tokens, self.tokens_per_minute) - self.tokens_per_minute
+            for started, used in self._window:
+                if excess <= 0:
+                    break
+                excess -= used
+                delay = max(delay, started + WINDOW_SECONDS - now)
+        return delay
+
+    def _ensure_dispatcher(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Futures and events belong to one loop (scripts and tests run several)
+            self._loop = loop
+            self._waiting = []
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self):
+        """Hand out slots to the head of the queue as the limits allow."""
+        while True:
+            while not self._waiting:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            _, _, tokens, ready = self._waiting[0]
+            if ready.done():  # cancelled while waiting
+                heapq.heappop(self._waiting)
+                continue
+            now = time.monotonic()
+            delay = self._delay(tokens, now)
+            if delay > 0:
+                # Re-check early if a higher-priority request arrives
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self._waiting)
+            self._window.append((now, tokens))
+            self._window_tokens += tokens
+            ready.set_result(now)
+
+    async def acquire(self, tokens: int, lane: Optional[str] = None) -> float:
+        """Wait for a request slot; returns the seconds spent waiting."""
+        lane = lane or llm_priority.get()
+        self._ensure_dispatcher()
+        queued = time.monotonic()
+        ready = self._loop.create_future()
+        heapq.heappush(self._waiting, (LANES.index(lane), next(self._arrivals), tokens, ready))
+        self._wakeup.set()
+        started = await ready
+        waited = started - queued
+        self._waits[lane].append(waited)
+        return waited
+
+    # Retries
+
+    def _backoff(self, attempt: int, error: LLMRetryableError) -> float:
+        if error.retry_after is not None:
+            return error.retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _retry_wait(self, attempt: int, error: LLMRetryableError, description: str) -> bool:
+        """Sleep before the next attempt; False once retries are used up."""
+        if error.rate_limited:
+            self._counters["rate_limited"] += 1
+        if attempt >= self.max_retries:
+            return False
+        delay = self._backoff(attempt, error)
+        if error.rate_limited:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._counters["retries"] += 1
+        logger.warning(f"{description} failed ({error}); retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        return True
+
+    async def run(self, call: Callable[[], Awaitable[T]], tokens: int, description: str = "LLM request") -> T:
+        """Run ``call`` when a slot is free, retrying retryable failures."""
+        attempt = 0
+        while True:
+            await self.acquire(tokens)
+            self._counters["requests"] += 1
+            self._in_flight += 1
+            try:
+                return await call()
+            except LLMRetryableError as e:
+                if not await self._retry_wait(attempt, e, description):
+                    self._counters["failed"] += 1
+                    raise
+                attempt += 1
+            finally:
+                self._in_flight -= 1
+
+    async def stream(
+        self,
+        open_stream: Callable[[], AsyncIterator[str]],
+        tokens: int,
+        description: str = "LLM stream"
+    ) -> AsyncIterator[str]:
+        """Yield from ``open_stream()`` when a slot is free.
+
+        Failures are retried only until the first chunk has been yielded;
+        a stream that breaks later cannot be resumed without duplicating text.
+        """
+        attempt = 0
+        while True:
+            await self.acquire(tokens)
+            self._counters["requests"] += 1
+            self._in_flight += 1
+            yielded = False
+            try:
+                async for chunk in open_stream():
+                    yielded = True
+                    yield chunk
+                return
+            except LLMRetryableError as e:
+                if yielded or not await self._retry_wait(attempt, e, description):
+                    self._counters["failed"] += 1
+                    raise
+                attempt += 1
+            finally:
+                self._in_flight -= 1
+
+    # Metrics
+
+    def stats(self) -> Dict:
+        """Queue depth per lane, window usage, counters and wait-time percentiles."""
+        now = time.monotonic()
+        self._prune(now)
+        depth = {lane: 0 for lane in LANES}
+        for lane_index, _, _, ready in self._waiting:
+            if not ready.done():
+                depth[LANES[lane_index]] += 1
+
+        def percentile(samples: List[float], fraction: float) -> float:
+            return round(samples[min(int(len(samples) * fraction), len(samples) - 1)], 3) if samples else 0.0
+
+        waits = {}
+        for lane, samples in self._waits.items():
+            ordered = sorted(samples)
+            waits[lane] = {
+                "samples": len(ordered),
+                "p50_seconds": percentile(ordered, 0.5),
+                "p95_seconds": percentile(ordered, 0.95),
+                "max_seconds": round(ordered[-1], 3) if ordered else 0.0,
+            }
+        return {
+            "queue_depth": depth,
+            "in_flight": self._in_flight,
+            "window": {
+                "requests": len(self._window),
+                "requests_limit": self.requests_per_minute or None,
+                "tokens": self._window_tokens,
+                "tokens_limit": self.tokens_per_minute or None,
+            },
+            "paused_seconds": round(max(self._paused_until - now, 0.0), 3),
+            "wait": waits,
+            **self._counters,
+        }
+
+
+class ScheduledBackend(LLMBackend):
+    """Backend whose requests go through an ``LLMScheduler``."""
+
+    def __init__(self, backend: LLMBackend, scheduler: LLMScheduler):
+        super().__init__(backend.api_key, backend.base_url, backend.model)
+        self.backend = backend
+        self.scheduler = scheduler
+
+    async def complete(
+        self,
+        messages: Messages,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        model: Optional[str] = None
+    ) -> str:
+        return await self.scheduler.run(
+            lambda: self.backend.complete(messages, max_tokens, temperature, json_mode=json_mode, model=model),
+            request_tokens(messages, max_tokens)
+        )
+
+    async def stream(self, messages: Messages, max_tokens: int = 2000, temperature: float = 0.7) -> AsyncIterator[str]:
+        async for chunk in self.scheduler.stream(
+            lambda: self.backend.stream(messages, max_tokens, temperature),
+            request_tokens(messages, max_tokens)
+        ):
+            yield chunk
+
+
+llm_scheduler = LLMScheduler()
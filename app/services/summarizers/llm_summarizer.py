@@ -1,35 +1,106 @@
 """LLM-based activity summarization service."""
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Callable, AsyncGenerator
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from openai import OpenAI
-import httpx
+import sys
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncGenerator, AsyncIterator, Set, Tuple
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 import asyncio
 import json
 from app.models.member import Activity, Summary, Member
 from app.core.config.settings import settings
+from app.core.database.projections import ActivityRecord, activity_records_statement, fetch_activity_records
+from app.services.summarizers.llm_backend import LLMBackend, get_llm_backend
+from app.services.summarizers.map_reduce import chunk_lines, group_activity_data
+from app.services.summarizers.prompt_packer import PackReport, pack_activities, prompt_token_budget, truncate_content
+from app.services.summarizers.prompt_templates import prompt_registry
+from app.services.summarizers.rollup import ROLLUP_SOURCES, allocate_budget, cover_days, period_bounds, period_title
+from app.services.summarizers.summary_cache import SummaryCache, cache_key, source_version
+from app.services.summarizers.tokens import estimate_tokens, truncate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Summary languages, in the order they are stored (content, content_en)
+LANGUAGES = ("chinese", "english")
+
+# Stands in for the language in the pair a summary stream yields before its map stage
+MAP_STAGE = "map"
+
+# Appended to the English prompt for the "structured" language strategy
+STRUCTURED_SYSTEM_SUFFIX = " Always answer with a single JSON object."
+STRUCTURED_INSTRUCTIONS = """
+Write the summary twice, once in Simplified Chinese (简体中文) and once in English, and return a JSON object with exactly two string fields:
+- "content": the Simplified Chinese summary
+- "content_en": the English summary
+Both fields use the Markdown formatting described above.
+"""
+
+TRANSLATION_SYSTEM_PROMPT = (
+    "You are a professional translator. Translate the user's Markdown document from Simplified Chinese "
+    "into English. Keep the Markdown structure, names, numbers, URLs and code unchanged. "
+    "Output only the translation."
+)
+
+
+def _date_range(start_date: datetime, end_date: datetime) -> str:
+    return f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+
+
+async def prepare_activity_data_for_llm(activities: List[ActivityRecord], db: AsyncSession) -> List[Dict]:
+    """Group activities per member, as the prompt formatters expect them."""
+    # Group activities by member
+    activities_by_member = {}
+    for activity in activities:
+        member_id = activity.member_id
+        if member_id not in activities_by_member:
+            activities_by_member[member_id] = []
+        activities_by_member[member_id].append(activity)
+    
+    # Load all involved members in one query
+    members = {
+        member.id: member
+        for member in await db.scalars(
+            select(Member).where(Member.id.in_(activities_by_member.keys()))
+        )
+    }
+    
+    # Prepare activity data for LLM
+    activity_data = []
+    for member_id, member_activities in activities_by_member.items():
+        member = members.get(member_id)
+        if member:
+            member_activity_summary = {
+                "member_name": member.name,
+                "member_position": member.position,
+                "activities": []
+            }
+            
+            for activity in member_activities:
+                member_activity_summary["activities"].append({
+                    "platform": activity.platform,
+                    "type": activity.activity_type,
+                    "title": activity.title,
+                    "content": activity.content,
+                    "url": activity.url,
+                    "published_at": activity.published_at.isoformat() if activity.published_at else None
+                })
+            
+            activity_data.append(member_activity_summary)
+    
+    return activity_data
+
 
 class LLMSummarizer:
     """LLM-based summarization service."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, llm: Optional[LLMBackend] = None):
         self.db = db
-        self.client = None
-        if settings.openai_api_key:
-            self.client = OpenAI(
-                api_key=settings.openai_api_key,
-                base_url=settings.openai_base_url
-            )
+        self.llm = llm or get_llm_backend()
     
     def can_summarize(self) -> bool:
         """Check if LLM summarization is available."""
-        return self.client is not None and settings.openai_api_key is not None
+        return self.llm is not None
     
     async def generate_daily_summary(self, date: Optional[datetime] = None) -> Optional[Summary]:
         """Generate daily activity summary."""
@@ -42,7 +113,7 @@ class LLMSummarizer:
         start_date = datetime.combine(date, datetime.min.time())
         end_date = datetime.combine(date, datetime.max.time())
         
-        activities = self._get_activities_in_range(start_date, end_date)
+        activities = await self._get_activities_in_range(start_date, end_date)
         
         if not activities:
             return None
@@ -66,55 +137,78 @@ class LLMSummarizer:
             activity_count=len(activities)
         )
         
-        self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
-        
-        return summary
+        return await self._store_summary(summary)
     
-    async def generate_weekly_summary(self, start_date: Optional[datetime] = None) -> Optional[Summary]:
+    async def generate_weekly_summary(self, start_date: Optional[date] = None) -> Optional[Summary]:
         """Generate weekly activity summary."""
-        if not self.can_summarize():
-            return None
-        
         if start_date is None:
             # Start from Monday of current week
             today = datetime.utcnow().date()
             start_date = today - timedelta(days=today.weekday())
         
-        end_date = start_date + timedelta(days=6)
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
+        return await self.generate_rollup_summary("weekly", start_date)
+    
+    async def generate_monthly_summary(self, month: Optional[date] = None) -> Optional[Summary]:
+        """Generate summary for the calendar month containing ``month`` (default: this month)."""
+        return await self.generate_rollup_summary("monthly", month or datetime.utcnow().date())
+    
+    async def generate_quarterly_summary(self, quarter: Optional[date] = None) -> Optional[Summary]:
+        """Generate summary for the quarter containing ``quarter`` (default: this quarter)."""
+        return await self.generate_rollup_summary("quarterly", quarter or datetime.utcnow().date())
+    
+    async def generate_rollup_summary(self, summary_type: str, start_date: date) -> Optional[Summary]:
+        """Generate a weekly, monthly or quarterly summary.
+        
+        The summary is written from the stored shorter-period summaries
+        inside the window, plus raw activities for days none of them cover.
+        Without any stored summary to build on, all activities are read.
+        """
+        if not self.can_summarize():
+            return None
         
-        activities = self._get_activities_in_range(start_datetime, end_datetime)
+        first_day, last_day = period_bounds(summary_type, start_date)
+        start_datetime = datetime.combine(first_day, datetime.min.time())
+        end_datetime = datetime.combine(last_day, datetime.max.time())
         
-        if not activities:
+        activity_count, member_count = await self._count_activities(start_datetime, end_datetime)
+        if not activity_count:
             return None
         
-        summary_content = await self._generate_summary_content(
-            activities, "weekly", start_datetime, end_datetime
-        )
+        sources, gaps = [], [(first_day, last_day)]
+        if settings.summary_rollup_enabled:
+            sources, gaps = await self._rollup_sources(summary_type, first_day, last_day)
+        
+        if sources:
+            gap_activities = await self._gap_activities(gaps)
+            logger.info(
+                f"Building {summary_type} summary from {len(sources)} stored summaries "
+                f"and {len(gap_activities)} activities on {len(gaps)} uncovered day ranges"
+            )
+            summary_content = await self._generate_rollup_content(
+                summary_type, start_datetime, end_datetime, sources, gap_activities
+            )
+        else:
+            activities = await self._get_activities_in_range(start_datetime, end_datetime)
+            summary_content = await self._generate_summary_content(
+                activities, summary_type, start_datetime, end_datetime
+            )
         
         if not summary_content:
             return None
         
         # Create summary record with bilingual content
         summary = Summary(
-            title=f"Weekly Activity Summary - {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}",
+            title=period_title(summary_type, first_day, last_day),
             content=summary_content["chinese"],
             content_en=summary_content["english"],
-            summary_type="weekly",
+            summary_type=summary_type,
             start_date=start_datetime,
             end_date=end_datetime,
-            member_count=len(set(activity.member_id for activity in activities)),
-            activity_count=len(activities)
+            member_count=member_count,
+            activity_count=activity_count
         )
         
-        self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
-        
-        return summary
+        return await self._store_summary(summary)
     
     async def generate_custom_summary(
         self, 
@@ -126,7 +220,7 @@ class LLMSummarizer:
         if not self.can_summarize():
             return None
         
-        activities = self._get_activities_in_range(start_date, end_date)
+        activities = await self._get_activities_in_range(start_date, end_date)
         
         if not activities:
             return None
@@ -150,18 +244,93 @@ class LLMSummarizer:
             activity_count=len(activities)
         )
         
-        self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
+        return await self._store_summary(summary)
+    
+    async def _store_summary(self, summary: Summary) -> Summary:
+        """Save a summary, or return the identical one already stored."""
+        existing = (await self.db.scalars(
+            select(Summary).where(
+                Summary.summary_type == summary.summary_type,
+                Summary.start_date == summary.start_date,
+                Summary.end_date == summary.end_date,
+                Summary.title == summary.title,
+                Summary.content == summary.content,
+                Summary.content_en == summary.content_en
+            ).limit(1)
+        )).first()
+        if existing:
+            return existing
         
+        self.db.add(summary)
+        await self.db.commit()
+        await self.db.refresh(summary)
         return summary
     
-    def _get_activities_in_range(self, start_date: datetime, end_date: datetime) -> List[Activity]:
-        """Get activities within the specified date range."""
-        return self.db.query(Activity).filter(
-            Activity.created_at >= start_date,
-            Activity.created_at <= end_date
-        ).order_by(Activity.created_at.desc()).all()
+    async def _release_connection(self):
+        """End the session's read transaction so its pooled connection is returned.
+        
+        LLM calls can take minutes; holding a connection through them lets a
+        few concurrent summaries exhaust the pool. The session checks out a
+        connection again on its next query, and loaded rows stay usable.
+        """
+        if self.db is not None:
+            await self.db.commit()
+    
+    async def _count_activities(self, start_date: datetime, end_date: datetime) -> Tuple[int, int]:
+        """Number of activities and of distinct members within the date range."""
+        row = (await self.db.execute(
+            select(func.count(Activity.id), func.count(func.distinct(Activity.member_id))).where(
+                Activity.created_at >= start_date,
+                Activity.created_at <= end_date
+            )
+        )).one()
+        return row[0], row[1]
+    
+    async def _rollup_sources(
+        self,
+        summary_type: str,
+        first_day: date,
+        last_day: date
+    ) -> Tuple[List[Summary], List[Tuple[date, date]]]:
+        """Stored summaries a rollup is built from, and the day ranges they leave uncovered."""
+        levels = ROLLUP_SOURCES[summary_type]
+        candidates = (await self.db.scalars(
+            select(Summary).where(
+                Summary.summary_type.in_(levels),
+                Summary.start_date >= datetime.combine(first_day, datetime.min.time()),
+                Summary.end_date <= datetime.combine(last_day, datetime.max.time())
+            ).order_by(Summary.created_at.desc(), Summary.id.desc())
+        )).all()
+        return cover_days(candidates, first_day, last_day, levels)
+    
+    async def _gap_activities(self, gaps: List[Tuple[date, date]]) -> List[ActivityRecord]:
+        """Activities on the day ranges no rollup source covers."""
+        if not gaps:
+            return []
+        return await fetch_activity_records(
+            self.db,
+            activity_records_statement(
+                or_(*[
+                    and_(
+                        Activity.created_at >= datetime.combine(gap_start, datetime.min.time()),
+                        Activity.created_at <= datetime.combine(gap_end, datetime.max.time())
+                    )
+                    for gap_start, gap_end in gaps
+                ]),
+                order_by=Activity.created_at.desc()
+            )
+        )
+    
+    async def _get_activities_in_range(self, start_date: datetime, end_date: datetime) -> List[ActivityRecord]:
+        """Get activities within the specified date range as read-only records."""
+        return await fetch_activity_records(
+            self.db,
+            activity_records_statement(
+                Activity.created_at >= start_date,
+                Activity.created_at <= end_date,
+                order_by=Activity.created_at.desc()
+            )
+        )
     
     async def _generate_summary_content(
         self, 
@@ -174,93 +343,445 @@ class LLMSummarizer:
         if not activities:
             return None
         
-        # Group activities by member
-        activities_by_member = {}
-        for activity in activities:
-            member_id = activity.member_id
-            if member_id not in activities_by_member:
-                activities_by_member[member_id] = []
-            activities_by_member[member_id].append(activity)
+        activity_data = await prepare_activity_data_for_llm(activities, self.db)
         
-        # Prepare activity data for LLM
-        activity_data = []
-        for member_id, member_activities in activities_by_member.items():
-            member = self.db.query(Member).filter(Member.id == member_id).first()
-            if member:
-                member_activity_summary = {
-                    "member_name": member.name,
-                    "member_position": member.position,
-                    "activities": []
-                }
-                
-                for activity in member_activities:
-                    member_activity_summary["activities"].append({
-                        "platform": activity.platform,
-                        "type": activity.activity_type,
-                        "title": activity.title,
-                        "content": activity.content,
-                        "url": activity.url,
-                        "published_at": activity.published_at.isoformat() if activity.published_at else None
-                    })
-                
-                activity_data.append(member_activity_summary)
-        
-        # Generate Chinese content
-        chinese_content = await self._generate_language_content(
-            activity_data, summary_type, start_date, end_date, "chinese"
-        )
+        scope, messages_for, map_stage = self._summary_prompt(activity_data, summary_type, start_date, end_date)
+        if map_stage is None:
+            return await self._cached_bilingual_content(
+                activities,
+                scope,
+                lambda language: self._generate_language_content(activity_data, summary_type, start_date, end_date, language),
+                messages_for,
+                "summary"
+            )
         
-        # Generate English content
-        english_content = await self._generate_language_content(
-            activity_data, summary_type, start_date, end_date, "english"
+        return await self._cached_bilingual_content(
+            activities,
+            scope,
+            lambda language: self._complete(
+                messages_for(language), f"{language} summary",
+                max_tokens=settings.summary_reduce_output_token_budget
+            ),
+            messages_for,
+            "summary",
+            prepare=map_stage
         )
+    
+    def _summary_prompt(
+        self,
+        activity_data: List[Dict],
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Tuple[Dict[str, Any], Callable[[str], List[Dict[str, str]]], Optional[Callable[[], Awaitable[bool]]]]:
+        """Cache scope, per-language prompt builder and map stage of a team summary.
+        
+        The map stage is None unless the window needs map-reduce; it is
+        meant to run only on a cache miss, and the prompts then carry its notes.
+        """
+        scope = {"summary_type": summary_type, "start_date": start_date, "end_date": end_date}
+        if not self._use_map_reduce(activity_data):
+            return scope, lambda language: self._language_messages(
+                activity_data, summary_type, start_date, end_date, language
+            ), None
+        
+        notes: List[str] = []
+        
+        async def map_stage() -> bool:
+            notes.extend(await self._map_activity_data(activity_data, summary_type, start_date, end_date))
+            return bool(notes)
+        
+        def reduce_messages(language: str) -> List[Dict[str, str]]:
+            return self._language_messages(
+                activity_data, summary_type, start_date, end_date, language, data_text="\n\n".join(notes)
+            )
         
-        if not chinese_content or not english_content:
-            return None
-        
-        return {
-            "chinese": chinese_content,
-            "english": english_content
+        return scope, reduce_messages, map_stage
+    
+    async def _generate_rollup_content(
+        self,
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        sources: List[Summary],
+        gap_activities: List[ActivityRecord]
+    ) -> Optional[Dict[str, str]]:
+        """Generate bilingual rollup content from stored summaries and uncovered activities."""
+        scope, messages_for = await self._rollup_prompt(summary_type, start_date, end_date, sources, gap_activities)
+        return await self._cached_bilingual_content(
+            gap_activities,
+            scope,
+            lambda language: self._complete(messages_for(language), f"{language} {summary_type} summary", max_tokens=2000),
+            messages_for,
+            f"{summary_type} summary"
+        )
+    
+    async def _rollup_prompt(
+        self,
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        sources: List[Summary],
+        gap_activities: List[ActivityRecord]
+    ) -> Tuple[Dict[str, Any], Callable[[str], List[Dict[str, str]]]]:
+        """Cache scope and per-language prompt builder of a rollup summary."""
+        gap_data = await prepare_activity_data_for_llm(gap_activities, self.db) if gap_activities else []
+        data_texts: Dict[str, str] = {}
+        
+        def data_text(language: str) -> str:
+            if language not in data_texts:
+                data_texts[language] = self._format_rollup_sources(sources, gap_data, language)
+            return data_texts[language]
+        
+        def messages_for(language: str) -> List[Dict[str, str]]:
+            return self._rollup_messages(summary_type, start_date, end_date, language, data_text(language))
+        
+        scope = {
+            "summary_type": summary_type,
+            "start_date": start_date,
+            "end_date": end_date,
+            "sources": [[source.id, source_version(source)] for source in sources],
         }
+        return scope, messages_for
     
-    def _create_summary_prompt(
-        self, 
-        activity_data: List[Dict], 
+    def _format_rollup_sources(self, sources: List[Summary], gap_data: List[Dict], language: str) -> str:
+        """Source summaries in ``language`` plus uncovered activities, within the prompt budget."""
+        sections = []
+        for source in sources:
+            period = source.start_date.strftime('%Y-%m-%d')
+            if source.end_date.date() != source.start_date.date():
+                period += f" to {source.end_date.strftime('%Y-%m-%d')}"
+            text = source.content if language == "chinese" else (source.content_en or source.content)
+            sections.append((f"### {source.summary_type.capitalize()} summary, {period}\n", text or ""))
+        
+        sizes = [estimate_tokens(heading) + estimate_tokens(text) for heading, text in sections]
+        if gap_data:
+            sizes.append(estimate_tokens(self._pack_activity_data(gap_data, budget=sys.maxsize)[0]))
+        allocation = allocate_budget(sizes, self._prompt_token_budget())
+        
+        parts = [
+            heading + truncate_tokens(text, max(allocation[i] - estimate_tokens(heading), 0))
+            for i, (heading, text) in enumerate(sections)
+        ]
+        if gap_data:
+            parts.append(
+                "### Activities on days without a summary\n"
+                + self._pack_activity_data(gap_data, budget=allocation[-1])[0]
+            )
+        return "\n\n".join(parts)
+    
+    def _rollup_messages(
+        self,
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        language: str,
+        data_text: str
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a rollup summary in one language."""
+        return prompt_registry.messages(
+            "rollup_summary", language,
+            summary_type=summary_type, date_range=_date_range(start_date, end_date), data=data_text
+        )
+    
+    def _use_map_reduce(self, activity_data: List[Dict]) -> bool:
+        """Whether a team summary should go through the map-reduce stages."""
+        mode = settings.summary_map_reduce
+        if mode == "off":
+            return False
+        if mode == "always":
+            return True
+        return self._pack_activity_data(activity_data)[1].dropped > 0
+    
+    def _map_messages(
+        self,
+        subject: str,
+        text: str,
         summary_type: str,
         start_date: datetime,
         end_date: datetime
-    ) -> str:
-        """Create prompt for LLM summarization."""
-        
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        prompt = f"""
-Please create a {summary_type} summary of team member social media activities for the period {date_range}.
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for one map call."""
+        return prompt_registry.messages(
+            "map_notes",
+            subject=subject, summary_type=summary_type, date_range=_date_range(start_date, end_date), data=text
+        )
+    
+    async def _map_activity_data(
+        self,
+        activity_data: List[Dict],
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[str]:
+        """Map stage: condense each activity group into notes, concurrently.
+        
+        Groups over the map input budget are split into parts. If the notes
+        together exceed the reduce input budget they are condensed again,
+        in further rounds, until they fit.
+        """
+        semaphore = asyncio.Semaphore(settings.summary_map_concurrency)
+        
+        async def condense(label: str, subject: str, lines: List[str]) -> Optional[str]:
+            async with semaphore:
+                note = await self._complete(
+                    self._map_messages(subject, "\n".join(lines), summary_type, start_date, end_date),
+                    f"map summary for {label}",
+                    max_tokens=settings.summary_map_output_token_budget,
+                    temperature=0.3
+                )
+            return f"### {label}\n{note}" if note else None
+        
+        jobs = []
+        for label, lines in group_activity_data(
+            activity_data, settings.summary_map_group_by, settings.summary_map_input_token_budget
+        ):
+            chunks = chunk_lines(lines, settings.summary_map_input_token_budget)
+            for i, chunk in enumerate(chunks):
+                part = f"{label} (part {i + 1}/{len(chunks)})" if len(chunks) > 1 else label
+                jobs.append(condense(part, f"activity log of {part}", chunk))
+        notes = [note for note in await asyncio.gather(*jobs) if note]
+        
+        round_number = 1
+        while len(notes) > 1 and estimate_tokens("\n\n".join(notes)) > settings.summary_reduce_input_token_budget:
+            chunks = chunk_lines(notes, settings.summary_reduce_input_token_budget)
+            if len(chunks) >= len(notes):
+                break  # every note is over budget on its own; nothing left to merge
+            round_number += 1
+            notes = [
+                note for note in await asyncio.gather(*[
+                    condense(f"Notes {round_number}.{i + 1}", "partial notes", chunk)
+                    for i, chunk in enumerate(chunks)
+                ])
+                if note
+            ]
+        
+        logger.info(f"Map stage produced {len(notes)} notes from {len(jobs)} groups")
+        return notes
+    
+    def _language_messages(
+        self,
+        activity_data: List[Dict],
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        language: str,
+        data_text: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a team summary in one language.
+        
+        ``data_text`` replaces the formatted activity data (map-reduce notes).
+        """
+        return prompt_registry.messages(
+            "team_summary", language,
+            summary_type=summary_type,
+            date_range=_date_range(start_date, end_date),
+            data=data_text or self._format_activity_data(activity_data)
+        )
 
-Activity Data:
-{self._format_activity_data(activity_data)}
+    async def _complete(self, messages: List[Dict[str, str]], description: str, **options) -> Optional[str]:
+        """Run one completion; errors are logged and give None."""
+        try:
+            return await self.llm.complete(messages, **options)
+        except Exception as e:
+            logger.error(f"Error generating {description}: {e}")
+            return None
 
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and trends
-2. Key highlights from each team member
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Notable achievements or milestones
-5. Recommendations or observations
+    async def _cached_bilingual_content(
+        self,
+        activities: List[ActivityRecord],
+        scope: Dict[str, Any],
+        generate: Callable[[str], Awaitable[Optional[str]]],
+        messages_for: Callable[[str], List[Dict[str, str]]],
+        description: str,
+        prepare: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> Optional[Dict[str, str]]:
+        """``_generate_bilingual_content`` behind the summary cache.
+        
+        Only the languages missing from the cache are generated; when both
+        are cached no LLM call is made. ``prepare`` runs once before any
+        generation (e.g. the map stage); returning False aborts.
+        """
+        if self.db is None or self.llm is None or not settings.summary_cache_enabled:
+            await self._release_connection()
+            if prepare and not await prepare():
+                return None
+            return await self._generate_bilingual_content(generate, messages_for, description)
+        
+        cache = SummaryCache(self.db)
+        keys = self._cache_keys(activities, scope)
+        cached = await cache.get_many(list(keys.values()))
+        contents = {language: cached.get(key) for language, key in keys.items()}
+        missing = [language for language in LANGUAGES if contents[language] is None]
+        await self._release_connection()
+        
+        if not missing:
+            logger.info(f"Summary cache hit for {description}")
+        elif prepare and not await prepare():
+            return None
+        elif len(missing) == len(LANGUAGES):
+            generated = await self._generate_bilingual_content(generate, messages_for, description)
+            if not generated:
+                return None
+            contents.update(generated)
+        else:
+            for language in missing:
+                contents[language] = await generate(language)
+                if not contents[language]:
+                    return None
+        
+        for language in missing:
+            await cache.put(
+                keys[language], contents[language], language,
+                scope["summary_type"], scope["start_date"], scope["end_date"],
+                self.llm.model, prompt_registry.version
+            )
+        return contents
 
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
+    def _cache_keys(self, activities: List[ActivityRecord], scope: Dict[str, Any]) -> Dict[str, str]:
+        """Summary cache key of each language."""
+        return {
+            language: cache_key(activities, scope, prompt_registry.version, self.llm.model, language)
+            for language in LANGUAGES
+        }
 
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting.
-"""
+    async def _cached_bilingual_stream(
+        self,
+        activities: List[ActivityRecord],
+        scope: Dict[str, Any],
+        messages_for: Callable[[str], List[Dict[str, str]]],
+        description: str,
+        prepare: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> AsyncGenerator[Tuple[str, Optional[str]], None]:
+        """Stream both languages at once, behind the summary cache.
+        
+        Pairs are ``(language, chunk)``; chunks of the two languages
+        interleave in arrival order and a ``(language, None)`` pair marks
+        the end of that language. Cached languages arrive as a single
+        chunk; the others are streamed from ``messages_for(language)`` and
+        cached once complete. ``prepare`` (the map stage) runs only on a
+        cache miss, announced by a ``(MAP_STAGE, None)`` pair; without its
+        notes the prompt falls back to the activity data.
+        """
+        cache = None
+        contents: Dict[str, Optional[str]] = {language: None for language in LANGUAGES}
+        if self.db is not None and self.llm is not None and settings.summary_cache_enabled:
+            cache = SummaryCache(self.db)
+            keys = self._cache_keys(activities, scope)
+            cached = await cache.get_many(list(keys.values()))
+            contents = {language: cached.get(key) for language, key in keys.items()}
+        await self._release_connection()
+        
+        missing = [language for language in LANGUAGES if contents[language] is None]
+        if not missing:
+            logger.info(f"Summary cache hit for {description}")
+        elif prepare:
+            yield MAP_STAGE, None
+            await prepare()
+        for language in LANGUAGES:
+            if language not in missing:
+                yield language, contents[language]
+                yield language, None
+        if not missing:
+            return
+        
+        failed: Set[str] = set()
+        generated = {language: "" for language in missing}
+        stream = self._merge_language_streams({
+            language: self._stream_completion(messages_for(language), f"{language} {description}", failed, language)
+            for language in missing
+        })
+        try:
+            async for language, chunk in stream:
+                if chunk is not None:
+                    generated[language] += chunk
+                yield language, chunk
+        finally:
+            await stream.aclose()
+        
+        if cache is not None:
+            for language in missing:
+                if language not in failed and generated[language]:
+                    await cache.put(
+                        keys[language], generated[language], language,
+                        scope["summary_type"], scope["start_date"], scope["end_date"],
+                        self.llm.model, prompt_registry.version
+                    )
+
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        description: str,
+        failed: Set[str],
+        language: str
+    ) -> AsyncGenerator[str, None]:
+        """Stream one completion; an error is reported in-band and ``language`` added to ``failed``."""
+        try:
+            async for delta in self.llm.stream(messages):
+                yield delta
+        except Exception as e:
+            failed.add(language)
+            yield f"Error generating {description}: {e}"
+
+    async def _generate_bilingual_content(
+        self,
+        generate: Callable[[str], Awaitable[Optional[str]]],
+        messages_for: Callable[[str], List[Dict[str, str]]],
+        description: str
+    ) -> Optional[Dict[str, str]]:
+        """Produce the Chinese and English summary with the configured strategy.
+        
+        - ``parallel``: one call per language, run concurrently
+        - ``structured``: one call returning both languages as JSON; falls
+          back to ``parallel`` if the reply is not usable
+        - ``translate``: Chinese summary, then a translation call on its text
+        
+        ``generate(language)`` produces one language on its own and
+        ``messages_for(language)`` builds that language's prompt.
+        """
+        strategy = settings.summary_language_strategy
+        chinese_content = english_content = None
+        
+        if strategy == "structured":
+            messages = messages_for("english")
+            messages = [
+                {"role": "system", "content": messages[0]["content"] + STRUCTURED_SYSTEM_SUFFIX},
+                {"role": "user", "content": messages[1]["content"] + STRUCTURED_INSTRUCTIONS}
+            ]
+            reply = await self._complete(messages, f"structured {description}", max_tokens=4000, json_mode=True)
+            try:
+                result = json.loads(reply) if reply else {}
+                chinese_content, english_content = result.get("content"), result.get("content_en")
+            except (ValueError, AttributeError):
+                pass
+            if not (isinstance(chinese_content, str) and isinstance(english_content, str)
+                    and chinese_content and english_content):
+                logger.warning(f"Unusable structured reply for {description}; generating languages separately")
+                strategy = "parallel"
+        
+        elif strategy == "translate":
+            chinese_content = await generate("chinese")
+            if chinese_content:
+                english_content = await self._complete(
+                    [
+                        {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+                        {"role": "user", "content": chinese_content}
+                    ],
+                    f"english translation of {description}",
+                    temperature=0.2,
+                    model=settings.summary_translation_model
+                )
+        
+        if strategy == "parallel":
+            chinese_content, english_content = await asyncio.gather(*[generate(language) for language in LANGUAGES])
         
-        return prompt
+        if not chinese_content or not english_content:
+            return None
+        
+        return {
+            "chinese": chinese_content,
+            "english": english_content
+        }
 
     async def _generate_language_content(
         self,
@@ -271,107 +792,8 @@ Make it professional, well-structured, and easy to read with clear sections and
         language: str
     ) -> Optional[str]:
         """Generate content in specific language."""
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        if language == "chinese":
-            system_prompt = "你是一位专业的社交媒体活动分析师。请为团队成员在各种平台上的活动创建简洁、信息丰富的总结报告。请用中文回答。"
-            prompt = f"""
-请为{date_range}期间的团队成员社交媒体活动创建{summary_type}总结报告。
-
-活动数据：
-{self._format_activity_data(activity_data)}
-
-请提供包含以下内容的综合总结：
-1. 整体活动概览和趋势
-2. 每位团队成员的关键亮点
-3. 平台特定洞察（LinkedIn、GitHub等）
-4. 值得注意的成就或里程碑
-5. 建议或观察
-
-**重要**：请使用Markdown格式，包含适当的标题、项目符号和格式。使用：
-- `#` 作为主标题
-- `##` 作为副标题
-- `###` 作为章节标题
-- `-` 作为项目符号
-- `**粗体**` 用于强调
-- `*斜体*` 用于次要强调
-- 使用 ``` 的代码块用于任何技术内容
-- 使用 | 的表格用于结构化数据
-
-使其专业、结构良好且易于阅读，具有清晰的章节和适当的Markdown格式。
-"""
-        else:  # english
-            system_prompt = "You are a professional social media activity analyst. Create concise, informative summaries of team member activities across various platforms."
-            prompt = f"""
-Please create a {summary_type} summary of team member social media activities for the period {date_range}.
-
-Activity Data:
-{self._format_activity_data(activity_data)}
-
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and trends
-2. Key highlights from each team member
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Notable achievements or milestones
-5. Recommendations or observations
-
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
-
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting.
-"""
-        
-        try:
-            if "dashscope.aliyuncs.com" in settings.openai_base_url:
-                # 阿里云通义千问
-                headers = {
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                }
-                data = {
-                    "model": settings.openai_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.7
-                }
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        settings.openai_base_url,
-                        headers=headers,
-                        json=data,
-                        timeout=30.0
-                    )
-                    if response.status_code == 200:
-                        result = response.json()
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        logger.error(f"Aliyun API error: {response.status_code} {response.text}")
-                        return None
-            else:
-                response = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2000,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content
-            
-        except Exception as e:
-            logger.error(f"Error generating {language} LLM summary: {e}")
-            return None
+        messages = self._language_messages(activity_data, summary_type, start_date, end_date, language)
+        return await self._complete(messages, f"{language} LLM summary")
 
     async def _generate_language_content_stream(
         self,
@@ -383,136 +805,15 @@ Make it professional, well-structured, and easy to read with clear sections and
         progress_callback: Optional[Callable[[str, str], None]] = None
     ) -> Optional[str]:
         """Generate content in specific language with streaming support."""
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        if language == "chinese":
-            system_prompt = "你是一位专业的社交媒体活动分析师。请为团队成员在各种平台上的活动创建简洁、信息丰富的总结报告。请用中文回答。"
-            prompt = f"""
-请为{date_range}期间的团队成员社交媒体活动创建{summary_type}总结报告。
-
-活动数据：
-{self._format_activity_data(activity_data)}
-
-请提供包含以下内容的综合总结：
-1. 整体活动概览和趋势
-2. 每位团队成员的关键亮点
-3. 平台特定洞察（LinkedIn、GitHub等）
-4. 值得注意的成就或里程碑
-5. 建议或观察
-
-**重要**：请使用Markdown格式，包含适当的标题、项目符号和格式。使用：
-- `#` 作为主标题
-- `##` 作为副标题
-- `###` 作为章节标题
-- `-` 作为项目符号
-- `**粗体**` 用于强调
-- `*斜体*` 用于次要强调
-- 使用 ``` 的代码块用于任何技术内容
-- 使用 | 的表格用于结构化数据
-
-使其专业、结构良好且易于阅读，具有清晰的章节和适当的Markdown格式。
-"""
-        else:  # english
-            system_prompt = "You are a professional social media activity analyst. Create concise, informative summaries of team member activities across various platforms."
-            prompt = f"""
-Please create a {summary_type} summary of team member social media activities for the period {date_range}.
-
-Activity Data:
-{self._format_activity_data(activity_data)}
-
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and trends
-2. Key highlights from each team member
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Notable achievements or milestones
-5. Recommendations or observations
-
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
-
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting.
-"""
-        
+        messages = self._language_messages(activity_data, summary_type, start_date, end_date, language)
+        content = ""
         try:
-            if "dashscope.aliyuncs.com" in settings.openai_base_url:
-                # 阿里云通义千问 - 支持流式
-                headers = {
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                }
-                data = {
-                    "model": settings.openai_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.7,
-                    "stream": True
-                }
-                
-                content = ""
-                async with httpx.AsyncClient() as client:
-                    async with client.stream(
-                        "POST",
-                        settings.openai_base_url,
-                        headers=headers,
-                        json=data,
-                        timeout=60.0
-                    ) as response:
-                        if response.status_code == 200:
-                            async for line in response.aiter_lines():
-                                if line.startswith("data: "):
-                                    data_line = line[6:]
-                                    if data_line.strip() == "[DONE]":
-                                        break
-                                    try:
-                                        chunk = json.loads(data_line)
-                                        if "choices" in chunk and len(chunk["choices"]) > 0:
-                                            delta = chunk["choices"][0].get("delta", {})
-                                            if "content" in delta:
-                                                content += delta["content"]
-                                                # 实时回调内容更新
-                                                if progress_callback:
-                                                    progress_callback("content", delta["content"])
-
-                                    except json.JSONDecodeError:
-                                        continue
-                            return content
-                        else:
-                            logger.error(f"Aliyun API error: {response.status_code}")
-                            return None
-            else:
-                # OpenAI - 支持流式
-                content = ""
-                stream = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2000,
-                    temperature=0.7,
-                    stream=True
-                )
-                
-                for chunk in stream:
-                    if chunk.choices[0].delta.content is not None:
-                        content += chunk.choices[0].delta.content
-                        # 实时回调内容更新
-                        if progress_callback:
-                            progress_callback("content", chunk.choices[0].delta.content)
-
-                
-                return content
-            
+            async for delta in self.llm.stream(messages):
+                content += delta
+                # 实时回调内容更新
+                if progress_callback:
+                    progress_callback("content", delta)
+            return content
         except Exception as e:
             logger.error(f"Error generating {language} LLM summary: {e}")
             return None
@@ -523,144 +824,112 @@ Make it professional, well-structured, and easy to read with clear sections and
         summary_type: str,
         start_date: datetime,
         end_date: datetime,
-        language: str
+        language: str,
+        data_text: Optional[str] = None
     ) -> AsyncGenerator[str, None]:
         """Generate content in specific language with streaming generator."""
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        if language == "chinese":
-            system_prompt = "你是一位专业的社交媒体活动分析师。请为团队成员在各种平台上的活动创建简洁、信息丰富的总结报告。请用中文回答。"
-            prompt = f"""
-请为{date_range}期间的团队成员社交媒体活动创建{summary_type}总结报告。
-
-活动数据：
-{self._format_activity_data(activity_data)}
-
-请提供包含以下内容的综合总结：
-1. 整体活动概览和趋势
-2. 每位团队成员的关键亮点
-3. 平台特定洞察（LinkedIn、GitHub等）
-4. 值得注意的成就或里程碑
-5. 建议或观察
-
-**重要**：请使用Markdown格式，包含适当的标题、项目符号和格式。使用：
-- `#` 作为主标题
-- `##` 作为副标题
-- `###` 作为章节标题
-- `-` 作为项目符号
-- `**粗体**` 用于强调
-- `*斜体*` 用于次要强调
-- 使用 ``` 的代码块用于任何技术内容
-- 使用 | 的表格用于结构化数据
-
-使其专业、结构良好且易于阅读，具有清晰的章节和适当的Markdown格式。
-"""
-        else:  # english
-            system_prompt = "You are a professional social media activity analyst. Create concise, informative summaries of team member activities across various platforms."
-            prompt = f"""
-Please create a {summary_type} summary of team member social media activities for the period {date_range}.
-
-Activity Data:
-{self._format_activity_data(activity_data)}
-
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and trends
-2. Key highlights from each team member
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Notable achievements or milestones
-5. Recommendations or observations
-
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
-
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting.
-"""
-        
+        messages = self._language_messages(activity_data, summary_type, start_date, end_date, language, data_text)
         try:
-            if "dashscope.aliyuncs.com" in settings.openai_base_url:
-                # 阿里云通义千问 - 支持流式
-                headers = {
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                }
-                data = {
-                    "model": settings.openai_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.7,
-                    "stream": True
-                }
-                
-                async with httpx.AsyncClient() as client:
-                    async with client.stream(
-                        "POST",
-                        settings.openai_base_url,
-                        headers=headers,
-                        json=data,
-                        timeout=60.0
-                    ) as response:
-                        if response.status_code == 200:
-                            async for line in response.aiter_lines():
-                                if line.startswith("data: "):
-                                    data_line = line[6:]
-                                    if data_line.strip() == "[DONE]":
-                                        break
-                                    try:
-                                        chunk = json.loads(data_line)
-                                        if "choices" in chunk and len(chunk["choices"]) > 0:
-                                            delta = chunk["choices"][0].get("delta", {})
-                                            if "content" in delta:
-                                                yield delta["content"]
-                                    except json.JSONDecodeError:
-                                        continue
-                        else:
-                            yield f"Error: API returned status {response.status_code}"
-            else:
-                # OpenAI - 支持流式
-                stream = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2000,
-                    temperature=0.7,
-                    stream=True
-                )
-                
-                for chunk in stream:
-                    if chunk.choices[0].delta.content is not None:
-                        yield chunk.choices[0].delta.content
-            
+            async for delta in self.llm.stream(messages):
+                yield delta
         except Exception as e:
             yield f"Error generating {language} LLM summary: {e}"
     
+    async def stream_summary(
+        self,
+        activities: List[ActivityRecord],
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> AsyncGenerator[Tuple[str, Optional[str]], None]:
+        """Stream a team summary in both languages as ``(language, chunk)`` pairs.
+        
+        The prompt and cache entries are the ones ``_generate_summary_content``
+        uses; see ``_cached_bilingual_stream`` for the pairs. The session's
+        connection is released before any LLM call.
+        """
+        activity_data = await prepare_activity_data_for_llm(activities, self.db)
+        scope, messages_for, map_stage = self._summary_prompt(activity_data, summary_type, start_date, end_date)
+        stream = self._cached_bilingual_stream(activities, scope, messages_for, "summary", prepare=map_stage)
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+    
+    async def stream_rollup(
+        self,
+        summary_type: str,
+        start_date: datetime,
+        end_date: datetime,
+        sources: List[Summary],
+        gap_activities: List[ActivityRecord]
+    ) -> AsyncGenerator[Tuple[str, Optional[str]], None]:
+        """Stream a rollup summary like ``stream_summary``, through the summary cache.
+        
+        The prompt is the one ``generate_rollup_summary`` uses.
+        """
+        scope, messages_for = await self._rollup_prompt(summary_type, start_date, end_date, sources, gap_activities)
+        stream = self._cached_bilingual_stream(gap_activities, scope, messages_for, f"{summary_type} summary")
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+    
+    async def _merge_language_streams(
+        self,
+        streams: Dict[str, AsyncIterator[str]]
+    ) -> AsyncGenerator[Tuple[str, Optional[str]], None]:
+        """Interleave per-language chunk streams through a bounded buffer.
+        
+        A slow consumer pauses reading from the provider; closing the
+        generator cancels all upstream requests.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=settings.summary_stream_buffer_chunks)
+        
+        async def produce(language: str, chunks: AsyncIterator[str]):
+            # Errors are reported in-band by the generator; only cancellation skips the end marker
+            async for chunk in chunks:
+                await queue.put((language, chunk))
+            await queue.put((language, None))
+        
+        producers = [asyncio.create_task(produce(language, chunks)) for language, chunks in streams.items()]
+        try:
+            remaining = len(producers)
+            while remaining:
+                language, chunk = await queue.get()
+                if chunk is None:
+                    remaining -= 1
+                yield language, chunk
+        finally:
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+    
+    def _prompt_token_budget(self) -> int:
+        """Activity data budget for the configured model."""
+        return prompt_token_budget(self.llm.model if self.llm else settings.openai_model)
+    
+    def _pack_activity_data(self, activity_data: List[Dict], budget: Optional[int] = None) -> Tuple[str, PackReport]:
+        """Team activity data packed into ``budget`` (default: the prompt budget)."""
+        def render(activity: Dict, content_chars: int) -> str:
+            line = f"- {activity['platform'].upper()}: {activity['type']}"
+            if activity['title']:
+                line += f" - {activity['title']}"
+            if activity['content']:
+                line += f"\n  Content: {truncate_content(activity['content'], content_chars)}"
+            return line + "\n"
+        
+        groups = [
+            (f"\n{member_data['member_name']} ({member_data['member_position']}):\n", member_data['activities'])
+            for member_data in activity_data
+        ]
+        return pack_activities(groups, render, self._prompt_token_budget() if budget is None else budget)
+    
     def _format_activity_data(self, activity_data: List[Dict]) -> str:
         """Format activity data for LLM prompt."""
-        formatted = ""
-        
-        for member_data in activity_data:
-            formatted += f"\n{member_data['member_name']} ({member_data['member_position']}):\n"
-            
-            for activity in member_data['activities']:
-                formatted += f"- {activity['platform'].upper()}: {activity['type']}"
-                if activity['title']:
-                    formatted += f" - {activity['title']}"
-                if activity['content']:
-                    formatted += f"\n  Content: {activity['content'][:200]}..."
-                formatted += "\n"
-        
-        return formatted
+        return self._pack_activity_data(activity_data)[0]
 
     async def generate_member_summary(
         self, 
@@ -680,7 +949,7 @@ Make it professional, well-structured, and easy to read with clear sections and
             start_date = end_date - timedelta(days=days)
         
         # Get member info
-        member = self.db.query(Member).filter(Member.id == member_id).first()
+        member = await self.db.get(Member, member_id)
         if not member:
             return None
         
@@ -688,16 +957,15 @@ Make it professional, well-structured, and easy to read with clear sections and
         logger.info(f"Searching for activities between {start_date} and {end_date}")
         
         # Get activities for this member in the date range
-        # First get all activities for the member, then filter by date
-        all_activities = self.db.query(Activity).filter(
-            Activity.member_id == member_id
-        ).order_by(Activity.published_at.desc()).all()
-        
-        # Filter activities by date range
-        activities = []
-        for activity in all_activities:
-            if activity.published_at and start_date <= activity.published_at <= end_date:
-                activities.append(activity)
+        activities = await fetch_activity_records(
+            self.db,
+            activity_records_statement(
+                Activity.member_id == member_id,
+                Activity.published_at >= start_date,
+                Activity.published_at <= end_date,
+                order_by=Activity.published_at.desc()
+            )
+        )
         
         logger.info(f"Found {len(activities)} activities for member {member_id}")
         
@@ -724,11 +992,7 @@ Make it professional, well-structured, and easy to read with clear sections and
             activity_count=len(activities)
         )
         
-        self.db.add(summary)
-        self.db.commit()
-        self.db.refresh(summary)
-        
-        return summary
+        return await self._store_summary(summary)
 
     async def _generate_member_summary_content(
         self,
@@ -754,205 +1018,59 @@ Make it professional, well-structured, and easy to read with clear sections and
                 "created_at": activity.created_at.isoformat()
             })
         
-        # Generate Chinese content
-        chinese_content = await self._generate_member_language_content(
-            member, activity_data, start_date, end_date, "chinese"
+        return await self._cached_bilingual_content(
+            activities,
+            {
+                "summary_type": "member", "start_date": start_date, "end_date": end_date,
+                "member": [member.id, member.name, member.position, member.department]
+            },
+            lambda language: self._generate_member_language_content(member, activity_data, start_date, end_date, language),
+            lambda language: self._member_language_messages(member, activity_data, start_date, end_date, language),
+            f"summary for member {member.id}"
         )
-        
-        # Generate English content
-        english_content = await self._generate_member_language_content(
-            member, activity_data, start_date, end_date, "english"
-        )
-        
-        if not chinese_content or not english_content:
-            return None
-        
-        return {
-            "chinese": chinese_content,
-            "english": english_content
-        }
 
-    async def _generate_member_language_content(
+    def _member_language_messages(
         self,
         member: Member,
         activity_data: List[Dict],
         start_date: datetime,
         end_date: datetime,
         language: str
-    ) -> Optional[str]:
-        """Generate content in specific language for a member."""
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        if language == "chinese":
-            system_prompt = "你是一位专业的社交媒体活动分析师。请为团队成员在各种平台上的活动创建简洁、信息丰富的总结报告。请用中文回答。"
-            prompt = f"""
-请为{member.name}在{date_range}期间的社交媒体活动创建总结报告。
-
-成员信息：
-- 姓名：{member.name}
-- 职位：{member.position or '未指定'}
-- 部门：{member.department or '未指定'}
-
-活动数据：
-{self._format_member_activity_data(activity_data)}
-
-请提供包含以下内容的综合总结：
-1. 整体活动概览和参与度水平
-2. 关键亮点和值得注意的活动
-3. 平台特定洞察（LinkedIn、GitHub等）
-4. 专业发展和成就
-5. 在线存在趋势和模式
-6. 建议或观察
-
-**重要**：请使用Markdown格式，包含适当的标题、项目符号和格式。使用：
-- `#` 作为主标题
-- `##` 作为副标题
-- `###` 作为章节标题
-- `-` 作为项目符号
-- `**粗体**` 用于强调
-- `*斜体*` 用于次要强调
-- 使用 ``` 的代码块用于任何技术内容
-- 使用 | 的表格用于结构化数据
-
-使其专业、结构良好且易于阅读，具有清晰的章节和适当的Markdown格式。保持简洁但信息丰富，重点关注其活动的最重要方面。
-"""
-        else:  # english
-            system_prompt = "You are a professional social media activity analyst. Create concise, informative summaries of individual team member activities."
-            prompt = f"""
-Please create a summary of {member.name}'s social media activities for the period {date_range}.
-
-Member Information:
-- Name: {member.name}
-- Position: {member.position or 'Not specified'}
-- Department: {member.department or 'Not specified'}
-
-Activity Data:
-{self._format_member_activity_data(activity_data)}
-
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and engagement level
-2. Key highlights and notable activities
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Professional development and achievements
-5. Trends and patterns in their online presence
-6. Recommendations or observations
-
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
-
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting. Keep it concise but informative, focusing on the most important aspects of their activities.
-"""
-        
-        try:
-            if "dashscope.aliyuncs.com" in settings.openai_base_url:
-                headers = {
-                    "Authorization": f"Bearer {settings.openai_api_key}",
-                    "Content-Type": "application/json"
-                }
-                data = {
-                    "model": settings.openai_model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.7
-                }
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        settings.openai_base_url,
-                        headers=headers,
-                        json=data,
-                        timeout=30.0
-                    )
-                    if response.status_code == 200:
-                        result = response.json()
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        print(f"Aliyun API error: {response.status_code} {response.text}")
-                        return None
-            else:
-                response = self.client.chat.completions.create(
-                    model=settings.openai_model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=2000,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content
-            
-        except Exception as e:
-            logger.error(f"Error generating {language} LLM summary for member {member.id}: {e}")
-            return None
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a member summary in one language."""
+        return prompt_registry.messages(
+            "member_summary", language,
+            member_name=member.name,
+            position=member.position,
+            department=member.department,
+            date_range=_date_range(start_date, end_date),
+            data=self._format_member_activity_data(activity_data)
+        )
 
-    def _create_member_summary_prompt(
+    async def _generate_member_language_content(
         self,
         member: Member,
         activity_data: List[Dict],
         start_date: datetime,
-        end_date: datetime
-    ) -> str:
-        """Create prompt for member-specific LLM summarization."""
-        
-        date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-        
-        prompt = f"""
-Please create a summary of {member.name}'s social media activities for the period {date_range}.
-
-Member Information:
-- Name: {member.name}
-- Position: {member.position or 'Not specified'}
-- Department: {member.department or 'Not specified'}
-
-Activity Data:
-{self._format_member_activity_data(activity_data)}
-
-Please provide a comprehensive summary that includes:
-1. Overall activity overview and engagement level
-2. Key highlights and notable activities
-3. Platform-specific insights (LinkedIn, GitHub, etc.)
-4. Professional development and achievements
-5. Trends and patterns in their online presence
-6. Recommendations or observations
-
-**IMPORTANT**: Format the summary in Markdown format with proper headings, bullet points, and formatting. Use:
-- `#` for main headings
-- `##` for subheadings
-- `###` for section headings
-- `-` for bullet points
-- `**bold**` for emphasis
-- `*italic*` for secondary emphasis
-- Code blocks with ``` for any technical content
-- Tables with | for structured data
-
-Make it professional, well-structured, and easy to read with clear sections and proper Markdown formatting. Keep it concise but informative, focusing on the most important aspects of their activities.
-"""
-        
-        return prompt
+        end_date: datetime,
+        language: str
+    ) -> Optional[str]:
+        """Generate content in specific language for a member."""
+        messages = self._member_language_messages(member, activity_data, start_date, end_date, language)
+        return await self._complete(messages, f"{language} LLM summary for member {member.id}")
 
     def _format_member_activity_data(self, activity_data: List[Dict]) -> str:
         """Format activity data for member-specific LLM prompt."""
-        formatted = ""
-        
-        for activity in activity_data:
-            formatted += f"\n{activity['platform'].upper()} - {activity['type']}"
+        def render(activity: Dict, content_chars: int) -> str:
+            formatted = f"\n{activity['platform'].upper()} - {activity['type']}"
             if activity['title']:
                 formatted += f"\nTitle: {activity['title']}"
             if activity['content']:
-                formatted += f"\nContent: {activity['content'][:300]}..."
+                formatted += f"\nContent: {truncate_content(activity['content'], content_chars)}"
             if activity['published_at']:
                 formatted += f"\nPublished: {activity['published_at']}"
             if activity['url']:
                 formatted += f"\nURL: {activity['url']}"
-            formatted += "\n" + "-" * 50 + "\n"
+            return formatted + "\n" + "-" * 50 + "\n"
         
-        return formatted 
\ No newline at end of file
+        return pack_activities([("", activity_data)], render, self._prompt_token_budget())[0]
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Grouping and chunking for map-reduce summarization.
+
+Large windows are summarized in two stages: the activity data is split
+into groups (per member or per platform), each group is condensed into
+notes by a concurrent "map" call, and a final "reduce" call writes the
+report from the notes. Content excerpts are shortened by the prompt
+packer to fit each group into the map input budget; groups and notes that
+still exceed their stage's token budget are split into chunks first.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.services.summarizers.prompt_packer import fit_content_chars, truncate_content
+from app.services.summarizers.tokens import estimate_tokens
+
+
+def format_activity_line(activity: Dict, content_chars: int, member_name: str = None) -> str:
+    """One activity as a prompt line, optionally prefixed with the member.
+
+    The content excerpt is cut to ``content_chars``.
+    """
+    line = f"- {activity['platform'].upper()}: {activity['type']}"
+    if member_name:
+        line = f"- {member_name} / {activity['platform'].upper()}: {activity['type']}"
+    if activity.get("title"):
+        line += f" - {activity['title']}"
+    if activity.get("content"):
+        line += f"\n  Content: {truncate_content(activity['content'], content_chars)}"
+    if activity.get("published_at"):
+        line += f"\n  Published: {activity['published_at']}"
+    return line
+
+
+def _group_lines(activities: List[Tuple[Dict, Optional[str]]], budget: int) -> List[str]:
+    """Lines of one map group, with the longest excerpts that fit ``budget``."""
+    def render(content_chars: int) -> List[str]:
+        return [format_activity_line(activity, content_chars, member_name) for activity, member_name in activities]
+
+    content_chars = fit_content_chars(
+        lambda chars: sum(estimate_tokens(line) + 1 for line in render(chars)), budget
+    )
+    return render(content_chars)
+
+
+def group_activity_data(activity_data: List[Dict], group_by: str, budget: int) -> List[Tuple[str, List[str]]]:
+    """Split member-grouped activity data into ``(label, lines)`` map groups.
+
+    ``budget`` is the map input budget the excerpts are sized for.
+    """
+    if group_by == "platform":
+        by_platform: Dict[str, List[Tuple[Dict, Optional[str]]]] = {}
+        for member_data in activity_data:
+            for activity in member_data["activities"]:
+                by_platform.setdefault(activity["platform"].lower(), []).append(
+                    (activity, member_data["member_name"])
+                )
+        return [(f"{platform} activity", _group_lines(items, budget)) for platform, items in by_platform.items()]
+
+    return [
+        (
+            f"{member_data['member_name']} ({member_data['member_position']})",
+            _group_lines([(activity, None) for activity in member_data["activities"]], budget)
+        )
+        for member_data in activity_data
+    ]
+
+
+def chunk_lines(lines: List[str], budget: int) -> List[List[str]]:
+    """Pack lines into consecutive chunks of at most ``budget`` estimated tokens.
+
+    A single line over budget becomes its own chunk.
+    """
+    chunks, current, used = [], [], 0
+    for line in lines:
+        cost = estimate_tokens(line) + 1
+        if current and used + cost > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(line)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,187 @@
+"""Fit activity data into a prompt token budget.
+
+Instead of cutting every activity's content at a fixed number of
+characters, the packer:
+
+1. drops duplicate activities (same platform, type, title and content)
+2. shortens the content excerpt of every activity step by step, down to
+   ``MIN_CONTENT_CHARS``
+3. if that is still not enough, drops the lowest-priority activities;
+   priority is the activity type's weight, raised by up to 2x for recency
+
+Surviving activities keep their original order, and the returned
+``PackReport`` says what was removed.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config.settings import settings
+from app.services.summarizers.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+TYPE_WEIGHTS = {
+    "pull_request": 3.0,
+    "issue": 2.5,
+    "post": 2.5,
+    "push": 2.0,
+    "create": 1.5,
+    "fork": 1.0,
+}
+DEFAULT_TYPE_WEIGHT = 1.0
+RECENCY_HALF_LIFE_DAYS = 3.0
+
+MAX_CONTENT_CHARS = 1000
+MIN_CONTENT_CHARS = 80
+
+# (group header, activities)
+Group = Tuple[str, List[Dict]]
+
+
+@dataclass
+class PackReport:
+    """What the packer kept and removed."""
+    budget: int
+    tokens: int = 0
+    included: int = 0
+    duplicates: int = 0
+    dropped: int = 0
+    content_chars: int = MAX_CONTENT_CHARS
+
+    def note(self) -> str:
+        """Line telling the model that activities were left out, if any."""
+        if not self.dropped:
+            return ""
+        return f"\n({self.dropped} lower-priority activities omitted to fit the prompt budget)\n"
+
+
+def prompt_token_budget(model: Optional[str]) -> int:
+    """Activity data budget for ``model``, falling back to the default."""
+    return settings.summary_prompt_token_budgets.get(model or "", settings.summary_prompt_token_budget)
+
+
+def truncate_content(content: str, limit: int) -> str:
+    """``content`` cut to ``limit`` characters, marked with an ellipsis if cut."""
+    return content if len(content) <= limit else content[:limit] + "..."
+
+
+def fit_content_chars(cost: Callable[[int], int], budget: int) -> int:
+    """Longest content excerpt, halved from ``MAX_CONTENT_CHARS`` down to
+    ``MIN_CONTENT_CHARS``, for which ``cost(content_chars)`` fits ``budget``.
+
+    Returns ``MIN_CONTENT_CHARS`` when even that does not fit.
+    """
+    content_chars = MAX_CONTENT_CHARS
+    while cost(content_chars) > budget and content_chars > MIN_CONTENT_CHARS:
+        content_chars = max(content_chars // 2, MIN_CONTENT_CHARS)
+    return content_chars
+
+
+def _parse_time(value) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def _dedup_key(activity: Dict) -> Tuple:
+    return tuple(
+        " ".join(str(activity.get(field) or "").lower().split())
+        for field in ("platform", "type", "title", "content")
+    )
+
+
+def activity_priority(activity: Dict, reference_time: Optional[datetime]) -> float:
+    """Type weight, scaled by up to 2x for activities close to ``reference_time``."""
+    weight = TYPE_WEIGHTS.get((activity.get("type") or "").lower(), DEFAULT_TYPE_WEIGHT)
+    published = _parse_time(activity.get("published_at"))
+    if published is None or reference_time is None:
+        return weight
+    age_days = max((reference_time - published).total_seconds(), 0) / 86400
+    return weight * (1 + 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS))
+
+
+def pack_activities(
+    groups: List[Group],
+    render: Callable[[Dict, int], str],
+    budget: int
+) -> Tuple[str, PackReport]:
+    """Render ``groups`` within ``budget`` estimated tokens.
+
+    ``render(activity, content_chars)`` formats one activity with its
+    content cut to ``content_chars``. Groups left without activities are
+    omitted.
+    """
+    report = PackReport(budget=budget)
+
+    seen = set()
+    items = []  # (group index, position, activity)
+    for group_index, (_, activities) in enumerate(groups):
+        for activity in activities:
+            key = _dedup_key(activity)
+            if key in seen:
+                report.duplicates += 1
+                continue
+            seen.add(key)
+            items.append((group_index, len(items), activity))
+
+    header_cost = [estimate_tokens(header) for header, _ in groups]
+
+    def cost(content_chars: int) -> Tuple[List[int], int]:
+        costs = [estimate_tokens(render(activity, content_chars)) for _, _, activity in items]
+        used_groups = {group_index for group_index, _, _ in items}
+        return costs, sum(costs) + sum(header_cost[i] for i in used_groups)
+
+    content_chars = fit_content_chars(lambda chars: cost(chars)[1], budget)
+    costs, total = cost(content_chars)
+    report.content_chars = content_chars
+
+    if total > budget:
+        times = [_parse_time(activity.get("published_at")) for _, _, activity in items]
+        reference_time = max((t for t in times if t is not None), default=None)
+        group_sizes: Dict[int, int] = {}
+        for group_index, _, _ in items:
+            group_sizes[group_index] = group_sizes.get(group_index, 0) + 1
+
+        ranked = sorted(
+            range(len(items)),
+            key=lambda i: (activity_priority(items[i][2], reference_time), -items[i][1])
+        )
+        # Leave room for the note saying activities were omitted
+        total += estimate_tokens(PackReport(budget=budget, dropped=len(items)).note())
+        dropped = set()
+        for i in ranked:
+            if total <= budget:
+                break
+            group_index = items[i][0]
+            dropped.add(i)
+            total -= costs[i]
+            group_sizes[group_index] -= 1
+            if not group_sizes[group_index]:
+                total -= header_cost[group_index]
+        report.dropped = len(dropped)
+        items = [item for i, item in enumerate(items) if i not in dropped]
+
+    parts = []
+    current_group = None
+    for group_index, _, activity in items:
+        if group_index != current_group:
+            parts.append(groups[group_index][0])
+            current_group = group_index
+        parts.append(render(activity, content_chars))
+    text = "".join(parts) + report.note()
+
+    report.tokens = estimate_tokens(text)
+    report.included = len(items)
+    if report.dropped or report.duplicates or content_chars < MAX_CONTENT_CHARS:
+        logger.info(
+            f"Packed {report.included} activities into {report.tokens}/{budget} tokens "
+            f"(content cut to {content_chars} chars, {report.duplicates} duplicates, "
+            f"{report.dropped} dropped)"
+        )
+    return text, report
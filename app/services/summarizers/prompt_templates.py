@@ -0,0 +1,61 @@
+"""Registry of the summarizer's prompt templates.
+
+Templates live in ``prompts/`` as ``<name>.<lang>.j2`` files, each with a
+``system`` and a ``user`` block; files starting with ``_`` are partials
+for ``{% include %}``. They are compiled once, when this module is
+imported at startup.
+
+Every template puts its static instructions first and the variable data
+(dates, member details, activity data) last, so consecutive requests share
+the longest possible prefix for providers that cache prompt prefixes.
+
+``version`` hashes all template sources. It is part of every summary cache
+key, so editing any template invalidates the summaries built from it.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
+
+TEMPLATE_DIR = Path(__file__).parent / "prompts"
+
+# Summary language -> template file suffix
+LANGUAGE_CODES = {"chinese": "zh", "english": "en"}
+
+
+class PromptRegistry:
+    """Compiled prompt templates, keyed by ``(name, language code)``."""
+
+    def __init__(self, directory: Path = TEMPLATE_DIR):
+        self.environment = Environment(
+            loader=FileSystemLoader(str(directory)),
+            undefined=StrictUndefined,
+            autoescape=False
+        )
+        self.templates: Dict[tuple, Template] = {}
+        digest = hashlib.sha256()
+        for path in sorted(directory.glob("*.j2")):
+            digest.update(path.name.encode() + b"\x00" + path.read_bytes())
+            if path.name.startswith("_"):
+                continue
+            name, code, _ = path.name.rsplit(".", 2)
+            self.templates[(name, code)] = self.environment.get_template(path.name)
+        self.version = digest.hexdigest()[:12]
+
+    def messages(self, name: str, language: str = "english", **context) -> List[Dict[str, str]]:
+        """Render template ``name`` as system and user chat messages.
+
+        Templates without a variant for ``language`` use the English one.
+        """
+        code = LANGUAGE_CODES.get(language, language)
+        template = self.templates.get((name, code)) or self.templates[(name, "en")]
+        rendered = template.new_context(context)
+        return [
+            {"role": role, "content": "".join(template.blocks[role](rendered)).strip()}
+            for role in ("system", "user")
+        ]
+
+
+prompt_registry = PromptRegistry()
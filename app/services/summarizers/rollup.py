@@ -0,0 +1,110 @@
+"""Periods and sources for hierarchical rollup summaries.
+
+A weekly summary is written from the stored daily summaries of its days, a
+monthly one from weekly and daily summaries, and a quarterly one from
+monthly, weekly and daily summaries. The window is covered with the
+largest stored summaries first; only days no summary covers are read as
+raw activities. The prompt then grows with the number of sources, not
+with the number of activities in the window.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+from app.models.member import Summary
+
+# Summary types a rollup is built from, largest first
+ROLLUP_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "weekly": ("daily",),
+    "monthly": ("weekly", "daily"),
+    "quarterly": ("monthly", "weekly", "daily"),
+}
+
+
+def period_bounds(summary_type: str, day: date) -> Tuple[date, date]:
+    """First and last day of the rollup period starting at (or containing) ``day``.
+
+    Weekly periods start at ``day``; monthly and quarterly periods are
+    calendar months and quarters.
+    """
+    if isinstance(day, datetime):
+        day = day.date()
+    if summary_type == "weekly":
+        return day, day + timedelta(days=6)
+    if summary_type == "monthly":
+        start = day.replace(day=1)
+        months = 1
+    elif summary_type == "quarterly":
+        start = date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+        months = 3
+    else:
+        raise ValueError(f"Unknown rollup type: {summary_type}")
+    month = start.month - 1 + months
+    return start, date(start.year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+
+
+def period_title(summary_type: str, start: date, end: date) -> str:
+    """Title of a rollup summary."""
+    if summary_type == "monthly":
+        return f"Monthly Activity Summary - {start.strftime('%Y-%m')}"
+    if summary_type == "quarterly":
+        return f"Quarterly Activity Summary - {start.year} Q{(start.month - 1) // 3 + 1}"
+    return f"Weekly Activity Summary - {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}"
+
+
+def _days(start: date, end: date) -> List[date]:
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def cover_days(
+    summaries: Sequence[Summary],
+    start: date,
+    end: date,
+    levels: Sequence[str]
+) -> Tuple[List[Summary], List[Tuple[date, date]]]:
+    """Pick non-overlapping ``summaries`` covering ``[start, end]``.
+
+    Levels are tried in order and, within a level, summaries in the order
+    given (newest first), so each day is covered by the largest and then
+    the latest summary available. Returns the chosen summaries by start
+    date and the uncovered day ranges.
+    """
+    covered = set()
+    chosen = []
+    for level in levels:
+        for summary in summaries:
+            if summary.summary_type != level:
+                continue
+            days = _days(summary.start_date.date(), summary.end_date.date())
+            if days[0] < start or days[-1] > end or covered.intersection(days):
+                continue
+            covered.update(days)
+            chosen.append(summary)
+    chosen.sort(key=lambda summary: summary.start_date)
+
+    gaps = []
+    for day in _days(start, end):
+        if day in covered:
+            continue
+        if gaps and gaps[-1][1] == day - timedelta(days=1):
+            gaps[-1] = (gaps[-1][0], day)
+        else:
+            gaps.append((day, day))
+    return chosen, gaps
+
+
+def allocate_budget(sizes: Sequence[int], budget: int) -> List[int]:
+    """Split ``budget`` tokens between sections of the given ``sizes``.
+
+    Sections smaller than an equal share keep their full size and the rest
+    is shared evenly by the larger ones.
+    """
+    allocation = [0] * len(sizes)
+    remaining = budget
+    pending = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    while pending:
+        share = remaining // len(pending)
+        i = pending.pop(0)
+        allocation[i] = min(sizes[i], share)
+        remaining -= allocation[i]
+    return allocation
@@ -0,0 +1,114 @@
+"""Content-addressed cache of generated summary text.
+
+An entry's key hashes everything the text was generated from:
+
+- the activities in id order, each with a fingerprint of its text, so an
+  edited or reprocessed activity changes the key
+- the summary scope (type, date range, member, rollup sources)
+- the prompt version, the model and the language
+
+A hit is therefore always safe to reuse. Entries whose window receives new
+activities are also deleted by the activity pipeline, so stale text does
+not pile up.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database.projections import ActivityRecord
+from app.models.member import SummaryCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+def activity_version(activity) -> str:
+    """Short fingerprint of the activity fields that end up in prompts."""
+    published_at = activity.published_at.isoformat() if activity.published_at else ""
+    text = "\x00".join([activity.title or "", activity.content or "", activity.url or "", published_at])
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def source_version(summary) -> str:
+    """Short fingerprint of a stored summary used as a rollup source."""
+    text = "\x00".join([summary.content or "", summary.content_en or ""])
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def cache_key(activities: Iterable, scope: Dict[str, Any], prompt_version: str, model: str, language: str) -> str:
+    """Hash of the ordered activity ids and versions, scope, prompt, model and language."""
+    material = {
+        "activities": sorted([activity.id, activity_version(activity)] for activity in activities),
+        "scope": scope,
+        "prompt_version": prompt_version,
+        "model": model,
+        "language": language,
+    }
+    return hashlib.sha256(json.dumps(material, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class SummaryCache:
+    """Read and write cached summary text."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Cached text for whichever ``keys`` are present."""
+        rows = await self.db.execute(
+            select(SummaryCacheEntry.key, SummaryCacheEntry.content).where(SummaryCacheEntry.key.in_(list(keys)))
+        )
+        return {key: content for key, content in rows}
+
+    async def put(
+        self,
+        key: str,
+        content: str,
+        language: str,
+        summary_type: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        model: Optional[str],
+        prompt_version: str
+    ):
+        """Store generated text; a concurrent writer of the same key wins."""
+        self.db.add(SummaryCacheEntry(
+            key=key, content=content, language=language, summary_type=summary_type,
+            start_date=start_date, end_date=end_date, model=model, prompt_version=prompt_version
+        ))
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+
+    async def invalidate_window(self, start: datetime, end: datetime) -> int:
+        """Delete entries whose date range overlaps ``[start, end]``."""
+        result = await self.db.execute(
+            delete(SummaryCacheEntry).where(
+                SummaryCacheEntry.start_date <= end,
+                SummaryCacheEntry.end_date >= start
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+
+async def invalidate_summary_cache(activities: List[ActivityRecord], db: AsyncSession):
+    """Activity pipeline stage: drop cached summaries covering the new activities."""
+    moments = [
+        moment
+        for activity in activities
+        for moment in (activity.created_at, activity.published_at)
+        if moment is not None
+    ]
+    if not moments:
+        return
+    removed = await SummaryCache(db).invalidate_window(min(moments), max(moments))
+    if removed:
+        logger.info(f"Invalidated {removed} cached summaries")
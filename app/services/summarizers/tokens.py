@@ -0,0 +1,33 @@
+"""Token estimates for prompt budgeting.
+
+Exact counts depend on the model's tokenizer; budgets only need a stable,
+slightly pessimistic estimate. CJK characters count as one token each and
+other text as one token per four characters.
+"""
+
+
+def _is_cjk(ch: str) -> bool:
+    return "\u3040" <= ch <= "\u30ff" or "\u3400" <= ch <= "\u9fff" or "\uac00" <= ch <= "\ud7af"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of ``text``."""
+    if not text:
+        return 0
+    cjk = sum(1 for ch in text if _is_cjk(ch))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def truncate_tokens(text: str, limit: int) -> str:
+    """``text`` cut to about ``limit`` estimated tokens, marked with an ellipsis if cut."""
+    if estimate_tokens(text) <= limit:
+        return text
+    cjk = other = 0
+    for i, ch in enumerate(text):
+        if _is_cjk(ch):
+            cjk += 1
+        else:
+            other += 1
+        if cjk + (other + 3) // 4 > limit:
+            return text[:i] + "..."
+    return text
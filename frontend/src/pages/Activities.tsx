@@ -42,7 +42,7 @@ const Activities: React.FC = () => {
 
     const filtered = activities.filter(activity => 
       activity.title?.toLowerCase().includes(query.toLowerCase()) ||
-      activity.content?.toLowerCase().includes(query.toLowerCase()) ||
+      (activity.content_preview ?? activity.content)?.toLowerCase().includes(query.toLowerCase()) ||
       activity.platform.toLowerCase().includes(query.toLowerCase()) ||
       activity.member?.name.toLowerCase().includes(query.toLowerCase())
     );
@@ -257,9 +257,9 @@ const Activities: React.FC = () => {
                       </h3>
                     )}
                     
-                    {activity.content && (
+                    {(activity.content_preview ?? activity.content) && (
                       <p className="text-sm text-gray-600 dark:text-gray-400 line-clamp-3">
-                        {activity.content}
+                        {activity.content_preview ?? activity.content}
                       </p>
                     )}
                     
@@ -11,11 +11,13 @@ const Summaries: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [generating, setGenerating] = useState(false);
   const [language, setLanguage] = useState<'chinese' | 'english'>('chinese');
+  const [fullContent, setFullContent] = useState<Record<number, string>>({});
 
   const loadSummaries = async () => {
     try {
-      const response = await apiService.getSummaries();
+      const response = await apiService.getSummaries({ language });
       setSummaries(response);
+      setFullContent({});
     } catch (error) {
       toast.error('加载总结列表失败');
       console.error('Failed to load summaries:', error);
@@ -54,6 +56,22 @@ const Summaries: React.FC = () => {
     }
   };
 
+  // 列表只返回预览，展开时再加载全文
+  const toggleSummary = async (summary: Summary) => {
+    if (fullContent[summary.id] !== undefined) {
+      const { [summary.id]: _, ...rest } = fullContent;
+      setFullContent(rest);
+      return;
+    }
+    try {
+      const detail = await apiService.getSummary(summary.id, language);
+      setFullContent(prev => ({ ...prev, [summary.id]: detail.content }));
+    } catch (error) {
+      toast.error('加载总结全文失败');
+      console.error('Failed to load summary:', error);
+    }
+  };
+
   const toggleLanguage = () => {
     setLanguage(prev => prev === 'chinese' ? 'english' : 'chinese');
   };
@@ -135,9 +153,18 @@ const Summaries: React.FC = () => {
                    <ReactMarkdown 
                      remarkPlugins={[remarkGfm]}
                    >
-                     {summary.content}
+                     {fullContent[summary.id] ?? summary.content_preview ?? summary.content ?? ''}
                    </ReactMarkdown>
                  </div>
+                 
+                 {(summary.content_length ?? 0) > (summary.content_preview?.length ?? 0) && (
+                   <button
+                     onClick={() => toggleSummary(summary)}
+                     className="mt-2 text-sm text-blue-600 hover:text-blue-800 dark:text-blue-400"
+                   >
+                     {fullContent[summary.id] !== undefined ? '收起' : '展开全文'}
+                   </button>
+                 )}
               </div>
             ))}
           </div>
@@ -153,8 +153,10 @@ export const apiService = {
     return response.data;
   },
 
-  async getSummary(id: string | number) {
-    const response = await api.get(apiEndpoints.summary(id.toString()));
+  async getSummary(id: string | number, language?: string) {
+    const response = await api.get(apiEndpoints.summary(id.toString()), {
+      params: language ? { language } : undefined,
+    });
     return response.data;
   },
 
@@ -64,6 +64,8 @@ export interface Activity extends BaseEntity {
   activity_type?: string;
   title?: string;
   content?: string;
+  content_preview?: string;
+  content_length?: number;
   url?: string;
   external_id?: string;
   published_at?: string;
@@ -75,8 +77,11 @@ export interface Activity extends BaseEntity {
 // 总结相关类型
 export interface Summary extends BaseEntity {
   title: string;
-  content: string;
+  content?: string;
   content_en?: string;
+  content_preview?: string;
+  content_length?: number;
+  has_english?: boolean;
   summary_type?: string;
   start_date?: string;
   end_date?: string;
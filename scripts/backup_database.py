@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+数据库在线备份与恢复工具
+
+SQLite 使用增量备份 API 分步复制，备份期间应用可继续读写；
+PostgreSQL 使用 pg_dump / pg_restore。
+
+用法:
+  python scripts/backup_database.py backup [--dir ./backups] [--keep 7] [--compress | --no-compress]
+  python scripts/backup_database.py list [--dir ./backups]
+  python scripts/backup_database.py restore <快照文件>
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config.settings import settings
+from app.core.database.backup import BackupError, backup_database, list_snapshots, restore_database
+from app.core.database.database import engine
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def run_backup(args):
+    """创建快照"""
+    print("💾 创建在线备份...")
+    result = backup_database(engine, backup_dir=args.dir, compress=args.compress, keep=args.keep)
+    print(f"✅ 快照: {result['path']} ({_format_bytes(result['snapshot_bytes'])})")
+    if result.get("database_bytes"):
+        print(f"数据库大小: {_format_bytes(result['database_bytes'])}，共 {result['pages']} 页")
+    for path in result["rotated"]:
+        print(f"🗑️  已轮换删除: {path}")
+
+
+def run_list(args):
+    """列出快照"""
+    snapshots = list_snapshots(args.dir)
+    if not snapshots:
+        print(f"{args.dir} 中没有快照")
+        return
+    for path in snapshots:
+        stat = path.stat()
+        modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{modified}  {_format_bytes(stat.st_size):>10}  {path}")
+
+
+def run_restore(args):
+    """从快照恢复"""
+    if not args.yes:
+        confirm = input(f"这将用 {args.snapshot} 覆盖当前数据库！输入 'RESTORE' 确认: ")
+        if confirm != "RESTORE":
+            print("操作已取消")
+            return
+    print("♻️  正在恢复...")
+    restore_database(engine, args.snapshot)
+    print("✅ 恢复完成")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="数据库在线备份与恢复工具")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backup_parser = subparsers.add_parser("backup", help="创建快照")
+    backup_parser.add_argument("--dir", default=settings.db_backup_dir, help="快照目录")
+    backup_parser.add_argument("--keep", type=int, default=settings.db_backup_keep, help="保留的快照数量")
+    backup_parser.add_argument(
+        "--compress", action=argparse.BooleanOptionalAction, default=settings.db_backup_compress,
+        help="压缩快照"
+    )
+    backup_parser.set_defaults(func=run_backup)
+
+    list_parser = subparsers.add_parser("list", help="列出快照")
+    list_parser.add_argument("--dir", default=settings.db_backup_dir, help="快照目录")
+    list_parser.set_defaults(func=run_list)
+
+    restore_parser = subparsers.add_parser("restore", help="从快照恢复")
+    restore_parser.add_argument("snapshot", help="快照文件路径")
+    restore_parser.add_argument("--yes", action="store_true", help="跳过确认")
+    restore_parser.set_defaults(func=run_restore)
+
+    args = parser.parse_args()
+    print("🗄️  Inspector 数据库备份工具")
+    print("=" * 50)
+    try:
+        args.func(args)
+    except BackupError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
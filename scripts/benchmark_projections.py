@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+活动读取路径基准测试
+
+比较读取大量活动时的耗时与内存峰值：
+  orm      - 加载完整的 Activity ORM 对象（.all()）
+  records  - 通过 ActivityRecord 投影按批流式读取（yield_per）
+  tuples   - 仅读取原始行元组，作为下限参考
+
+结果按每 10 万行折算。
+
+用法: python scripts/benchmark_projections.py [--rows 100000] [--batch-size 1000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.database import Base
+from app.core.database.projections import activity_records_statement, iter_activity_records
+from app.models.member import Member, SocialProfile, Activity
+
+PER_ROWS = 100_000
+
+
+def _seed(Session, rows: int):
+    with Session() as db:
+        member = Member(name="Bench", email="bench@example.com")
+        db.add(member)
+        db.flush()
+        profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/bench")
+        db.add(profile)
+        db.flush()
+        content = "Merge pull request from feature branch " * 5
+        db.execute(Activity.__table__.insert(), [
+            {
+                "member_id": member.id,
+                "social_profile_id": profile.id,
+                "platform": "github",
+                "activity_type": "push",
+                "title": f"push event {i}",
+                "content": content,
+                "content_preview": content[:200],
+                "content_length": len(content),
+                "url": f"https://github.com/bench/repo/commit/{i}",
+                "external_id": f"bench-{i}",
+            }
+            for i in range(rows)
+        ])
+        db.commit()
+
+
+def _read_orm(db, batch_size):
+    return sum(1 for activity in db.query(Activity).order_by(Activity.id).all() if activity.title)
+
+
+def _read_records(db, batch_size):
+    stmt = activity_records_statement(order_by=Activity.id)
+    return sum(1 for record in iter_activity_records(db, stmt, batch_size) if record.title)
+
+
+def _read_tuples(db, batch_size):
+    stmt = select(Activity.id, Activity.stored_title).order_by(Activity.id)
+    return sum(1 for row in db.execute(stmt.execution_options(yield_per=batch_size)) if row[1])
+
+
+MODES = {"orm": _read_orm, "records": _read_records, "tuples": _read_tuples}
+
+
+def run_mode(Session, mode: str, rows: int, batch_size: int) -> dict:
+    """Read every activity once in ``mode`` and return time and peak memory."""
+    with Session() as db:
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = MODES[mode](db, batch_size)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    assert count == rows, f"{mode} read {count} rows, expected {rows}"
+    scale = PER_ROWS / rows
+    return {
+        "mode": mode,
+        "seconds_per_100k": elapsed * scale,
+        "peak_mb_per_100k": peak * scale / (1024 * 1024),
+    }
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="活动读取路径基准测试")
+    parser.add_argument("--rows", type=int, default=PER_ROWS, help="测试用的活动行数")
+    parser.add_argument("--batch-size", type=int, default=1000, help="yield_per 批大小")
+    parser.add_argument("--modes", default="orm,records,tuples", help="要测试的模式（逗号分隔）")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="inspector-bench-")
+    engine = create_engine(f"sqlite:///{workdir}/bench.db")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    _seed(Session, args.rows)
+
+    print("📊 活动读取路径基准测试")
+    print(f"行数: {args.rows}，批大小: {args.batch_size}（结果按每 10 万行折算）")
+    print("=" * 44)
+    print(f"{'mode':<10} {'seconds':>14} {'peak MB':>16}")
+
+    for mode in args.modes.split(","):
+        r = run_mode(Session, mode.strip(), args.rows, args.batch_size)
+        print(f"{r['mode']:<10} {r['seconds_per_100k']:>14.2f} {r['peak_mb_per_100k']:>16.1f}")
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+SQLite 写入吞吐基准测试
+
+在读写混合负载下比较三种写入方式：
+  shared  - 所有会话共用一个连接池，各自直接写入（默认模式）
+  writer  - 写入经由单一写连接，读取使用只读连接池（SQLITE_WRITER_MODE）
+  queue   - 在 writer 模式基础上，通过 SQLiteWriteQueue 将写入合并为批量事务
+
+用法: python scripts/benchmark_sqlite_writer.py [--writers 8] [--writes 200] [--readers 4]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.database import Base
+from app.core.database.sqlite_writer import SQLiteWriteQueue, make_routing_session
+from app.models.member import Member, SocialProfile, Activity
+
+BUSY_TIMEOUT_MS = 5000
+
+
+def _make_engine(url: str, pool_size: int, read_only: bool = False):
+    engine = create_engine(url, pool_size=pool_size, max_overflow=0, pool_timeout=60)
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    return engine
+
+
+def _activity_row(writer: int, i: int, profile: SocialProfile) -> dict:
+    return {
+        "member_id": profile.member_id,
+        "social_profile_id": profile.id,
+        "platform": "github",
+        "activity_type": "push",
+        "title": f"writer {writer} event {i}",
+        "content": "x" * 200,
+        "content_preview": "x" * 200,
+        "content_length": 200,
+        "external_id": f"bench-{writer}-{i}",
+    }
+
+
+def run_mode(mode: str, writers: int, writes: int, readers: int) -> dict:
+    """Run one mixed read/write workload and return its measurements."""
+    workdir = tempfile.mkdtemp(prefix="inspector-bench-")
+    url = f"sqlite:///{workdir}/bench.db"
+
+    if mode == "shared":
+        write_engine = read_engine = _make_engine(url, pool_size=writers + readers)
+        Session = sessionmaker(bind=write_engine)
+    else:
+        write_engine = _make_engine(url, pool_size=1)
+        read_engine = _make_engine(url, pool_size=readers, read_only=True)
+        Session = sessionmaker(class_=make_routing_session(write_engine, read_engine))
+
+    Base.metadata.create_all(bind=write_engine)
+    with sessionmaker(bind=write_engine)() as db:
+        member = Member(name="Bench", email="bench@example.com")
+        db.add(member)
+        db.flush()
+        profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/bench")
+        db.add(profile)
+        db.commit()
+        db.refresh(profile)
+        db.expunge(profile)
+
+    write_queue = SQLiteWriteQueue(write_engine) if mode == "queue" else None
+    if write_queue:
+        write_queue.start()
+
+    latencies = []
+    errors = []
+    reads = [0]
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def writer_loop(writer: int):
+        for i in range(writes):
+            row = _activity_row(writer, i, profile)
+            start = time.perf_counter()
+            try:
+                if write_queue:
+                    write_queue.submit(lambda conn, row=row: conn.execute(Activity.__table__.insert(), row)).result()
+                else:
+                    with Session() as db:
+                        db.add(Activity(**row))
+                        db.commit()
+            except OperationalError as e:
+                with lock:
+                    errors.append(str(e.orig))
+                continue
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    def reader_loop():
+        while not done.is_set():
+            with Session() as db:
+                db.execute(select(func.count(Activity.id))).scalar()
+                db.query(Activity).order_by(Activity.id.desc()).limit(20).all()
+            with lock:
+                reads[0] += 1
+
+    reader_threads = [threading.Thread(target=reader_loop) for _ in range(readers)]
+    writer_threads = [threading.Thread(target=writer_loop, args=(w,)) for w in range(writers)]
+    for t in reader_threads:
+        t.start()
+
+    start = time.perf_counter()
+    for t in writer_threads:
+        t.start()
+    for t in writer_threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    for t in reader_threads:
+        t.join()
+
+    result = {
+        "mode": mode,
+        "writes": len(latencies),
+        "errors": len(errors),
+        "writes_per_sec": len(latencies) / elapsed,
+        "reads_per_sec": reads[0] / elapsed,
+        "p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "p95_ms": statistics.quantiles(latencies, n=20)[18] if len(latencies) > 1 else 0.0,
+    }
+    if write_queue:
+        write_queue.stop()
+        result["avg_batch"] = write_queue.stats()["avg_batch_size"]
+
+    write_engine.dispose()
+    read_engine.dispose()
+    return result
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="SQLite 写入吞吐基准测试")
+    parser.add_argument("--writers", type=int, default=8, help="并发写线程数")
+    parser.add_argument("--writes", type=int, default=200, help="每个写线程的写入次数")
+    parser.add_argument("--readers", type=int, default=4, help="并发读线程数")
+    parser.add_argument("--modes", default="shared,writer,queue", help="要测试的模式（逗号分隔）")
+    args = parser.parse_args()
+
+    print("📊 SQLite 写入吞吐基准测试")
+    print(f"写线程: {args.writers} x {args.writes}，读线程: {args.readers}")
+    print("=" * 86)
+    print(f"{'mode':<8} {'writes':>7} {'errors':>7} {'writes/s':>10} {'reads/s':>10} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'avg batch':>10}")
+
+    for mode in args.modes.split(","):
+        r = run_mode(mode.strip(), args.writers, args.writes, args.readers)
+        print(f"{r['mode']:<8} {r['writes']:>7} {r['errors']:>7} {r['writes_per_sec']:>10.1f} "
+              f"{r['reads_per_sec']:>10.1f} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} "
+              f"{r.get('avg_batch', '-'):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+活动文本去重迁移工具
+
+将重复出现的活动标题和内容移入按 SHA-256 寻址的 content_blobs 表，
+并报告节省的空间。仅支持 SQLite。
+
+用法: python scripts/fold_activity_text.py [--min-occurrences 2] [--min-length 16] [--vacuum]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import text
+
+from app.core.database.database import engine, init_db
+from app.core.database.content_blobs import fold_repeated_activity_text
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="活动文本去重迁移工具")
+    parser.add_argument("--min-occurrences", type=int, default=2, help="文本至少重复出现的次数")
+    parser.add_argument("--min-length", type=int, default=None, help="参与去重的最短文本长度")
+    parser.add_argument("--vacuum", action="store_true", help="迁移后执行 VACUUM 以缩小数据库文件")
+    args = parser.parse_args()
+
+    print("🗜️  活动文本去重")
+    print("=" * 50)
+
+    init_db()
+    report = fold_repeated_activity_text(
+        engine,
+        min_occurrences=args.min_occurrences,
+        min_length=args.min_length
+    )
+
+    print(f"标题改为引用共享文本的行数: {report['rows_updated']['title']}")
+    print(f"内容改为引用共享文本的行数: {report['rows_updated']['content']}")
+    print(f"新建共享文本块: {report['blobs_created']}")
+    print(f"文本大小: {_format_bytes(report['text_bytes_before'])} -> {_format_bytes(report['text_bytes_after'])}")
+    print(f"✅ 节省: {_format_bytes(report['bytes_saved'])}")
+
+    if args.vacuum:
+        with engine.connect() as conn:
+            conn.execute(text("VACUUM"))
+        print("✅ 已执行 VACUUM，空闲页已归还文件系统")
+    else:
+        print(f"可回收空间: {_format_bytes(report['reclaimable_bytes'])}（使用 --vacuum 回收）")
+
+
+if __name__ == "__main__":
+    main()
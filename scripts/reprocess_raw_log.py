@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+原始响应日志重放工具
+
+监控抓取到的 GitHub / LinkedIn 原始响应会追加写入压缩的分段日志。
+修复解析器或新增字段后，可以用当前解析器重新解析日志并更新活动，
+无需重新请求有速率限制的平台 API。
+
+用法:
+  python scripts/reprocess_raw_log.py reprocess [--start 2026-01-01] [--end 2026-02-01] [--platform github] [--profile 3] [--workers 4] [--queue-new]
+  python scripts/reprocess_raw_log.py reindex
+  python scripts/reprocess_raw_log.py segments
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.database.database import SessionLocal, init_db
+from app.services.raw_log.reprocess import rebuild_index, reprocess
+from app.services.raw_log.segment_log import raw_payload_log
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def run_reprocess(args):
+    """重新解析并更新活动"""
+    print("🔁 重新解析原始响应...")
+    db = SessionLocal()
+    try:
+        stats = reprocess(
+            db, start=args.start, end=args.end, platform=args.platform,
+            profile_id=args.profile, workers=args.workers, queue_new=args.queue_new
+        )
+    finally:
+        db.close()
+    print(f"原始响应: {stats['payloads']} 条，解析失败: {stats['parse_errors']} 条")
+    print(f"✅ 新增活动 {stats['activities_created']} 条，更新活动 {stats['activities_updated']} 条")
+
+
+def run_reindex(args):
+    """从分段文件重建索引"""
+    print("🗂️  扫描分段文件重建索引...")
+    db = SessionLocal()
+    try:
+        count = rebuild_index(db)
+    finally:
+        db.close()
+    print(f"✅ 已索引 {count} 条原始响应")
+
+
+def run_segments(args):
+    """列出分段文件"""
+    segments = raw_payload_log.segments()
+    if not segments:
+        print(f"{raw_payload_log.directory} 中没有分段文件")
+        return
+    for segment in segments:
+        path = raw_payload_log.segment_path(segment)
+        print(f"{path.name}  {_format_bytes(path.stat().st_size):>10}")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="原始响应日志重放工具")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reprocess_parser = subparsers.add_parser("reprocess", help="用当前解析器重新解析并更新活动")
+    reprocess_parser.add_argument("--start", type=datetime.fromisoformat, help="抓取时间起点 (UTC)")
+    reprocess_parser.add_argument("--end", type=datetime.fromisoformat, help="抓取时间终点 (UTC，不含)")
+    reprocess_parser.add_argument("--platform", help="只处理指定平台")
+    reprocess_parser.add_argument("--profile", type=int, help="只处理指定社交账号 ID")
+    reprocess_parser.add_argument("--workers", type=int, help="解析进程数 (0 = CPU 核数，1 = 不使用子进程)")
+    reprocess_parser.add_argument(
+        "--queue-new", action="store_true",
+        help="新增的活动进入处理队列（发送通知等）；默认视为已处理"
+    )
+    reprocess_parser.set_defaults(func=run_reprocess)
+
+    reindex_parser = subparsers.add_parser("reindex", help="从分段文件重建索引")
+    reindex_parser.set_defaults(func=run_reindex)
+
+    segments_parser = subparsers.add_parser("segments", help="列出分段文件")
+    segments_parser.set_defaults(func=run_segments)
+
+    args = parser.parse_args()
+    print("📼 Inspector 原始响应日志工具")
+    print("=" * 50)
+    init_db()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,12 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.monitors.github_monitor import GitHubMonitor
-from app.core.database.database import SessionLocal
+from app.core.database.database import AsyncSessionLocal
 from app.models.member import SocialProfile
 
 async def test_time_based_monitoring():
     """测试不同时间范围的监控效果"""
-    db = SessionLocal()
+    db = AsyncSessionLocal()
     
     try:
         # 创建测试用的 GitHub 监控器
@@ -74,7 +74,7 @@ async def test_time_based_monitoring():
     except Exception as e:
         print(f"❌ 测试失败: {e}")
     finally:
-        db.close()
+        await db.close()
 
 if __name__ == "__main__":
     asyncio.run(test_time_based_monitoring())
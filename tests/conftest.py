@@ -0,0 +1,71 @@
+"""Shared pytest fixtures.
+
+Points the application at a throwaway SQLite database before any ``app``
+module is imported, so tests never touch ``./inspector.db``.
+"""
+
+import os
+import tempfile
+
+_test_db_dir = tempfile.mkdtemp(prefix="inspector-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_test_db_dir}/inspector.db"
+
+import pytest
+
+
+@pytest.fixture
+def db():
+    """Database session on a freshly emptied schema."""
+    from app.core.database.database import SessionLocal, init_db
+    from app.models.member import Activity, Summary, SocialProfile, Member, ContentBlob, RawPayload, SummaryCacheEntry
+
+    init_db()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        for model in (Activity, ContentBlob, Summary, SummaryCacheEntry, RawPayload, SocialProfile, Member):
+            session.query(model).delete()
+        session.commit()
+        session.close()
+
+
+class QueryCounter:
+    """Counts SQL statements executed on the application engine."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def reset(self):
+        self.count = 0
+
+
+@pytest.fixture
+def query_counter(db):
+    """Attach a ``QueryCounter`` to the sync and async application engines."""
+    from sqlalchemy import event
+    from app.core.database.database import engine, async_engine
+
+    counter = QueryCounter()
+    engines = (engine, async_engine.sync_engine)
+    for db_engine in engines:
+        event.listen(db_engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        for db_engine in engines:
+            event.remove(db_engine, "before_cursor_execute", counter)
+
+
+@pytest.fixture
+def client(db):
+    """Test client for the FastAPI application."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,163 @@
+"""Tests for the unprocessed-activity queue and pipeline."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.api.v1 import notifications
+from app.core.database import database
+from app.core.database.database import AsyncSessionLocal, Base, async_engine, engine
+from app.core.database.migrations import upgrade_schema
+from app.models.member import Member, SocialProfile, Activity
+from app.core.database.sqlite_writer import SQLiteWriteQueue
+from app.services.processing.activity_queue import ActivityPipeline, ActivityQueue
+
+
+def _seed(db, count=5):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    for i in range(count):
+        db.add(Activity(
+            member_id=member.id, social_profile_id=profile.id, platform="github",
+            activity_type="push", title=f"Push {i}", external_id=f"queue_{i}"
+        ))
+    db.commit()
+
+
+def _run(coro_fn):
+    async def main():
+        try:
+            async with AsyncSessionLocal() as session:
+                return await coro_fn(session)
+        finally:
+            await async_engine.dispose()
+    return asyncio.run(main())
+
+
+def test_claims_are_exclusive_until_the_lease_expires(db):
+    _seed(db)
+
+    async def scenario(session):
+        queue = ActivityQueue(session, lease_seconds=60)
+        first = await queue.claim(3)
+        second = await queue.claim(3)
+        await session.execute(
+            Activity.__table__.update().values(claimed_at=datetime.utcnow() - timedelta(minutes=5))
+            .where(Activity.id == first[0].id)
+        )
+        await session.commit()
+        reclaimed = await queue.claim(3)
+        await queue.complete([r.id for r in first + second])
+        return first, second, reclaimed, await queue.stats()
+
+    first, second, reclaimed, stats = _run(scenario)
+    assert [r.title for r in first] == ["Push 0", "Push 1", "Push 2"]
+    assert [r.title for r in second] == ["Push 3", "Push 4"]
+    assert first[0].member_name == "Alice"
+    assert [r.id for r in reclaimed] == [first[0].id]
+    assert stats["pending"] == 0
+
+
+def test_pipeline_marks_processed_and_releases_failed_batches(db):
+    _seed(db)
+    seen = []
+    pipeline = ActivityPipeline()
+
+    async def collect(records, session):
+        seen.extend(r.title for r in records)
+
+    async def fail(records, session):
+        raise RuntimeError("stage failed")
+
+    async def scenario(session):
+        failing = ActivityPipeline()
+        failing.register("fail", fail)
+        with pytest.raises(RuntimeError):
+            await failing.run(session, batch_size=2)
+        after_failure = await ActivityQueue(session).stats()
+
+        pipeline.register("collect", collect)
+        return after_failure, await pipeline.run(session, batch_size=2)
+
+    after_failure, result = _run(scenario)
+    assert (after_failure["pending"], after_failure["claimed"]) == (5, 0)
+    assert seen == [f"Push {i}" for i in range(5)]
+    assert (result["batches"], result["activities"]) == (3, 5)
+    assert db.query(Activity).filter(Activity.is_processed == False).count() == 0
+
+
+def test_writer_mode_sends_claims_and_completions_through_the_write_queue(db, monkeypatch):
+    _seed(db)
+    write_queue = SQLiteWriteQueue(engine)
+    write_queue.start()
+    monkeypatch.setattr(database, "sqlite_writer_mode", True)
+    monkeypatch.setattr(database, "get_write_queue", lambda: write_queue)
+
+    async def scenario(session):
+        return await ActivityPipeline().run(session, batch_size=2)
+
+    try:
+        result = _run(scenario)
+    finally:
+        write_queue.stop()
+    assert (result["batches"], result["activities"]) == (3, 5)
+    # Three claims and completions, plus the claim that found the queue empty
+    assert write_queue.stats()["jobs"] == 7
+    assert db.query(Activity).filter(Activity.is_processed == False).count() == 0
+
+
+def test_claim_uses_partial_index():
+    with engine.connect() as conn:
+        plan = conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM activities WHERE is_processed = 0 ORDER BY id LIMIT 10"
+        )).fetchall()
+    assert any("ix_activities_unprocessed" in row[-1] for row in plan)
+
+
+def test_upgrade_leaves_existing_activities_out_of_the_pipeline(tmp_path, monkeypatch):
+    legacy = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    Base.metadata.create_all(bind=legacy)
+    with legacy.begin() as conn:
+        # Schema from before the pipeline: is_processed existed, but nothing set it
+        conn.execute(text("ALTER TABLE activities DROP COLUMN claimed_at"))
+        conn.execute(text("INSERT INTO members (id, name, email) VALUES (1, 'Alice', 'alice@example.com')"))
+        conn.execute(text(
+            "INSERT INTO social_profiles (id, member_id, platform, profile_url) "
+            "VALUES (1, 1, 'github', 'https://github.com/alice')"
+        ))
+        for i in range(3):
+            conn.execute(text(
+                "INSERT INTO activities (member_id, social_profile_id, platform, title, external_id, is_processed) "
+                f"VALUES (1, 1, 'github', 'Old {i}', 'legacy_{i}', 0)"
+            ))
+
+    assert upgrade_schema(legacy, Base.metadata) == ["activities.claimed_at"]
+    with legacy.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO activities (member_id, social_profile_id, platform, title, external_id, is_processed) "
+            "VALUES (1, 1, 'github', 'New', 'legacy_new', 0)"
+        ))
+    legacy.dispose()
+
+    monkeypatch.setattr(notifications, "notifications", [])
+    pipeline = ActivityPipeline()
+    pipeline.register("notifications", notifications.notify_new_activities)
+
+    async def main():
+        legacy_async = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/legacy.db")
+        try:
+            async with AsyncSession(legacy_async) as session:
+                return await pipeline.run(session)
+        finally:
+            await legacy_async.dispose()
+
+    result = asyncio.run(main())
+    assert result["activities"] == 1
+    assert [n.data["activity_id"] for n in notifications.notifications] == [4]
@@ -0,0 +1,91 @@
+"""Tests for full-text activity search."""
+
+from datetime import datetime, timedelta
+
+from app.models.member import Member, SocialProfile, Activity
+
+
+def _seed(db):
+    alice = Member(name="Alice", email="alice@example.com")
+    bob = Member(name="Bob", email="bob@example.com")
+    db.add_all([alice, bob])
+    db.flush()
+
+    alice_gh = SocialProfile(member_id=alice.id, platform="github", profile_url="https://github.com/alice")
+    bob_gh = SocialProfile(member_id=bob.id, platform="github", profile_url="https://github.com/bob")
+    db.add_all([alice_gh, bob_gh])
+    db.flush()
+
+    now = datetime.utcnow()
+    rows = [
+        (alice, alice_gh, "Fix websocket reconnect", "Reconnect websocket after timeout", now),
+        (alice, alice_gh, "Pushed 2 commits to org/api", "websocket cleanup", now - timedelta(days=3)),
+        (bob, bob_gh, "Update README", "Docs only", now),
+        (bob, bob_gh, "Websocket load test", "Added a benchmark", now),
+    ]
+    for i, (member, profile, title, content, created_at) in enumerate(rows):
+        db.add(Activity(
+            member_id=member.id,
+            social_profile_id=profile.id,
+            platform="github",
+            activity_type="push",
+            title=title,
+            content=content,
+            external_id=f"github_search_{i}",
+            created_at=created_at
+        ))
+    db.commit()
+    return alice, bob
+
+
+def test_search_ranks_and_highlights(client, db):
+    _seed(db)
+
+    response = client.get("/api/v1/monitoring/activities/search", params={"q": "websocket"})
+    assert response.status_code == 200
+    items = response.json()["items"]
+
+    assert len(items) == 3
+    # Title matches are weighted above content-only matches
+    assert items[-1]["activity"]["title"] == "Pushed 2 commits to org/api"
+    assert "<mark>websocket</mark>" in items[-1]["content_snippet"]
+    assert all("<mark>" in item["title_highlight"] for item in items[:2])
+
+
+def test_search_filters_and_cursor(client, db):
+    alice, _ = _seed(db)
+
+    response = client.get("/api/v1/monitoring/activities/search", params={
+        "q": "websocket",
+        "member_id": alice.id,
+        "start_date": (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
+    })
+    items = response.json()["items"]
+    assert [item["activity"]["title"] for item in items] == ["Fix websocket reconnect"]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"q": "websocket", "limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/v1/monitoring/activities/search", params=params).json()
+        seen.extend(item["activity"]["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 3
+
+
+def test_search_tracks_updates_and_rejects_bad_input(client, db):
+    _seed(db)
+
+    activity = db.query(Activity).filter(Activity.title == "Update README").first()
+    activity.title = "Update websocket README"
+    db.commit()
+
+    response = client.get("/api/v1/monitoring/activities/search", params={"q": "websock*"})
+    assert len(response.json()["items"]) == 4
+
+    response = client.get("/api/v1/monitoring/activities/search", params={"q": "x", "cursor": "nope"})
+    assert response.status_code == 400
@@ -0,0 +1,106 @@
+"""Tests for the async engine, async routes and async monitors."""
+
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from app.api.v1.monitoring import stream_bilingual_content
+from app.core.database.database import AsyncSessionLocal, async_engine, to_async_url
+from app.models.member import Member, SocialProfile, Activity
+from app.services.monitors.base_monitor import BaseMonitor
+from app.services.summarizers.llm_backend import LLMBackend
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+
+
+class StubMonitor(BaseMonitor):
+    """Monitor returning a fixed set of raw activities."""
+
+    def get_platform_name(self) -> str:
+        return "github"
+
+    def can_monitor(self, profile: SocialProfile) -> bool:
+        return True
+
+    async def fetch_activities(self, profile: SocialProfile):
+        return [{"id": "evt-1"}, {"id": "evt-2"}]
+
+    def parse_activity(self, raw_activity):
+        return {
+            "activity_type": "push",
+            "title": raw_activity["id"],
+            "content": "commit",
+            "external_id": f"stub_{raw_activity['id']}"
+        }
+
+
+def test_async_url_uses_async_drivers():
+    assert to_async_url("sqlite:///./inspector.db") == "sqlite+aiosqlite:///./inspector.db"
+    assert to_async_url("postgresql://u:p@db/inspector") == "postgresql+asyncpg://u:p@db/inspector"
+
+
+def test_monitor_profile_inserts_each_activity_once(db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    db.add(SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice"))
+    db.commit()
+
+    async def run():
+        async with AsyncSessionLocal() as session:
+            profile = await session.scalar(select(SocialProfile))
+            monitor = StubMonitor(session)
+            first = await monitor.monitor_profile(profile)
+            second = await monitor.monitor_profile(profile)
+            total = await session.scalar(select(func.count(Activity.id)))
+            checked = profile.last_checked
+        await async_engine.dispose()
+        return first, second, total, checked
+
+    first, second, total, checked = asyncio.run(run())
+    assert [activity.id is not None for activity in first] == [True, True]
+    assert second == []
+    assert total == 2
+    assert checked is not None
+
+
+def test_stats_endpoint_reads_through_async_session(client):
+    client.post("/api/v1/members/", json={"name": "Bob", "email": "bob@example.com"})
+
+    stats = client.get("/api/v1/monitoring/stats").json()
+    assert stats["total_members"] == 1
+    assert stats["active_members"] == 1
+    assert stats["total_activities"] == 0
+
+
+class PoolWatchingBackend(LLMBackend):
+    """Streams a fixed reply, recording checked-out connections meanwhile."""
+
+    def __init__(self):
+        super().__init__("sk-test", "http://llm.test", "stub")
+        self.checked_out = []
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        return "summary"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        self.checked_out.append(async_engine.pool.checkedout())
+        yield "summary"
+
+
+def test_streaming_generation_returns_its_connection(db):
+    backend = PoolWatchingBackend()
+
+    async def run():
+        async with AsyncSessionLocal() as session:
+            await session.scalar(select(func.count(Member.id)))
+            summarizer = LLMSummarizer(session, llm=backend)
+            day = datetime(2026, 1, 1)
+            contents = {}
+            async for _ in stream_bilingual_content(summarizer, [], "daily", day, day, contents):
+                pass
+        await async_engine.dispose()
+        return contents
+
+    assert asyncio.run(run()) == {"chinese": "summary", "english": "summary"}
+    assert backend.checked_out == [0, 0]
@@ -0,0 +1,115 @@
+"""Tests for concurrent bilingual summary generation."""
+
+import asyncio
+import json
+import time
+from datetime import datetime
+
+from app.api.v1 import monitoring
+from app.models.member import Member, SocialProfile, Activity, Summary
+from app.services.summarizers import llm_summarizer
+from app.services.summarizers.llm_backend import LLMBackend
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+
+
+class SlowBackend(LLMBackend):
+    """Answers in the prompt's language after a fixed delay per call / chunk."""
+
+    def __init__(self, delay):
+        super().__init__("sk-test", "http://llm.test", "stub")
+        self.delay = delay
+
+    @staticmethod
+    def _language(messages):
+        return "zh" if "中文" in messages[0]["content"] else "en"
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        await asyncio.sleep(self.delay)
+        return f"summary-{self._language(messages)}"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        for i in range(3):
+            await asyncio.sleep(self.delay)
+            yield f"{self._language(messages)}{i} "
+
+
+def test_summary_content_generates_languages_concurrently():
+    summarizer = LLMSummarizer(db=None, llm=SlowBackend(0.3))
+    member = Member(id=1, name="Alice", position="Engineer")
+
+    start = time.perf_counter()
+    content = asyncio.run(summarizer._generate_member_summary_content(
+        member, [Activity(platform="github", activity_type="push", title="Push", created_at=datetime.utcnow())],
+        datetime(2026, 1, 1), datetime(2026, 1, 2)
+    ))
+    elapsed = time.perf_counter() - start
+
+    assert content == {"chinese": "summary-zh", "english": "summary-en"}
+    assert elapsed < 0.55
+
+
+def test_stream_endpoint_multiplexes_languages(db, client, monkeypatch):
+    monkeypatch.setattr(llm_summarizer, "get_llm_backend", lambda: SlowBackend(0.02))
+    monkeypatch.setattr(monitoring, "get_llm_backend", lambda: SlowBackend(0.02))
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    db.add(Activity(member_id=member.id, social_profile_id=profile.id, platform="github",
+                    activity_type="push", title="Push", external_id="bilingual_1"))
+    db.commit()
+
+    response = client.post("/api/v1/monitoring/generate-daily-summary-stream")
+    events = [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+    chunk_languages = [e["language"] for e in events if e["type"] == "content_chunk"]
+    assert sorted(chunk_languages) == ["chinese"] * 3 + ["english"] * 3
+    assert chunk_languages != sorted(chunk_languages)  # interleaved, not one language after the other
+    assert [e["language"] for e in events if e["type"] == "content_start"] == ["chinese", "english"]
+    assert events[-1]["type"] == "complete"
+    summary = db.query(Summary).one()
+    assert (summary.content, summary.content_en) == ("zh0 zh1 zh2 ", "en0 en1 en2 ")
+
+
+class RecordingBackend(LLMBackend):
+    """Replies from a script and records each call's options."""
+
+    def __init__(self, replies):
+        super().__init__("sk-test", "http://llm.test", "stub")
+        self.replies = list(replies)
+        self.calls = []
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        self.calls.append({"system": messages[0]["content"], **options})
+        return self.replies.pop(0)
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        yield ""
+
+
+def _messages(language):
+    return [{"role": "system", "content": language}, {"role": "user", "content": "data"}]
+
+
+def test_language_strategies(monkeypatch):
+    def run(strategy, backend):
+        monkeypatch.setattr(llm_summarizer.settings, "summary_language_strategy", strategy)
+        summarizer = LLMSummarizer(db=None, llm=backend)
+        generate = lambda language: summarizer._complete(_messages(language), f"{language} test summary")
+        return asyncio.run(summarizer._generate_bilingual_content(generate, _messages, "test summary"))
+
+    structured = RecordingBackend([json.dumps({"content": "中文", "content_en": "English"})])
+    assert run("structured", structured) == {"chinese": "中文", "english": "English"}
+    assert [call.get("json_mode") for call in structured.calls] == [True]
+
+    monkeypatch.setattr(llm_summarizer.settings, "summary_translation_model", "cheap-model")
+    translate = RecordingBackend(["中文", "English"])
+    assert run("translate", translate) == {"chinese": "中文", "english": "English"}
+    assert translate.calls[1]["system"] == llm_summarizer.TRANSLATION_SYSTEM_PROMPT
+    assert translate.calls[1]["model"] == "cheap-model"
+
+    fallback = RecordingBackend(["not json", "中文", "English"])
+    assert run("structured", fallback) == {"chinese": "中文", "english": "English"}
+    assert len(fallback.calls) == 3
@@ -0,0 +1,83 @@
+"""Tests for content-addressed activity text."""
+
+from sqlalchemy import text
+
+from app.core.config.settings import settings
+from app.core.database.content_blobs import (
+    enable_activity_text_dedup, fold_repeated_activity_text
+)
+from app.core.database.database import engine
+from app.models.member import Member, SocialProfile, Activity
+
+REPEATED_TITLE = "GitHub activity: WatchEvent"
+REPEATED_CONTENT = "Merge branch 'main' into feature/search " * 5
+
+
+def _profile(db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    return profile
+
+
+def _activity(profile, i, content=REPEATED_CONTENT, title=REPEATED_TITLE):
+    return Activity(
+        member_id=profile.member_id,
+        social_profile_id=profile.id,
+        platform="github",
+        activity_type="watch",
+        title=title,
+        content=content,
+        external_id=f"blob_{i}"
+    )
+
+
+def test_fold_moves_repeated_text_and_keeps_accessors(db, client):
+    profile = _profile(db)
+    for i in range(3):
+        db.add(_activity(profile, i))
+    db.add(_activity(profile, 99, content="unique commit message", title="unique title"))
+    db.commit()
+
+    report = fold_repeated_activity_text(engine)
+    assert report["rows_updated"] == {"title": 3, "content": 3}
+    assert report["blobs_created"] == 2
+    assert report["bytes_saved"] > 0
+
+    db.expire_all()
+    activities = db.query(Activity).order_by(Activity.id).all()
+    assert [a.stored_content for a in activities[:3]] == [None, None, None]
+    assert all(a.content == REPEATED_CONTENT and a.title == REPEATED_TITLE for a in activities[:3])
+    assert activities[3].stored_content == "unique commit message"
+
+    # SQL expressions and full-text search see folded text too
+    assert db.query(Activity).filter(Activity.title == REPEATED_TITLE).count() == 3
+    hits = client.get("/api/v1/monitoring/activities/search", params={"q": "feature"}).json()
+    assert len(hits["items"]) == 3
+    assert hits["items"][0]["activity"]["content"] == REPEATED_CONTENT
+
+
+def test_new_activities_point_at_known_blobs(db, monkeypatch):
+    monkeypatch.setattr(settings, "activity_text_dedup", True)
+    assert enable_activity_text_dedup(engine)
+
+    profile = _profile(db)
+    db.add_all([_activity(profile, 0), _activity(profile, 1)])
+    db.commit()
+    fold_repeated_activity_text(engine)
+
+    activity = _activity(profile, 2)
+    db.add(activity)
+    db.commit()
+
+    row = db.execute(
+        text("SELECT title, content, content_blob_id FROM activities WHERE id = :id"),
+        {"id": activity.id}
+    ).first()
+    assert row.title is None and row.content is None
+    assert row.content_blob_id is not None
+    assert activity.content == REPEATED_CONTENT
+    assert activity.content_preview is not None
@@ -0,0 +1,72 @@
+"""Tests for structured GitHub event columns."""
+
+from datetime import datetime
+
+from sqlalchemy import create_engine, inspect, text
+
+from app.core.database.database import Base
+from app.core.database.migrations import upgrade_schema
+from app.models.member import Member, SocialProfile, Activity
+from app.services.monitors.github_monitor import GitHubMonitor
+
+NOW = datetime.utcnow().isoformat() + "Z"
+
+EVENTS = [
+    {
+        "id": "1", "type": "PushEvent", "created_at": NOW, "repo": {"name": "acme/api"},
+        "payload": {"ref": "refs/heads/main", "size": 25, "commits": [{"message": "fix"}] * 20},
+    },
+    {
+        "id": "2", "type": "PullRequestEvent", "created_at": NOW, "repo": {"name": "acme/web"},
+        "payload": {"action": "opened", "pull_request": {"number": 7, "title": "Add login", "head": {"ref": "login"}}},
+    },
+]
+
+
+def test_github_events_fill_structured_columns(db, client):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+
+    monitor = GitHubMonitor(db)
+    for raw in monitor._parse_github_events(EVENTS, "alice"):
+        db.add(Activity(
+            member_id=member.id, social_profile_id=profile.id, platform="github",
+            **monitor.parse_activity(raw)
+        ))
+    db.commit()
+
+    push = db.query(Activity).filter(Activity.external_id == "github_1").one()
+    assert (push.repo_full_name, push.commit_count, push.ref, push.event_action) == (
+        "acme/api", 25, "refs/heads/main", None
+    )
+    assert push.raw_payload["size"] == 25
+
+    items = client.get("/api/v1/monitoring/activities", params={"repo": "acme/web", "action": "opened"}).json()
+    assert [item["external_id"] for item in items] == ["github_2"]
+    assert items[0]["ref"] == "login"
+    assert "raw_payload" not in items[0]
+
+
+def test_upgrade_schema_backfills_repo_from_url(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE activities (id INTEGER PRIMARY KEY, member_id INTEGER, social_profile_id INTEGER, "
+            "platform VARCHAR(50), url VARCHAR(500))"
+        ))
+        conn.execute(text(
+            "INSERT INTO activities (platform, url) VALUES "
+            "('github', 'https://github.com/acme/api'), ('linkedin', 'https://linkedin.com/x')"
+        ))
+
+    upgrade_schema(engine, Base.metadata)
+
+    with engine.connect() as conn:
+        repos = conn.execute(text("SELECT repo_full_name FROM activities ORDER BY id")).scalars().all()
+    assert repos == ["acme/api", None]
+    index_columns = [index["column_names"] for index in inspect(engine).get_indexes("activities")]
+    assert ["repo_full_name"] in index_columns
@@ -0,0 +1,83 @@
+"""Tests for preview-only list endpoints and stored previews."""
+
+from sqlalchemy import create_engine, text
+
+from app.core.database.database import Base
+from app.core.database.migrations import upgrade_schema
+from app.models.member import Member, SocialProfile, Activity, Summary, PREVIEW_LENGTH
+
+
+def test_activity_list_returns_preview_and_detail_returns_body(client, db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    body = "x" * 5000
+    activity = Activity(
+        member_id=member.id,
+        social_profile_id=profile.id,
+        platform="github",
+        activity_type="push",
+        title="Big push",
+        content=body,
+        external_id="github_preview_1"
+    )
+    db.add(activity)
+    db.commit()
+
+    items = client.get("/api/v1/monitoring/activities").json()
+    assert len(items) == 1
+    assert "content" not in items[0]
+    assert items[0]["content_length"] == 5000
+    assert len(items[0]["content_preview"]) == PREVIEW_LENGTH
+
+    detail = client.get(f"/api/v1/monitoring/activities/{activity.id}").json()
+    assert detail["content"] == body
+
+
+def test_summary_list_previews_per_language(client, db):
+    summary = Summary(
+        title="Daily",
+        content="中" * 1000,
+        content_en="short english",
+        summary_type="daily"
+    )
+    db.add(summary)
+    db.commit()
+
+    for url in ("/api/v1/summaries/", "/api/v1/monitoring/summaries"):
+        items = client.get(url, params={"language": "english"}).json()
+        assert items[0]["content_preview"] == "short english"
+        assert items[0]["has_english"] is True
+        assert "content" not in items[0]
+
+        items = client.get(url).json()
+        assert items[0]["content_length"] == 1000
+
+    detail = client.get(f"/api/v1/summaries/{summary.id}", params={"language": "english"}).json()
+    assert detail["content"] == "short english"
+
+
+def test_upgrade_schema_adds_and_backfills_preview_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE summaries (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, "
+            "content TEXT NOT NULL, content_en TEXT, summary_type VARCHAR(50))"
+        ))
+        conn.execute(text(
+            "INSERT INTO summaries (title, content, content_en) VALUES ('t', :content, NULL)"
+        ), {"content": "a" * 400})
+
+    added = upgrade_schema(engine, Base.metadata)
+    assert "summaries.content_preview" in added
+
+    with engine.connect() as conn:
+        row = conn.execute(text(
+            "SELECT content_preview, content_length, content_en_length FROM summaries"
+        )).one()
+    assert len(row.content_preview) == PREVIEW_LENGTH
+    assert row.content_length == 400
+    assert row.content_en_length == 0
@@ -0,0 +1,79 @@
+"""Tests for the async LLM backends."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import httpx
+
+from app.services.summarizers import llm_backend
+from app.services.summarizers.llm_backend import DashScopeBackend, OpenAIBackend, get_http_client
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+
+DAY = datetime(2026, 1, 1)
+
+
+def _install_stub(monkeypatch, delay=0.0):
+    """Make the shared client (for the running loop) talk to an in-process OpenAI-compatible stub."""
+    requests = []
+
+    async def handler(request):
+        body = json.loads(request.content)
+        requests.append(body)
+        await asyncio.sleep(delay)
+        if body.get("stream"):
+            lines = [
+                f"data: {json.dumps({'choices': [{'delta': {'content': word}}]})}\n\n"
+                for word in ("Hello", " world")
+            ] + ["data: [DONE]\n\n"]
+            return httpx.Response(200, headers={"content-type": "text/event-stream"}, content="".join(lines))
+        return httpx.Response(200, json={
+            "id": "1", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "Summary"}}],
+        })
+
+    monkeypatch.setattr(llm_backend, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(llm_backend, "_http_client_loop", asyncio.get_running_loop())
+    return requests
+
+
+def test_generation_does_not_block_the_event_loop(monkeypatch):
+    summarizer = LLMSummarizer(db=None, llm=OpenAIBackend("sk-test", "http://llm.test/v1", "stub-model"))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def main():
+        requests = _install_stub(monkeypatch, delay=0.2)
+        task = asyncio.create_task(ticker())
+        contents = await asyncio.gather(*[
+            summarizer._generate_language_content([], "daily", DAY, DAY, language)
+            for language in ("chinese", "english")
+        ])
+        task.cancel()
+        return contents, requests
+
+    contents, requests = asyncio.run(main())
+    assert contents == ["Summary", "Summary"]
+    assert ticks >= 10
+    assert [r["model"] for r in requests] == ["stub-model", "stub-model"]
+
+
+def test_dashscope_stream_shares_the_pooled_client(monkeypatch):
+    backend = DashScopeBackend("sk-test", "https://dashscope.aliyuncs.com/compatible-mode/v1/chat/completions", "qwen")
+    summarizer = LLMSummarizer(db=None, llm=backend)
+
+    async def main():
+        _install_stub(monkeypatch)
+        first = get_http_client()
+        chunks = [c async for c in summarizer._generate_language_content_stream_generator([], "daily", DAY, DAY, "english")]
+        streamed = await summarizer._generate_language_content_stream([], "daily", DAY, DAY, "chinese")
+        assert get_http_client() is first
+        await llm_backend.close_http_client()
+        return chunks, streamed
+
+    assert asyncio.run(main()) == (["Hello", " world"], "Hello world")
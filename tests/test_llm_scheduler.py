@@ -0,0 +1,130 @@
+"""Tests for the LLM request scheduler."""
+
+import asyncio
+import json
+import time
+
+import httpx
+
+from app.services.summarizers import llm_backend, llm_scheduler as scheduler_module
+from app.services.summarizers.llm_backend import LLMBackend, LLMRetryableError, OpenAIBackend, parse_retry_after
+from app.services.summarizers.llm_scheduler import INTERACTIVE, LLMScheduler, ScheduledBackend, llm_priority
+
+
+class FlakyBackend(LLMBackend):
+    """Fails with the given errors first, then echoes the prompt."""
+
+    def __init__(self, errors=()):
+        super().__init__("sk-test", "http://llm.test", "stub")
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return messages[-1]["content"]
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        yield await self.complete(messages, max_tokens, temperature)
+
+
+def _messages(text):
+    return [{"role": "user", "content": text}]
+
+
+def test_interactive_lane_is_served_before_queued_batch_requests(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "WINDOW_SECONDS", 0.1)
+    scheduler = LLMScheduler(requests_per_minute=1, tokens_per_minute=0)
+    backend = ScheduledBackend(FlakyBackend(), scheduler)
+    order = []
+
+    async def request(name, interactive=False):
+        if interactive:
+            llm_priority.set(INTERACTIVE)
+        order.append(await backend.complete(_messages(name)))
+
+    async def main():
+        await request("first")
+        batch = [asyncio.create_task(request(f"batch {i}")) for i in range(2)]
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(request("interactive", interactive=True))
+        await asyncio.sleep(0.01)
+        depth = scheduler.stats()["queue_depth"]
+        started = time.perf_counter()
+        await asyncio.gather(*batch, interactive)
+        return depth, time.perf_counter() - started
+
+    depth, elapsed = asyncio.run(main())
+    assert order == ["first", "interactive", "batch 0", "batch 1"]
+    assert depth == {"interactive": 1, "batch": 2}
+    assert elapsed >= 0.2  # one request per window
+    stats = scheduler.stats()
+    assert stats["requests"] == 4 and stats["wait"]["batch"]["samples"] == 3
+
+
+def test_token_limit_spaces_requests(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "WINDOW_SECONDS", 0.1)
+    scheduler = LLMScheduler(requests_per_minute=0, tokens_per_minute=150)
+    backend = ScheduledBackend(FlakyBackend(), scheduler)
+
+    async def main():
+        started = time.perf_counter()
+        await asyncio.gather(*[backend.complete(_messages("x"), max_tokens=100) for _ in range(3)])
+        return time.perf_counter() - started
+
+    assert asyncio.run(main()) >= 0.2
+
+
+def test_retries_honour_retry_after_and_give_up_after_max_retries():
+    scheduler = LLMScheduler(requests_per_minute=0, tokens_per_minute=0, max_retries=2, backoff_base=0.01)
+    flaky = FlakyBackend([LLMRetryableError("429", retry_after=0.15, rate_limited=True), LLMRetryableError("502")])
+    backend = ScheduledBackend(flaky, scheduler)
+
+    async def main():
+        started = time.perf_counter()
+        result = await backend.complete(_messages("ok"))
+        elapsed = time.perf_counter() - started
+        flaky.errors = [LLMRetryableError("503")] * 3
+        try:
+            await backend.complete(_messages("never"))
+        except LLMRetryableError:
+            return result, elapsed
+        raise AssertionError("expected the error to surface")
+
+    result, elapsed = asyncio.run(main())
+    assert result == "ok" and elapsed >= 0.15 and flaky.calls == 6
+    stats = scheduler.stats()
+    assert (stats["retries"], stats["rate_limited"], stats["failed"]) == (4, 1, 1)
+
+
+def test_openai_rate_limit_is_retried_after_retry_after(monkeypatch):
+    responses = [
+        httpx.Response(429, headers={"retry-after-ms": "50"}, json={"error": {"message": "slow down"}}),
+        None,
+    ]
+
+    async def handler(request):
+        response = responses.pop(0)
+        if response is not None:
+            return response
+        body = json.loads(request.content)
+        return httpx.Response(200, json={
+            "id": "1", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "Summary"}}],
+        })
+
+    scheduler = LLMScheduler(requests_per_minute=0, tokens_per_minute=0, backoff_base=0.01)
+    backend = ScheduledBackend(OpenAIBackend("sk-test", "http://llm.test/v1", "stub-model"), scheduler)
+
+    async def main():
+        monkeypatch.setattr(llm_backend, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(llm_backend, "_http_client_loop", asyncio.get_running_loop())
+        result = await backend.complete(_messages("hi"))
+        await llm_backend.close_http_client()
+        return result
+
+    assert asyncio.run(main()) == "Summary"
+    assert scheduler.stats()["rate_limited"] == 1
+    assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert parse_retry_after({"retry-after": "2"}) == 2.0
@@ -0,0 +1,80 @@
+"""Tests for background database maintenance."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.config.settings import settings
+from app.core.database.database import engine
+from app.core.database.maintenance import (
+    BudgetExceeded, MaintenanceScheduler, _Deadline, _run_bounded, window_start
+)
+
+
+def test_window_start_handles_midnight_wrap():
+    assert window_start(datetime(2024, 1, 2, 3, 0), "02:00-05:00") == datetime(2024, 1, 2, 2, 0)
+    assert window_start(datetime(2024, 1, 2, 6, 0), "02:00-05:00") is None
+    assert window_start(datetime(2024, 1, 2, 1, 0), "23:00-02:00") == datetime(2024, 1, 1, 23, 0)
+
+
+def test_postgres_statement_timeout_is_reset_on_pooled_connection():
+    class RecordingConnection:
+        dialect = SimpleNamespace(name="postgresql")
+
+        def __init__(self):
+            self.statements = []
+
+        def execute(self, clause):
+            self.statements.append(clause.text)
+            if clause.text.startswith("VACUUM"):
+                raise OperationalError(clause.text, {}, Exception("canceling statement due to statement timeout"))
+
+    conn = RecordingConnection()
+    with pytest.raises(BudgetExceeded):
+        _run_bounded(conn, "VACUUM", _Deadline(10))
+    assert conn.statements[0].startswith("SET statement_timeout")
+    assert conn.statements[-1] == "RESET statement_timeout"
+
+
+def test_window_jobs_run_once_per_window(db, monkeypatch):
+    monkeypatch.setattr(settings, "db_maintenance_window", "02:00-05:00")
+    monkeypatch.setattr(settings, "db_vacuum_min_free_ratio", 0.0)
+    scheduler = MaintenanceScheduler(engine)
+
+    first = scheduler.run_due(datetime(2024, 1, 2, 2, 30))
+    assert {r["job"] for r in first} == {"wal_checkpoint", "analyze", "vacuum"}
+    assert all(r["status"] in ("ok", "partial") for r in first)
+
+    for job in scheduler.jobs.values():
+        job.last_run = datetime(2024, 1, 2, 2, 30)
+    assert scheduler.run_due(datetime(2024, 1, 2, 3, 0)) == []
+    assert [r["job"] for r in scheduler.run_due(datetime(2024, 1, 2, 4, 0))] == ["wal_checkpoint"]
+
+
+def test_vacuum_reports_reclaimed_space_and_budget(db, client, monkeypatch):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS maintenance_filler (data TEXT)"))
+        conn.execute(text(
+            "INSERT INTO maintenance_filler SELECT hex(randomblob(1000)) "
+            "FROM (WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 500) SELECT i FROM n)"
+        ))
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE maintenance_filler"))
+
+    response = client.post("/api/admin/maintenance/vacuum/run")
+    assert response.status_code == 200
+    result = response.json()
+    assert result["status"] == "ok"
+    assert result["reclaimed_bytes"] > 0
+
+    monkeypatch.setattr(settings, "db_analyze_budget_seconds", 0.0)
+    interrupted = MaintenanceScheduler(engine).run_job("analyze")
+    assert interrupted["status"] == "interrupted"
+
+    status = client.get("/api/admin/maintenance").json()
+    assert status["jobs"]["vacuum"]["last_result"]["reclaimed_bytes"] == result["reclaimed_bytes"]
+    assert status["bloat"]["database_bytes"] > 0
+    assert client.post("/api/admin/maintenance/reindex/run").status_code == 404
@@ -0,0 +1,89 @@
+"""Tests for map-reduce summarization of large windows."""
+
+import asyncio
+from datetime import datetime
+
+from app.core.config.settings import settings
+from app.services.summarizers.llm_backend import LLMBackend
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+from app.services.summarizers.map_reduce import chunk_lines, group_activity_data
+from app.services.summarizers.prompt_packer import MIN_CONTENT_CHARS
+
+
+class RecordingBackend(LLMBackend):
+    """Records prompts and the peak number of calls in flight."""
+
+    def __init__(self):
+        super().__init__("sk-test", "http://llm.test", "stub")
+        self.prompts = []
+        self.in_flight = self.peak = 0
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        self.prompts.append((messages[-1]["content"], max_tokens))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return f"note {len(self.prompts)}"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        yield await self.complete(messages, max_tokens, temperature)
+
+
+def _activity_data(members, activities):
+    return [
+        {
+            "member_name": f"Member {m}",
+            "member_position": "Engineer",
+            "activities": [
+                {"platform": "github" if a % 2 else "linkedin", "type": "push",
+                 "title": f"Change {a}", "content": "x" * 400, "published_at": None}
+                for a in range(activities)
+            ],
+        }
+        for m in range(members)
+    ]
+
+
+def test_grouping_and_chunking():
+    data = _activity_data(2, 4)
+    by_member = group_activity_data(data, "member", 10000)
+    assert [label for label, _ in by_member] == ["Member 0 (Engineer)", "Member 1 (Engineer)"]
+    assert "x" * 400 in by_member[0][1][0]  # fits the budget: content kept whole
+    by_platform = dict(group_activity_data(data, "platform", 10000))
+    assert set(by_platform) == {"github activity", "linkedin activity"}
+    assert by_platform["github activity"][0].startswith("- Member 0 / GITHUB")
+
+    # Over budget: excerpts shrink to the packer's minimum, then the group is chunked
+    tight = dict(group_activity_data(data, "member", 100))["Member 0 (Engineer)"]
+    assert tight[0].endswith(f"Content: {'x' * MIN_CONTENT_CHARS}...")
+
+    lines = ["a" * 40] * 10  # 11 tokens each, newline included
+    assert [len(chunk) for chunk in chunk_lines(lines, 30)] == [2, 2, 2, 2, 2]
+    assert chunk_lines(["a" * 400], 30) == [["a" * 400]]
+
+
+def test_map_stage_is_bounded_and_feeds_reduce(monkeypatch):
+    monkeypatch.setattr(settings, "summary_map_reduce", "always")
+    monkeypatch.setattr(settings, "summary_map_concurrency", 3)
+    monkeypatch.setattr(settings, "summary_map_output_token_budget", 123)
+    monkeypatch.setattr(settings, "summary_language_strategy", "parallel")
+    backend = RecordingBackend()
+    summarizer = LLMSummarizer(db=None, llm=backend)
+    day = datetime(2026, 1, 1)
+    data = _activity_data(8, 3)
+
+    notes = asyncio.run(summarizer._map_activity_data(data, "weekly", day, day))
+    assert len(notes) == 8 and notes[0].startswith("### Member 0 (Engineer)\n")
+    assert backend.peak == 3
+    assert all(max_tokens == 123 for _, max_tokens in backend.prompts)
+
+    # Notes over the reduce budget are condensed in a further round
+    monkeypatch.setattr(settings, "summary_reduce_input_token_budget", 20)
+    backend.prompts.clear()
+    notes = asyncio.run(summarizer._map_activity_data(data, "weekly", day, day))
+    assert len(backend.prompts) > 8 and len(notes) < 8
+    assert "partial notes" in backend.prompts[-1][0]
+
+    prompt = summarizer._language_messages(data, "weekly", day, day, "english", data_text="\n\n".join(notes))[1]["content"]
+    assert "Change 0" not in prompt and notes[0] in prompt
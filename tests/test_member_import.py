@@ -0,0 +1,64 @@
+"""Tests for the bulk member import endpoint."""
+
+import json
+
+from app.models.member import Member, SocialProfile
+
+
+def _events(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_csv_import_upserts_members_and_profiles(db, client):
+    existing = Member(name="Old Name", email="alice@example.com", department="R&D")
+    db.add(existing)
+    db.flush()
+    db.add(SocialProfile(member_id=existing.id, platform="GitHub", profile_url="https://github.com/old"))
+    db.commit()
+
+    body = (
+        "name,email,position,department,platform,profile_url,username\n"
+        "Alice,alice@example.com,Engineer,,github,https://github.com/alice,alice\n"
+        "Alice,alice@example.com,,,linkedin,https://linkedin.com/in/alice,\n"
+        "Bob,bob@example.com,,,,,\n"
+        "No Email,,,,,,\n"
+        "Carol,carol@example.com,,,github,,\n"
+    )
+    response = client.post(
+        "/api/v1/members/import?batch_size=2", content=body, headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200
+    events = _events(response)
+
+    errors = {event["row"]: event["errors"] for event in events if event["type"] == "error"}
+    assert set(errors) == {5, 6}
+    assert any("platform and profile_url" in message for message in errors[6])
+    assert events[-1] == {
+        "type": "summary", "rows": 5, "rows_failed": 2,
+        "members_created": 1, "members_updated": 1,
+        "profiles_created": 1, "profiles_updated": 1,
+    }
+
+    db.expire_all()
+    alice = db.query(Member).filter(Member.email == "alice@example.com").one()
+    assert (alice.name, alice.position, alice.department) == ("Alice", "Engineer", "R&D")
+    profiles = {p.platform: p.profile_url for p in alice.social_profiles}
+    assert profiles == {"GitHub": "https://github.com/alice", "linkedin": "https://linkedin.com/in/alice"}
+    assert db.query(Member).count() == 2
+
+
+def test_ndjson_import_with_nested_profiles(db, client):
+    lines = [
+        {"name": "Dave", "email": "dave@example.com", "social_profiles": [
+            {"platform": "github", "profile_url": "https://github.com/dave"},
+            {"platform": "twitter", "profile_url": "https://twitter.com/dave"},
+        ]},
+        "not json",
+    ]
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines)
+    response = client.post("/api/v1/members/import?format=ndjson", content=body)
+    events = _events(response)
+
+    assert [e["row"] for e in events if e["type"] == "error"] == [2]
+    assert events[-1]["profiles_created"] == 2
+    assert client.post("/api/v1/members/import", content=body).status_code == 400
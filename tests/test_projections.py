@@ -0,0 +1,85 @@
+"""Tests for the read-only activity projections."""
+
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta
+
+from app.core.database.database import AsyncSessionLocal, async_engine
+from app.core.database.projections import (
+    ActivityRecord, activity_records_statement, iter_activity_records
+)
+from app.models.member import Member, SocialProfile, Activity
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+
+
+def _seed(db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    now = datetime.utcnow()
+    for i, days_ago in enumerate([1, 3, 30]):
+        db.add(Activity(
+            member_id=member.id,
+            social_profile_id=profile.id,
+            platform="github",
+            activity_type="push",
+            title=f"Push {i}",
+            content=f"commit {i}",
+            external_id=f"projection_{i}",
+            published_at=now - timedelta(days=days_ago)
+        ))
+    db.commit()
+    return member
+
+
+def test_records_stream_with_member_name(db):
+    member = _seed(db)
+    stmt = activity_records_statement(
+        Activity.member_id == member.id, order_by=Activity.id, with_member_name=True
+    )
+    records = list(iter_activity_records(db, stmt, batch_size=2))
+
+    assert [r.title for r in records] == ["Push 0", "Push 1", "Push 2"]
+    assert all(isinstance(r, ActivityRecord) and r.member_name == "Alice" for r in records)
+    assert not hasattr(records[0], "__dict__")
+
+
+def test_member_summary_filters_by_published_at_in_sql(db):
+    member = _seed(db)
+    captured = {}
+
+    async def fake_content(member, activities, start_date, end_date):
+        captured["titles"] = [a.title for a in activities]
+        return None
+
+    async def main():
+        async with AsyncSessionLocal() as session:
+            summarizer = LLMSummarizer(session)
+            summarizer.can_summarize = lambda: True
+            summarizer._generate_member_summary_content = fake_content
+            await summarizer.generate_member_summary(member.id, days=7)
+        await async_engine.dispose()
+
+    asyncio.run(main())
+    assert captured["titles"] == ["Push 0", "Push 1"]
+
+
+def test_activity_and_stats_exports(db, client):
+    _seed(db)
+
+    response = client.get("/api/v1/export/activities/csv")
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert len(rows) == 4 and {row[1] for row in rows[1:]} == {"Alice"}
+
+    response = client.get("/api/v1/export/stats/csv")
+    assert response.status_code == 200
+    assert ["total_activities", "3"] in list(csv.reader(io.StringIO(response.text)))
+
+    response = client.get("/api/v1/export/dashboard/stats")
+    assert response.status_code == 200
+    assert response.json()["total_members"] == 1
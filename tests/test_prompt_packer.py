@@ -0,0 +1,48 @@
+"""Tests for the token-budget prompt packer."""
+
+from app.core.config.settings import settings
+from app.services.summarizers.prompt_packer import (
+    MAX_CONTENT_CHARS, MIN_CONTENT_CHARS, pack_activities, prompt_token_budget, truncate_content
+)
+from app.services.summarizers.tokens import estimate_tokens
+
+
+def _render(activity, content_chars):
+    return f"- {activity['type']}: {activity['title']}\n  {truncate_content(activity['content'], content_chars)}\n"
+
+
+def _activity(title, activity_type="push", day=1, content="x" * 2000):
+    return {"platform": "github", "type": activity_type, "title": title,
+            "content": content, "published_at": f"2026-01-{day:02d}T12:00:00"}
+
+
+def test_small_data_is_kept_whole_and_deduplicated():
+    activities = [_activity("A", content="short"), _activity("A", content="short"), _activity("B", content="short")]
+    text, report = pack_activities([("Alice:\n", activities)], _render, 1000)
+
+    assert text == "Alice:\n- push: A\n  short\n- push: B\n  short\n"
+    assert (report.included, report.duplicates, report.dropped, report.content_chars) == (2, 1, 0, MAX_CONTENT_CHARS)
+
+
+def test_content_shrinks_before_low_priority_activities_drop():
+    activities = [_activity(f"push {i}", day=1 + i) for i in range(10)]
+    _, report = pack_activities([("", activities)], _render, 1500)
+    assert report.dropped == 0 and MIN_CONTENT_CHARS < report.content_chars < MAX_CONTENT_CHARS
+
+    groups = [
+        ("Alice:\n", [_activity("old push", day=7), _activity("old pr", "pull_request", day=7)]),
+        ("Bob:\n", [_activity("new push", day=9), _activity("new pr", "pull_request", day=9)]),
+    ]
+    text, report = pack_activities(groups, _render, 90)
+    assert report.content_chars == MIN_CONTENT_CHARS and report.dropped == 2
+    assert report.tokens == estimate_tokens(text) <= 90
+    # Old pushes go first, pull requests outrank new pushes
+    assert "old push" not in text and "new push" not in text and "old pr" in text
+    assert "2 lower-priority activities omitted" in text
+
+
+def test_budget_per_model(monkeypatch):
+    monkeypatch.setattr(settings, "summary_prompt_token_budget", 1000)
+    monkeypatch.setattr(settings, "summary_prompt_token_budgets", {"big-model": 50000})
+    assert prompt_token_budget("big-model") == 50000
+    assert prompt_token_budget("other") == 1000
@@ -0,0 +1,38 @@
+"""Tests for the prompt template registry."""
+
+from datetime import datetime
+
+from app.services.summarizers.llm_summarizer import LANGUAGES, LLMSummarizer
+from app.services.summarizers.prompt_templates import PromptRegistry, TEMPLATE_DIR, prompt_registry
+
+
+def _data(title):
+    return [{"member_name": "Alice", "member_position": "Engineer", "activities": [
+        {"platform": "github", "type": "push", "title": title, "content": "", "url": None, "published_at": None}
+    ]}]
+
+
+def test_variable_data_comes_after_a_shared_static_prefix():
+    summarizer = LLMSummarizer(db=None, llm=None)
+    for language in LANGUAGES:
+        first = summarizer._language_messages(_data("first"), "daily", datetime(2026, 1, 1), datetime(2026, 1, 1), language)
+        second = summarizer._language_messages(_data("second"), "weekly", datetime(2026, 2, 1), datetime(2026, 2, 7), language)
+        assert first[0] == second[0]
+        user_first, user_second = first[1]["content"], second[1]["content"]
+        shared = next(i for i, (a, b) in enumerate(zip(user_first, user_second)) if a != b)
+        assert shared > len(user_first) * 0.7
+        assert user_first.endswith("- GITHUB: push - first")
+        assert "\n\n" in user_first and "{%" not in user_first
+
+
+def test_version_tracks_template_sources(tmp_path):
+    for path in TEMPLATE_DIR.glob("*.j2"):
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+    assert PromptRegistry(tmp_path).version == prompt_registry.version
+
+    (tmp_path / "map_notes.en.j2").write_text("{% block system %}s{% endblock %}{% block user %}{{ data }}{% endblock %}")
+    changed = PromptRegistry(tmp_path)
+    assert changed.version != prompt_registry.version
+    assert changed.messages("map_notes", "chinese", data="x") == [
+        {"role": "system", "content": "s"}, {"role": "user", "content": "x"}
+    ]
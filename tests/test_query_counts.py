@@ -0,0 +1,109 @@
+"""Query-count regression tests for hot paths that used to issue N+1 queries.
+
+Each test runs the same path over a small and a larger data set and
+checks that the number of SQL statements does not grow with row count.
+"""
+
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.api.v1.export import export_members_csv, export_members_json, export_activities_csv
+from app.core.database.database import AsyncSessionLocal, async_engine
+from app.models.member import Member, SocialProfile, Activity
+from app.services.summarizers.llm_summarizer import LLMSummarizer, prepare_activity_data_for_llm
+
+
+def _seed(db, members: int, activities_per_member: int = 2):
+    offset = db.query(Member).count()
+    for i in range(offset, offset + members):
+        member = Member(name=f"Member {i}", email=f"member{i}@example.com")
+        db.add(member)
+        db.flush()
+        profile = SocialProfile(
+            member_id=member.id,
+            platform="github",
+            profile_url=f"https://github.com/member{i}",
+            username=f"member{i}"
+        )
+        db.add(profile)
+        db.flush()
+        for j in range(activities_per_member):
+            db.add(Activity(
+                member_id=member.id,
+                social_profile_id=profile.id,
+                platform="github",
+                activity_type="push",
+                title=f"Push {i}-{j}",
+                content="commit",
+                external_id=f"github_count_{i}_{j}",
+                published_at=datetime.utcnow()
+            ))
+    db.commit()
+    db.expire_all()
+
+
+def _run_async(fn):
+    """Run ``fn(session)`` on an ``AsyncSession`` in a fresh event loop."""
+    async def main():
+        async with AsyncSessionLocal() as session:
+            await fn(session)
+        await async_engine.dispose()
+
+    asyncio.run(main())
+
+
+def _count(query_counter, db, fn):
+    db.expire_all()
+    query_counter.reset()
+    fn()
+    return query_counter.count
+
+
+def _assert_constant(query_counter, db, fn):
+    _seed(db, members=2)
+    small = _count(query_counter, db, fn)
+    _seed(db, members=8)
+    large = _count(query_counter, db, fn)
+    assert large == small, f"query count grew from {small} to {large}"
+
+
+def test_export_members_csv_query_count(db, query_counter):
+    _assert_constant(query_counter, db, lambda: export_members_csv(False, db))
+
+
+def test_export_members_json_query_count(db, query_counter):
+    _assert_constant(query_counter, db, lambda: export_members_json(False, db))
+
+
+def test_export_activities_csv_query_count(db, query_counter):
+    _assert_constant(
+        query_counter, db,
+        lambda: export_activities_csv(None, None, None, None, db)
+    )
+
+
+def test_prepare_activity_data_for_llm_query_count(db, query_counter):
+    async def run(session):
+        activities = (await session.scalars(select(Activity))).all()
+        data = await prepare_activity_data_for_llm(activities, session)
+        assert len(data) == len({activity.member_id for activity in activities})
+
+    _assert_constant(query_counter, db, lambda: _run_async(run))
+
+
+def test_generate_summary_content_query_count(db, query_counter):
+    async def fake_language_content(*args, **kwargs):
+        return "summary"
+
+    async def run(session):
+        summarizer = LLMSummarizer(session)
+        summarizer._generate_language_content = fake_language_content
+        activities = (await session.scalars(select(Activity))).all()
+        content = await summarizer._generate_summary_content(
+            activities, "daily", datetime.utcnow(), datetime.utcnow()
+        )
+        assert content == {"chinese": "summary", "english": "summary"}
+
+    _assert_constant(query_counter, db, lambda: _run_async(run))
@@ -0,0 +1,74 @@
+"""Tests for read-replica routing of read-only endpoints."""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config.settings import settings
+from app.core.database import database
+from app.core.database.database import Base, READ_PIN_COOKIE
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """A separate, empty SQLite database standing in for a replica."""
+    replica_engine = create_engine(f"sqlite:///{tmp_path}/replica.db")
+    Base.metadata.create_all(bind=replica_engine)
+
+    health = database.ReplicaHealth(check_interval=60)
+    monkeypatch.setattr(database, "replica_engine", replica_engine)
+    monkeypatch.setattr(database, "ReplicaSessionLocal", sessionmaker(bind=replica_engine))
+    monkeypatch.setattr(database, "replica_health", health)
+    monkeypatch.setattr(settings, "database_replica_url", f"sqlite:///{tmp_path}/replica.db")
+    yield health
+    replica_engine.dispose()
+
+
+def test_reads_go_to_replica_and_writes_pin_to_primary(client, replica):
+    response = client.post("/api/v1/members/", json={"name": "Alice", "email": "alice@example.com"})
+    assert response.status_code == 201
+    assert READ_PIN_COOKIE in response.cookies
+
+    # The writing client reads its own write from the primary
+    assert len(client.get("/api/v1/members/").json()) == 1
+
+    # Another client without the pin reads from the (empty) replica
+    client.cookies.clear()
+    assert client.get("/api/v1/members/").json() == []
+
+
+def test_unhealthy_replica_falls_back_to_primary(client, replica):
+    client.post("/api/v1/members/", json={"name": "Bob", "email": "bob@example.com"})
+    client.cookies.clear()
+
+    replica.mark_unhealthy()
+    assert len(client.get("/api/v1/members/").json()) == 1
+
+
+def test_async_health_probe_does_not_block_the_event_loop(replica, monkeypatch):
+    def slow_probe():
+        time.sleep(0.2)
+        return False
+
+    monkeypatch.setattr(replica, "is_healthy", slow_probe)
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        healthy = await replica.is_healthy_async()
+        ticker.cancel()
+        return healthy, ticks
+
+    healthy, ticks = asyncio.run(main())
+    assert healthy is False
+    assert ticks >= 5
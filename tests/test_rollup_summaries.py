@@ -0,0 +1,133 @@
+"""Tests for hierarchical weekly/monthly/quarterly summaries."""
+
+import asyncio
+import json
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+
+from app.api.v1 import monitoring
+from app.core.database.database import AsyncSessionLocal, async_engine
+from app.models.member import Member, SocialProfile, Activity, Summary
+from app.services.summarizers import llm_summarizer
+from app.services.summarizers.llm_backend import LLMBackend
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+from app.services.summarizers.rollup import allocate_budget, cover_days, period_bounds
+
+
+class RecordingBackend(LLMBackend):
+    def __init__(self):
+        super().__init__("sk-test", "http://llm.test", "stub-model")
+        self.prompts = []
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        self.prompts.append(messages[-1]["content"])
+        return "rollup"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        self.prompts.append(messages[-1]["content"])
+        yield "rollup"
+
+
+def _stored(summary_type, start, end, created=0):
+    return SimpleNamespace(
+        summary_type=summary_type, created_at=created,
+        start_date=datetime.combine(start, time.min), end_date=datetime.combine(end, time.max)
+    )
+
+
+def test_periods_cover_and_budget():
+    assert period_bounds("monthly", date(2026, 12, 15)) == (date(2026, 12, 1), date(2026, 12, 31))
+    assert period_bounds("quarterly", date(2026, 11, 2)) == (date(2026, 10, 1), date(2026, 12, 31))
+    assert period_bounds("weekly", date(2026, 1, 7)) == (date(2026, 1, 7), date(2026, 1, 13))
+
+    week = _stored("weekly", date(2026, 1, 5), date(2026, 1, 11))
+    newer, older = _stored("daily", date(2026, 1, 2), date(2026, 1, 2)), _stored("daily", date(2026, 1, 2), date(2026, 1, 2))
+    inside_week = _stored("daily", date(2026, 1, 6), date(2026, 1, 6))
+    chosen, gaps = cover_days([newer, older, inside_week, week], date(2026, 1, 1), date(2026, 1, 14), ("weekly", "daily"))
+    assert chosen == [newer, week]
+    assert gaps == [(date(2026, 1, 1), date(2026, 1, 1)), (date(2026, 1, 3), date(2026, 1, 4)),
+                    (date(2026, 1, 12), date(2026, 1, 14))]
+
+    assert allocate_budget([10, 500, 1000], 610) == [10, 300, 300]
+
+
+def _week_with_five_daily_summaries(db):
+    member = Member(name="Alice", email="alice@example.com", position="Engineer")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.flush()
+    monday = date(2026, 1, 5)
+    for i in range(7):
+        day = monday + timedelta(days=i)
+        db.add(Activity(member_id=member.id, social_profile_id=profile.id, platform="github",
+                        activity_type="push", title=f"work on day {i}", external_id=f"rollup_{i}",
+                        created_at=datetime.combine(day, time(12))))
+        if i < 5:
+            db.add(Summary(title=f"Daily {i}", content=f"每日总结 {i}", content_en=f"daily summary {i}",
+                           summary_type="daily", start_date=datetime.combine(day, time.min),
+                           end_date=datetime.combine(day, time.max)))
+    db.commit()
+    return monday
+
+
+def _assert_rollup_prompts(prompts):
+    chinese, english = sorted(prompts, key=lambda prompt: "daily summary" in prompt)
+    assert "daily summary 4" in english and "每日总结 4" in chinese
+    for prompt in prompts:
+        assert "work on day 5" in prompt and "work on day 6" in prompt
+        assert "work on day 0" not in prompt
+
+
+def test_weekly_summary_reads_daily_summaries_and_only_uncovered_activities(db):
+    monday = _week_with_five_daily_summaries(db)
+    backend = RecordingBackend()
+
+    async def main():
+        try:
+            async with AsyncSessionLocal() as session:
+                summary = await LLMSummarizer(session, llm=backend).generate_weekly_summary(monday)
+                return summary.summary_type, summary.activity_count, summary.member_count
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(main()) == ("weekly", 7, 1)
+    _assert_rollup_prompts(backend.prompts)
+
+
+class ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+def test_weekly_stream_builds_on_daily_summaries_through_the_cache(db, monkeypatch):
+    monday = _week_with_five_daily_summaries(db)
+    backend = RecordingBackend()
+    monkeypatch.setattr(llm_summarizer, "get_llm_backend", lambda: backend)
+    monkeypatch.setattr(monitoring, "get_llm_backend", lambda: backend)
+
+    async def stream():
+        response = await monitoring.generate_weekly_summary_stream(ConnectedRequest(), start_date=monday.isoformat())
+        events = [json.loads(event[len("data: "):]) async for event in response.body_iterator]
+        return events[-1]
+
+    async def main():
+        try:
+            first = await stream()
+            streamed_prompts = list(backend.prompts)
+            second = await stream()
+            async with AsyncSessionLocal() as session:
+                await LLMSummarizer(session, llm=backend).generate_weekly_summary(monday)
+            return first, second, streamed_prompts
+        finally:
+            await async_engine.dispose()
+
+    first, second, streamed_prompts = asyncio.run(main())
+    assert first["type"] == "complete", first
+    assert (first["summary"]["content"], first["summary"]["content_en"]) == ("rollup", "rollup")
+    assert (first["summary"]["activity_count"], first["summary"]["member_count"]) == (7, 1)
+    _assert_rollup_prompts(streamed_prompts)
+    # The second stream and the non-streaming rollup reuse the cached text
+    assert second["type"] == "complete" and second["summary"]["content"] == "rollup"
+    assert backend.prompts == streamed_prompts
@@ -0,0 +1,148 @@
+"""Tests for the scheduled monitoring and summary jobs."""
+
+import asyncio
+from datetime import datetime
+
+import schedule
+
+from app import main
+from app.core.database.database import async_engine
+from app.models.member import Member, SocialProfile, Activity, Summary, SummaryCacheEntry
+from app.services.monitors.monitor_manager import MonitorManager
+from app.services.summarizers import llm_summarizer
+from app.services.summarizers.llm_backend import LLMBackend
+
+
+class StubBackend(LLMBackend):
+    def __init__(self):
+        super().__init__("sk-test", "http://llm.test", "stub")
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        return "summary"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        yield "summary"
+
+
+def _seed_profile(db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    profile = SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice")
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+def _seed_cache_entry(db, day):
+    db.add(SummaryCacheEntry(
+        key=f"cached-{day}", language="chinese", summary_type="daily", content="stale",
+        start_date=datetime.combine(day, datetime.min.time()), end_date=datetime.combine(day, datetime.max.time())
+    ))
+    db.commit()
+
+
+def _fake_monitoring(db, profile, external_id):
+    """Stand-in for a monitor run: stores one new activity, as the monitors do."""
+    def store():
+        db.add(Activity(member_id=profile.member_id, social_profile_id=profile.id, platform="github",
+                        activity_type="push", title=external_id, external_id=external_id))
+        db.commit()
+    return store
+
+
+def test_monitoring_runs_drain_the_activity_pipeline(db, client, monkeypatch):
+    profile = _seed_profile(db)
+    _seed_cache_entry(db, datetime.utcnow().date())
+    store = _fake_monitoring(db, profile, "scheduled_1")
+
+    async def run_scheduled_monitoring(self):
+        store()
+        return {"status": "completed", "new_activities": 1}
+
+    monkeypatch.setattr(MonitorManager, "run_scheduled_monitoring", run_scheduled_monitoring)
+
+    assert client.post("/api/v1/monitoring/run-monitoring").status_code == 200
+    db.expire_all()
+    assert db.query(Activity).filter(Activity.is_processed == False).count() == 0
+    assert db.query(SummaryCacheEntry).count() == 0
+
+
+def test_scheduled_monitoring_task_drains_the_activity_pipeline(db, monkeypatch):
+    profile = _seed_profile(db)
+    _seed_cache_entry(db, datetime.utcnow().date())
+    store = _fake_monitoring(db, profile, "scheduled_2")
+
+    async def monitor_all_profiles(self):
+        store()
+        return {"github": []}
+
+    monkeypatch.setattr(MonitorManager, "monitor_all_profiles", monitor_all_profiles)
+
+    async def run():
+        try:
+            await main.run_monitoring_task()
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(run())
+    db.expire_all()
+    assert db.query(Activity).filter(Activity.is_processed == False).count() == 0
+    assert db.query(SummaryCacheEntry).count() == 0
+
+
+def test_period_summary_job_on_the_first_of_a_quarter(db, monkeypatch):
+    profile = _seed_profile(db)
+    db.add(Activity(member_id=profile.member_id, social_profile_id=profile.id, platform="github",
+                    activity_type="push", title="Push", external_id="period_1",
+                    created_at=datetime(2026, 3, 15, 12, 0), published_at=datetime(2026, 3, 15, 12, 0)))
+    db.commit()
+
+    class FirstOfApril(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime(2026, 4, 1, 6, 0)
+
+    monkeypatch.setattr(main, "datetime", FirstOfApril)
+    monkeypatch.setattr(llm_summarizer, "get_llm_backend", lambda: StubBackend())
+
+    async def run():
+        try:
+            await main.run_period_summary_task()
+        finally:
+            await async_engine.dispose()
+
+    asyncio.run(run())
+    summaries = {s.summary_type: s for s in db.query(Summary).all()}
+    assert set(summaries) == {"monthly", "quarterly"}
+    assert summaries["monthly"].start_date == datetime(2026, 3, 1)
+    assert summaries["quarterly"].start_date == datetime(2026, 1, 1)
+
+
+def test_scheduler_runs_due_jobs_on_the_event_loop(monkeypatch):
+    ran = []
+
+    def job(name):
+        async def run():
+            ran.append((name, asyncio.get_running_loop()))
+        return run
+
+    class AllDue(schedule.Scheduler):
+        def run_pending(self):
+            self.run_all()
+
+    monkeypatch.setattr(main.schedule, "Scheduler", AllDue)
+    for name in ("run_monitoring_task", "run_summary_task", "run_weekly_summary_task", "run_period_summary_task"):
+        monkeypatch.setattr(main, name, job(name))
+
+    async def run():
+        scheduler = asyncio.create_task(main.run_scheduled_tasks(poll_seconds=60))
+        await asyncio.sleep(0.05)
+        scheduler.cancel()
+        return asyncio.get_running_loop()
+
+    loop = asyncio.run(run())
+    assert sorted(name for name, _ in ran) == [
+        "run_monitoring_task", "run_period_summary_task", "run_summary_task", "run_weekly_summary_task"
+    ]
+    assert all(job_loop is loop for _, job_loop in ran)
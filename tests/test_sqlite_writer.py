@@ -0,0 +1,164 @@
+"""Tests for SQLite writer mode."""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database.database import Base
+from app.core.database.sqlite_writer import SQLiteWriteQueue, SharedWriterConnection, make_routing_session
+from app.models.member import Member
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f"sqlite:///{tmp_path}/writer.db"
+    write_engine = create_engine(url)
+    read_engine = create_engine(url)
+
+    @event.listens_for(read_engine, "connect")
+    def _read_only(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA query_only=ON")
+
+    Base.metadata.create_all(bind=write_engine)
+    yield write_engine, read_engine
+    write_engine.dispose()
+    read_engine.dispose()
+
+
+def test_routing_session_writes_on_writer_and_reads_on_reader(engines):
+    write_engine, read_engine = engines
+    Session = make_routing_session(write_engine, read_engine)
+
+    with Session() as db:
+        db.add(Member(name="Alice", email="alice@example.com"))
+        db.commit()
+        db.execute(text("UPDATE members SET position = 'Engineer'"))
+        db.commit()
+
+        assert db.get_bind() is read_engine
+        assert db.query(Member).one().position == "Engineer"
+
+
+def test_reads_after_a_write_stay_on_the_writer_until_the_transaction_ends(engines):
+    write_engine, read_engine = engines
+    Session = make_routing_session(write_engine, read_engine)
+
+    with Session() as db:
+        db.add(Member(name="Alice", email="alice@example.com"))
+        db.flush()
+        assert db.query(Member).count() == 1
+        assert db.get_bind() is write_engine
+
+        db.rollback()
+        assert db.get_bind() is read_engine
+        assert db.query(Member).count() == 0
+
+
+def test_async_routing_session_uses_the_async_writer(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path}/writer.db"
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{tmp_path}/writer.db"))
+
+    async def main():
+        write_engine = create_async_engine(url)
+        read_engine = create_async_engine(url)
+
+        @event.listens_for(read_engine.sync_engine, "connect")
+        def _read_only(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA query_only=ON")
+            cursor.close()
+
+        Session = async_sessionmaker(
+            sync_session_class=make_routing_session(write_engine.sync_engine, read_engine.sync_engine)
+        )
+        async with Session() as db:
+            db.add(Member(name="Alice", email="alice@example.com"))
+            await db.flush()
+            uncommitted = await db.scalar(select(func.count(Member.id)))
+            await db.commit()
+            assert db.get_bind() is read_engine.sync_engine
+            committed = await db.scalar(select(func.count(Member.id)))
+        await write_engine.dispose()
+        await read_engine.dispose()
+        return uncommitted, committed
+
+    assert asyncio.run(main()) == (1, 1)
+
+
+def test_write_queue_groups_jobs_into_one_transaction(engines):
+    write_engine, read_engine = engines
+    write_queue = SQLiteWriteQueue(write_engine, max_delay=0.05)
+    seen_by_readers = []
+
+    def insert(name):
+        def job(conn):
+            conn.execute(Member.__table__.insert(), {"name": name, "email": f"{name}@example.com"})
+            with read_engine.connect() as reader:
+                seen_by_readers.append(reader.scalar(select(func.count(Member.id))))
+            if name == "bob":
+                raise ValueError("rejected")
+        return job
+
+    futures = [write_queue.submit(insert(name)) for name in ("alice", "bob", "carol")]
+    write_queue.start()
+    try:
+        assert futures[0].result(5) is None and futures[2].result(5) is None
+        with pytest.raises(ValueError):
+            futures[1].result(5)
+    finally:
+        write_queue.stop()
+
+    # Nothing was visible until the shared transaction committed, without the failed job
+    assert seen_by_readers == [0, 0, 0]
+    assert write_queue.stats()["batches"] == 1
+    with read_engine.connect() as reader:
+        assert sorted(reader.scalars(select(Member.name))) == ["alice", "carol"]
+
+
+def test_sync_and_async_writers_share_one_connection(tmp_path):
+    path = f"{tmp_path}/writer.db"
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{path}"))
+    shared = SharedWriterConnection(path, timeout=5)
+    sync_engine = create_engine(f"sqlite:///{path}", creator=shared.connect, pool_size=1, max_overflow=0)
+    Session = sessionmaker(bind=sync_engine)
+
+    def sync_writes():
+        for i in range(20):
+            with Session() as db:
+                db.add(Member(name=f"sync {i}", email=f"sync{i}@example.com"))
+                db.commit()
+
+    async def main():
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}", async_creator=shared.connect_async, pool_size=1, max_overflow=0
+        )
+        shared.attach(sync_engine, async_engine.sync_engine)
+        # Any contention on the database lock would fail at once
+        with sync_engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA busy_timeout=0")
+        AsyncSession = async_sessionmaker(async_engine)
+
+        async def async_writes(worker):
+            for i in range(10):
+                async with AsyncSession() as db:
+                    db.add(Member(name=f"async {worker}.{i}", email=f"async{worker}.{i}@example.com"))
+                    await db.commit()
+
+        thread = threading.Thread(target=sync_writes)
+        thread.start()
+        await asyncio.gather(*[async_writes(worker) for worker in range(3)])
+        await asyncio.to_thread(thread.join)
+        async with async_engine.connect() as conn:
+            async_raw = (await conn.get_raw_connection()).driver_connection._conn
+        await async_engine.dispose()
+        return async_raw
+
+    async_raw = asyncio.run(main())
+    with sync_engine.connect() as conn:
+        assert conn.scalar(select(func.count(Member.id))) == 20 + 30
+        assert conn.connection.driver_connection._connection is async_raw._connection
+    sync_engine.dispose()
@@ -0,0 +1,89 @@
+"""Tests for backpressure and client disconnects in streaming summaries."""
+
+import asyncio
+
+from app.api.v1 import monitoring
+from app.core.config.settings import settings
+from app.core.database.database import async_engine
+
+
+class FakeRequest:
+    """Request whose client goes away once ``disconnected`` is set."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def _generation(state, chunks=20, delay=0.01):
+    async def make_events(session):
+        state["started"] = True
+        try:
+            for i in range(chunks):
+                state["produced"] = i + 1
+                await asyncio.sleep(delay)
+                yield f"data: {i}\n\n"
+            state["persisted"] = True
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+    return make_events
+
+
+def _read(response, request, disconnect_after):
+    async def main():
+        received = []
+        async for event in response.body_iterator:
+            received.append(event)
+            if len(received) == disconnect_after:
+                request.disconnected = True
+        await asyncio.sleep(0.3)
+        await async_engine.dispose()
+        return received
+
+    return asyncio.run(main())
+
+
+def test_disconnect_cancels_generation(monkeypatch):
+    monkeypatch.setattr(monitoring, "DISCONNECT_POLL_SECONDS", 0.01)
+    request, state = FakeRequest(), {}
+    response = monitoring.sse_response(request, _generation(state), "cancel")
+
+    received = _read(response, request, disconnect_after=3)
+    assert 3 <= len(received) < 20
+    assert state.get("cancelled") and not state.get("persisted")
+    assert state["produced"] < 20
+
+
+def test_disconnect_can_finish_in_background(monkeypatch):
+    monkeypatch.setattr(monitoring, "DISCONNECT_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "summary_stream_buffer_chunks", 1)
+    request, state = FakeRequest(), {}
+    response = monitoring.sse_response(request, _generation(state), "finish")
+
+    received = _read(response, request, disconnect_after=3)
+    assert len(received) < 20
+    assert state.get("persisted") and not state.get("cancelled")
+    assert not monitoring._background_streams
+
+
+def test_slow_client_pauses_generation(monkeypatch):
+    monkeypatch.setattr(settings, "summary_stream_buffer_chunks", 4)
+    request, state = FakeRequest(), {}
+    response = monitoring.sse_response(request, _generation(state, chunks=100, delay=0), "cancel")
+
+    async def main():
+        iterator = response.body_iterator
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        produced = state["produced"]
+        await iterator.aclose()
+        await asyncio.sleep(0)
+        await async_engine.dispose()
+        return produced
+
+    # One chunk delivered, a full buffer, and one waiting to be queued
+    assert asyncio.run(main()) <= 1 + 4 + 1
+    assert state.get("cancelled")
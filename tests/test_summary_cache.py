@@ -0,0 +1,104 @@
+"""Tests for the content-addressed summary cache."""
+
+import asyncio
+import json
+
+from app.api.v1 import monitoring
+from app.core.database.database import AsyncSessionLocal, async_engine
+from app.models.member import Member, SocialProfile, Activity, Summary, SummaryCacheEntry
+from app.services.processing.activity_queue import ActivityPipeline
+from app.services.summarizers import llm_summarizer
+from app.services.summarizers.llm_backend import LLMBackend
+from app.services.summarizers.llm_summarizer import LLMSummarizer
+from app.services.summarizers.summary_cache import invalidate_summary_cache
+
+
+class CountingBackend(LLMBackend):
+    def __init__(self):
+        super().__init__("sk-test", "http://llm.test", "stub-model")
+        self.calls = 0
+
+    async def complete(self, messages, max_tokens=2000, temperature=0.7, **options):
+        self.calls += 1
+        return f"summary {self.calls}"
+
+    async def stream(self, messages, max_tokens=2000, temperature=0.7):
+        self.calls += 1
+        yield f"streamed {self.calls}"
+
+
+def _add_activity(db, external_id):
+    profile = db.query(SocialProfile).first()
+    db.add(Activity(member_id=profile.member_id, social_profile_id=profile.id, platform="github",
+                    activity_type="push", title=external_id, external_id=external_id))
+    db.commit()
+
+
+def test_unchanged_activities_hit_the_cache_and_new_ones_invalidate(db):
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    db.add(SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice"))
+    db.commit()
+    _add_activity(db, "cache_1")
+    backend = CountingBackend()
+
+    async def generate():
+        async with AsyncSessionLocal() as session:
+            summary = await LLMSummarizer(session, llm=backend).generate_daily_summary()
+            return summary.id
+
+    async def ingest():
+        async with AsyncSessionLocal() as session:
+            pipeline = ActivityPipeline()
+            pipeline.register("summary_cache", invalidate_summary_cache)
+            await pipeline.run(session)
+
+    async def main():
+        try:
+            first = await generate()
+            second = await generate()
+            calls_before_ingest = backend.calls
+            _add_activity(db, "cache_2")
+            await ingest()
+            entries_after_ingest = db.query(SummaryCacheEntry).count()
+            third = await generate()
+            return first, second, calls_before_ingest, entries_after_ingest, third
+        finally:
+            await async_engine.dispose()
+
+    first, second, calls_before_ingest, entries_after_ingest, third = asyncio.run(main())
+    assert calls_before_ingest == 2
+    assert first == second
+    assert entries_after_ingest == 0
+    assert backend.calls == 4 and third != first
+    assert db.query(Summary).count() == 2
+
+
+def test_repeated_summary_stream_is_served_from_the_cache(db, client, monkeypatch):
+    backend = CountingBackend()
+    monkeypatch.setattr(llm_summarizer, "get_llm_backend", lambda: backend)
+    monkeypatch.setattr(monitoring, "get_llm_backend", lambda: backend)
+    member = Member(name="Alice", email="alice@example.com")
+    db.add(member)
+    db.flush()
+    db.add(SocialProfile(member_id=member.id, platform="github", profile_url="https://github.com/alice"))
+    db.commit()
+    _add_activity(db, "cache_stream_1")
+
+    def stream_contents():
+        response = client.post("/api/v1/monitoring/generate-daily-summary-stream")
+        events = [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1]["type"] == "complete"
+        return {
+            language: "".join(e["content"] for e in events if e.get("language") == language and "content" in e)
+            for language in ("chinese", "english")
+        }
+
+    first = stream_contents()
+    calls_after_first = backend.calls
+    second = stream_contents()
+
+    assert calls_after_first == 2
+    assert backend.calls == 2
+    assert second == first